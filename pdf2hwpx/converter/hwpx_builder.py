@@ -2,7 +2,7 @@
 
 import re
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from pdf2hwpx.ocr.base import OCRResult, PageResult, TextBlock, Table, TableCell
 from pdf2hwpx.hwpx_ir.models import (
@@ -65,9 +65,16 @@ class HwpxBuilder:
             ocr_result: OCR 결과
             output_path: 출력 HWPX 파일 경로
         """
-        hwpx_bytes = self.build_bytes(ocr_result)
-        with open(output_path, "wb") as f:
-            f.write(hwpx_bytes)
+        doc, binary_items = self._prepare(ocr_result)
+
+        # IR → HWPX 변환 (중간 바이트 버퍼 없이 파일로 바로 쓰기)
+        try:
+            with open(output_path, "wb") as f:
+                self.writer.write_to(doc, binary_items, f)
+        except BaseException:
+            # 쓰다 만 파일을 남기지 않음
+            Path(output_path).unlink(missing_ok=True)
+            raise
 
     def build_bytes(self, ocr_result: OCRResult) -> bytes:
         """
@@ -79,14 +86,19 @@ class HwpxBuilder:
         Returns:
             HWPX 파일 바이트
         """
-        # OCR 결과 → IR 변환
+        doc, binary_items = self._prepare(ocr_result)
+
+        # IR → HWPX 변환
+        return self.writer.write(doc, binary_items=binary_items)
+
+    def _prepare(self, ocr_result: OCRResult) -> Tuple[IrDocument, Dict[str, HwpxBinaryItem]]:
+        """OCR 결과 → (IR 문서, 바이너리 항목)"""
         doc = self._ocr_result_to_ir(ocr_result)
 
         # TODO: 이미지 처리
         binary_items: Dict[str, HwpxBinaryItem] = {}
 
-        # IR → HWPX 변환
-        return self.writer.write(doc, binary_items=binary_items)
+        return doc, binary_items
 
     def _ocr_result_to_ir(self, ocr_result: OCRResult) -> IrDocument:
         """OCR 결과를 IR 문서로 변환"""
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import os
 import base64
-import io
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
@@ -224,34 +223,34 @@ class PdfMetadataToHwpxConverter:
                 full_path = image_path
 
             try:
+                # The image payload is not read here: the writer streams it
+                # from full_path into the zip. Only the header is decoded below.
                 with open(full_path, "rb") as f:
-                    image_data = f.read()
-
-                # Generate a safe, unique ID for the binary item
-                # Format: imgX (e.g. img1) - matching mid.hwpx style
-                new_id = f"img{idx+1}"
-                
-                real_filename = Path(full_path).name
-                
-                # Check extension for zip filename
-                ext = os.path.splitext(real_filename)[1]
-                if not ext:
-                    ext = ".png"
-                safe_filename = f"{new_id}{ext}"
-                
-                binary_items[new_id] = HwpxBinaryItem(
-                    id=new_id,
-                    filename=safe_filename,
-                    data=image_data
-                )
-                filename_to_id[image_filename] = new_id
-                
-                # Calculate Original Size
-                with Image.open(io.BytesIO(image_data)) as img:
-                    # 1 pixel approx 75 HWPUnits
-                    org_w = int(img.width * 75)
-                    org_h = int(img.height * 75)
-                    id_to_org_size[new_id] = (org_w, org_h)
+                    # Generate a safe, unique ID for the binary item
+                    # Format: imgX (e.g. img1) - matching mid.hwpx style
+                    new_id = f"img{idx+1}"
+
+                    real_filename = Path(full_path).name
+
+                    # Check extension for zip filename
+                    ext = os.path.splitext(real_filename)[1]
+                    if not ext:
+                        ext = ".png"
+                    safe_filename = f"{new_id}{ext}"
+
+                    binary_items[new_id] = HwpxBinaryItem(
+                        id=new_id,
+                        filename=safe_filename,
+                        path=full_path
+                    )
+                    filename_to_id[image_filename] = new_id
+
+                    # Calculate Original Size
+                    with Image.open(f) as img:
+                        # 1 pixel approx 75 HWPUnits
+                        org_w = int(img.width * 75)
+                        org_h = int(img.height * 75)
+                        id_to_org_size[new_id] = (org_w, org_h)
 
             except Exception as e:
                 # Log but continue with other images
@@ -6,13 +6,6 @@ from typing import Optional, Literal
 from pathlib import Path
 
 from pdf2hwpx.ocr.base import OCRBackend
-from pdf2hwpx.ocr.cloud import CloudOCR
-from pdf2hwpx.ocr.openai import OpenAIOCR
-from pdf2hwpx.ocr.vllm import VllmOCR
-from pdf2hwpx.ocr.pymupdf import PyMuPDFBackend
-from pdf2hwpx.ocr.mineru import MinerUBackend
-from pdf2hwpx.ocr.openrouter import OpenRouterOCR
-from pdf2hwpx.ocr.gemini import GeminiOCR
 from pdf2hwpx.converter.hwpx_builder import HwpxBuilder
 
 
@@ -41,20 +34,30 @@ class Pdf2Hwpx:
         self._builder = HwpxBuilder()
 
     def _create_ocr_backend(self) -> OCRBackend:
-        """OCR 백엔드 인스턴스 생성"""
+        """OCR 백엔드 인스턴스 생성
+
+        백엔드 모듈은 여기서 import - 선택한 백엔드의 의존성(google-genai, PyMuPDF 등)만 로드
+        """
         if self.backend == "cloud":
+            from pdf2hwpx.ocr.cloud import CloudOCR
             return CloudOCR(api_key=self.api_key)
         elif self.backend == "openai":
+            from pdf2hwpx.ocr.openai import OpenAIOCR
             return OpenAIOCR(api_key=self.api_key)
         elif self.backend == "vllm":
+            from pdf2hwpx.ocr.vllm import VllmOCR
             return VllmOCR(base_url=self.base_url, api_key=self.api_key)
         elif self.backend == "pymupdf":
+            from pdf2hwpx.ocr.pymupdf import PyMuPDFBackend
             return PyMuPDFBackend()
         elif self.backend == "mineru":
+            from pdf2hwpx.ocr.mineru import MinerUBackend
             return MinerUBackend()
         elif self.backend == "openrouter":
+            from pdf2hwpx.ocr.openrouter import OpenRouterOCR
             return OpenRouterOCR(api_key=self.api_key, model=self.model)
         elif self.backend == "gemini":
+            from pdf2hwpx.ocr.gemini import GeminiOCR
             return GeminiOCR(api_key=self.api_key, model=self.model)
         else:
             raise ValueError(f"Unknown backend: {self.backend}")
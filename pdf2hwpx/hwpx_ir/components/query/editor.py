@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import copy
+import re
 from dataclasses import dataclass
 from typing import List, Optional, Tuple
 from lxml import etree
@@ -23,6 +24,19 @@ NSMAP = {
     "hh": "http://www.hancom.co.kr/hwpml/2011/head",
 }
 
+# 반복 사용하는 XPath (모듈 로드 시 한 번만 컴파일)
+_XPATH_TOP_PARAS = etree.XPath("./hp:p", namespaces=NS)
+_XPATH_ALL_PARAS = etree.XPath(".//hp:p", namespaces=NS)
+_XPATH_RUNS = etree.XPath("./hp:run", namespaces=NS)
+_XPATH_TEXTS = etree.XPath(".//hp:t", namespaces=NS)
+
+# 문자열 모드에서 단락 스타일 ID 추출용 정규식
+_PARA_PR_ID_RE = re.compile(r'paraPrIDRef="(\d+)"')
+_CHAR_PR_ID_RE = re.compile(r'charPrIDRef="(\d+)"')
+
+# 단락 끝 태그 (문자열 모드 삽입 위치 탐색용)
+_P_END_TAG = "</hp:p>"
+
 
 def qname(prefix: str, local: str) -> str:
     """QName 생성"""
@@ -40,15 +54,34 @@ class HwpxEditor:
         self._original_xml = section_xml
         self._xml_str = section_xml.decode("utf-8")  # 문자열 치환용
         self._use_raw_mode = True  # 안전 모드 (문자열 직접 치환)
-        self.root = etree.fromstring(section_xml)
+        self._root: Optional[etree._Element] = None  # 구조 편집 시 처음 접근할 때 파싱
         self._modified = False
+        self._serialized: Optional[bytes] = None  # 마지막 to_bytes() 결과 (수정 시 무효화)
+
+    @property
+    def root(self) -> etree._Element:
+        """section 루트 요소 (문자열 치환만 할 때는 XML을 파싱하지 않음)"""
+        if self._root is None:
+            self._root = etree.fromstring(self._original_xml)
+        return self._root
 
     def is_modified(self) -> bool:
         """수정 여부"""
         return self._modified
 
+    def _mark_modified(self):
+        """수정 표시 - 캐시된 직렬화 결과도 무효화"""
+        self._modified = True
+        self._serialized = None
+
     def to_bytes(self) -> bytes:
-        """수정된 XML을 바이트로 반환 (원본 형식 최대한 유지)"""
+        """수정된 XML을 바이트로 반환 (원본 형식 최대한 유지, 이후 수정이 없으면 결과 재사용)"""
+        if self._serialized is None:
+            self._serialized = self._serialize()
+        return self._serialized
+
+    def _serialize(self) -> bytes:
+        """현재 편집 모드에 맞춰 XML 직렬화"""
         if self._use_raw_mode:
             # 안전 모드: 문자열 직접 반환 (lxml 사용 안 함)
             return self._xml_str.encode("utf-8")
@@ -67,14 +100,15 @@ class HwpxEditor:
     def _switch_to_lxml_mode(self):
         """구조 변경 시 lxml 모드로 전환 (주의: 파일 손상 가능성 있음)"""
         self._use_raw_mode = False
+        self._serialized = None
 
     def _get_paragraphs(self) -> List[etree._Element]:
         """최상위 단락만 반환 (테이블 내 단락 제외)"""
-        return list(self.root.xpath("./hp:p", namespaces=NS))
+        return list(_XPATH_TOP_PARAS(self.root))
 
     def _get_all_paragraphs(self) -> List[etree._Element]:
         """모든 단락 반환 (중첩 포함)"""
-        return list(self.root.xpath(".//hp:p", namespaces=NS))
+        return list(_XPATH_ALL_PARAS(self.root))
 
     # ============================================================
     # 1. 단락 삽입
@@ -109,7 +143,7 @@ class HwpxEditor:
         new_p = self._create_paragraph(text, para_pr_id, char_pr_id)
         parent.insert(index + 1, new_p)
 
-        self._modified = True
+        self._mark_modified()
         return True
 
     def insert_paragraph_before(
@@ -131,7 +165,7 @@ class HwpxEditor:
         new_p = self._create_paragraph(text, para_pr_id, char_pr_id)
         parent.insert(index, new_p)
 
-        self._modified = True
+        self._mark_modified()
         return True
 
     def append_paragraph(
@@ -143,7 +177,7 @@ class HwpxEditor:
         """문서 끝에 단락 추가"""
         new_p = self._create_paragraph(text, para_pr_id, char_pr_id)
         self.root.append(new_p)
-        self._modified = True
+        self._mark_modified()
         return True
 
     def _create_paragraph(
@@ -202,7 +236,7 @@ class HwpxEditor:
         parent = target.getparent()
         parent.remove(target)
 
-        self._modified = True
+        self._mark_modified()
         return True
 
     def delete_paragraphs_range(self, start: int, end: int) -> int:
@@ -218,7 +252,7 @@ class HwpxEditor:
             deleted += 1
 
         if deleted > 0:
-            self._modified = True
+            self._mark_modified()
         return deleted
 
     # ============================================================
@@ -244,7 +278,7 @@ class HwpxEditor:
             self._xml_str = self._xml_str.replace(old_text, new_text, count)
 
         if replaced > 0:
-            self._modified = True
+            self._mark_modified()
         return replaced
 
     # ============================================================
@@ -269,8 +303,6 @@ class HwpxEditor:
         Returns:
             성공 여부
         """
-        import re
-
         # 해당 텍스트가 포함된 단락의 끝 태그 찾기
         # <hp:t>텍스트</hp:t> ... </hp:p> 패턴
         pattern = rf'<hp:t[^>]*>{re.escape(after_text)}</hp:t>'
@@ -278,21 +310,19 @@ class HwpxEditor:
         if not match:
             return False
 
-        # 해당 위치 이후의 </hp:p> 찾기
-        search_start = match.end()
-        p_end_pattern = r'</hp:p>'
-        p_end_match = re.search(p_end_pattern, self._xml_str[search_start:])
-        if not p_end_match:
+        # 해당 위치 이후의 </hp:p> 찾기 (뒷부분 문자열을 잘라 복사하지 않음)
+        p_end = self._xml_str.find(_P_END_TAG, match.end())
+        if p_end == -1:
             return False
 
-        insert_pos = search_start + p_end_match.end()
+        insert_pos = p_end + len(_P_END_TAG)
 
         # 새 단락 XML 생성
         new_p_xml = self._create_paragraph_xml(new_text, para_pr_id, char_pr_id)
 
         # 삽입
         self._xml_str = self._xml_str[:insert_pos] + new_p_xml + self._xml_str[insert_pos:]
-        self._modified = True
+        self._mark_modified()
         return True
 
     def insert_paragraphs_after_text(
@@ -313,20 +343,16 @@ class HwpxEditor:
         Returns:
             삽입된 단락 수
         """
-        import re
-
         pattern = rf'<hp:t[^>]*>{re.escape(after_text)}</hp:t>'
         match = re.search(pattern, self._xml_str)
         if not match:
             return 0
 
-        search_start = match.end()
-        p_end_pattern = r'</hp:p>'
-        p_end_match = re.search(p_end_pattern, self._xml_str[search_start:])
-        if not p_end_match:
+        p_end = self._xml_str.find(_P_END_TAG, match.end())
+        if p_end == -1:
             return 0
 
-        insert_pos = search_start + p_end_match.end()
+        insert_pos = p_end + len(_P_END_TAG)
 
         # 새 단락들 XML 생성
         new_paragraphs_xml = ""
@@ -334,7 +360,7 @@ class HwpxEditor:
             new_paragraphs_xml += self._create_paragraph_xml(text, para_pr_id, char_pr_id)
 
         self._xml_str = self._xml_str[:insert_pos] + new_paragraphs_xml + self._xml_str[insert_pos:]
-        self._modified = True
+        self._mark_modified()
         return len(texts)
 
     def _create_paragraph_xml(
@@ -385,7 +411,7 @@ class HwpxEditor:
         new_p_xml = self._create_paragraph_xml(text, para_pr_id, char_pr_id)
 
         self._xml_str = self._xml_str[:insert_pos] + new_p_xml + self._xml_str[insert_pos:]
-        self._modified = True
+        self._mark_modified()
         return True
 
     def copy_paragraph_style_and_insert(
@@ -402,8 +428,6 @@ class HwpxEditor:
         Returns:
             성공 여부
         """
-        import re
-
         # source_text가 포함된 <hp:p ...>...</hp:p> 전체 찾기
         pattern = rf'<hp:p[^>]*>.*?<hp:t[^>]*>{re.escape(source_text)}</hp:t>.*?</hp:p>'
         match = re.search(pattern, self._xml_str, re.DOTALL)
@@ -414,8 +438,8 @@ class HwpxEditor:
         insert_pos = match.end()
 
         # 소스 단락에서 paraPrIDRef와 charPrIDRef 추출
-        para_pr_match = re.search(r'paraPrIDRef="(\d+)"', source_p)
-        char_pr_match = re.search(r'charPrIDRef="(\d+)"', source_p)
+        para_pr_match = _PARA_PR_ID_RE.search(source_p)
+        char_pr_match = _CHAR_PR_ID_RE.search(source_p)
 
         para_pr_id = int(para_pr_match.group(1)) if para_pr_match else 0
         char_pr_id = int(char_pr_match.group(1)) if char_pr_match else 0
@@ -424,7 +448,7 @@ class HwpxEditor:
         new_p_xml = self._create_paragraph_xml(new_text, para_pr_id, char_pr_id)
 
         self._xml_str = self._xml_str[:insert_pos] + new_p_xml + self._xml_str[insert_pos:]
-        self._modified = True
+        self._mark_modified()
         return True
 
     def set_paragraph_text(self, index: int, text: str, char_pr_id: int = 0) -> bool:
@@ -436,7 +460,7 @@ class HwpxEditor:
         p = paragraphs[index]
 
         # 기존 run 제거
-        for run in p.xpath("./hp:run", namespaces=NS):
+        for run in _XPATH_RUNS(p):
             p.remove(run)
 
         # 새 run 추가
@@ -459,7 +483,7 @@ class HwpxEditor:
         else:
             p.append(run)
 
-        self._modified = True
+        self._mark_modified()
         return True
 
     # ============================================================
@@ -485,7 +509,7 @@ class HwpxEditor:
             index = list(parent).index(target)
             parent.insert(index, new_p)
 
-        self._modified = True
+        self._mark_modified()
         return True
 
     def move_paragraph(self, from_index: int, to_index: int) -> bool:
@@ -512,7 +536,7 @@ class HwpxEditor:
             index = list(parent).index(target)
             parent.insert(index, source)
 
-        self._modified = True
+        self._mark_modified()
         return True
 
     # ============================================================
@@ -526,7 +550,7 @@ class HwpxEditor:
             return False
 
         paragraphs[index].set("pageBreak", "1" if enable else "0")
-        self._modified = True
+        self._mark_modified()
         return True
 
     def set_column_break(self, index: int, enable: bool = True) -> bool:
@@ -536,7 +560,7 @@ class HwpxEditor:
             return False
 
         paragraphs[index].set("columnBreak", "1" if enable else "0")
-        self._modified = True
+        self._mark_modified()
         return True
 
     # ============================================================
@@ -550,7 +574,7 @@ class HwpxEditor:
             return False
 
         paragraphs[index].set("paraPrIDRef", str(para_pr_id))
-        self._modified = True
+        self._mark_modified()
         return True
 
     def set_char_style(self, para_index: int, char_pr_id: int) -> bool:
@@ -559,10 +583,10 @@ class HwpxEditor:
         if para_index < 0 or para_index >= len(paragraphs):
             return False
 
-        for run in paragraphs[para_index].xpath("./hp:run", namespaces=NS):
+        for run in _XPATH_RUNS(paragraphs[para_index]):
             run.set("charPrIDRef", str(char_pr_id))
 
-        self._modified = True
+        self._mark_modified()
         return True
 
     # ============================================================
@@ -580,7 +604,7 @@ class HwpxEditor:
             return None
 
         texts = []
-        for t in paragraphs[index].xpath(".//hp:t", namespaces=NS):
+        for t in _XPATH_TEXTS(paragraphs[index]):
             if t.text:
                 texts.append(t.text)
         return "".join(texts)
@@ -623,7 +647,7 @@ class HwpxEditor:
         table_p = self._create_table_paragraph(rows, cols, data, col_widths, border_fill_id)
         parent.insert(index + 1, table_p)
 
-        self._modified = True
+        self._mark_modified()
         return True
 
     def _create_table_paragraph(
@@ -853,7 +877,7 @@ class HwpxEditor:
         image_p = self._create_image_paragraph(binary_item_id, width, height)
         parent.insert(index + 1, image_p)
 
-        self._modified = True
+        self._mark_modified()
         return True
 
     def _create_image_paragraph(
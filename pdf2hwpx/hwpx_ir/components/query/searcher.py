@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import bisect
 import re
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple
+from typing import BinaryIO, Dict, List, Optional, Tuple, Union
 from lxml import etree
 
 
@@ -14,6 +15,63 @@ NS = {
     "hc": "http://www.hancom.co.kr/hwpml/2011/core",
 }
 
+# 반복 사용하는 XPath (모듈 로드 시 한 번만 컴파일)
+_XPATH_ALL_PARAS = etree.XPath(".//hp:p", namespaces=NS)
+_XPATH_TEXTS = etree.XPath(".//hp:t", namespaces=NS)
+_XPATH_RUNS = etree.XPath("./hp:run", namespaces=NS)
+_XPATH_TABLES = etree.XPath(".//hp:tbl", namespaces=NS)
+_XPATH_PICS = etree.XPath(".//hp:pic", namespaces=NS)
+_XPATH_IMGS = etree.XPath(".//hc:img", namespaces=NS)
+_XPATH_CUR_SZ = etree.XPath("./hp:curSz", namespaces=NS)
+
+# 단락 텍스트를 이어붙일 때 쓰는 구분자 - XML 1.0 문서에는 나올 수 없는 문자
+_JOIN_SEP = "\x00"
+
+# 대소문자 무시 검색 사전 필터용 정규화 - str.casefold()가 re.IGNORECASE와 다르게
+# 접는 터키어 i 계열(ı, İ → i̇)을 보정해 필터가 실제 매칭을 놓치지 않도록 함
+_CASEFOLD_FIXUP = str.maketrans({"ı": "i", "\u0307": None})
+
+
+def _fold(text: str) -> str:
+    """대소문자 무시 비교용 문자열 정규화"""
+    return text.casefold().translate(_CASEFOLD_FIXUP)
+
+
+_TAG_P = f"{{{NS['hp']}}}p"
+_TAG_TBL = f"{{{NS['hp']}}}tbl"
+_TAG_PIC = f"{{{NS['hp']}}}pic"
+
+
+def count_section_elements(source: BinaryIO) -> Dict[str, int]:
+    """section XML을 스트리밍 파싱해 단락/테이블/이미지/브레이크 수만 집계
+
+    전체 트리를 만들지 않고 처리한 요소는 바로 비우므로 메모리 사용이 문서 크기와 무관합니다.
+    HwpxSearcher의 get_paragraph_count/get_tables_info/get_images_info/
+    get_page_count_estimate와 같은 기준으로 셉니다.
+    """
+    counts = {"paragraphs": 0, "tables": 0, "images": 0, "page_breaks": 0}
+
+    for _, elem in etree.iterparse(source, events=("end",), tag=(_TAG_P, _TAG_TBL, _TAG_PIC)):
+        if elem.tag == _TAG_P:
+            counts["paragraphs"] += 1
+            if elem.get("pageBreak") == "1":
+                counts["page_breaks"] += 1
+            if elem.get("columnBreak") == "1":
+                counts["page_breaks"] += 1
+        elif elem.tag == _TAG_TBL:
+            counts["tables"] += 1
+        else:
+            counts["images"] += 1
+
+        # 이미 집계한 요소와 앞선 형제 요소 해제
+        elem.clear()
+        parent = elem.getparent()
+        if parent is not None:
+            while elem.getprevious() is not None:
+                del parent[0]
+
+    return counts
+
 
 @dataclass
 class PageBreakInfo:
@@ -52,20 +110,26 @@ class SearchResult:
 class HwpxSearcher:
     """HWPX 콘텐츠 검색기"""
 
-    def __init__(self, section_xml: bytes):
+    def __init__(self, section_xml: Union[bytes, BinaryIO]):
         """
         Args:
-            section_xml: section0.xml 바이트
+            section_xml: section0.xml 바이트 또는 읽기용 파일 객체 (zip 항목 스트림 등)
         """
-        self.root = etree.fromstring(section_xml)
+        if isinstance(section_xml, bytes):
+            self.root = etree.fromstring(section_xml)
+        else:
+            self.root = etree.parse(section_xml).getroot()
         self._paragraphs: List[etree._Element] = []
         self._page_breaks: List[int] = []  # 페이지 브레이크가 있는 단락 인덱스
+        self._texts: Optional[List[str]] = None  # 단락 텍스트 (지연 계산)
+        self._folded_texts: Optional[List[str]] = None  # 대소문자 정규화된 단락 텍스트 (지연 계산)
+        self._joined: Optional[Tuple[str, List[int]]] = None  # 이어붙인 텍스트와 단락 시작 위치
         self._parse()
 
     def _parse(self):
         """섹션 파싱하여 단락 목록과 페이지 브레이크 수집"""
         # 모든 단락 수집 (중첩된 것 포함)
-        self._paragraphs = self.root.xpath(".//hp:p", namespaces=NS)
+        self._paragraphs = _XPATH_ALL_PARAS(self.root)
 
         # 페이지 브레이크 탐지
         for i, p in enumerate(self._paragraphs):
@@ -77,22 +141,87 @@ class HwpxSearcher:
     def _get_paragraph_text(self, p: etree._Element) -> str:
         """단락에서 텍스트 추출"""
         texts = []
-        for t in p.xpath(".//hp:t", namespaces=NS):
+        for t in _XPATH_TEXTS(p):
             if t.text:
                 texts.append(t.text)
             if t.tail:
                 texts.append(t.tail)
         return "".join(texts)
 
+    def _paragraph_texts(self) -> List[str]:
+        """전체 단락 텍스트 (한 번 추출 후 재사용)"""
+        if self._texts is None:
+            self._texts = [self._get_paragraph_text(p) for p in self._paragraphs]
+        return self._texts
+
+    def _cached_paragraph_text(self, index: int) -> str:
+        """N번째 단락 텍스트 - 이미 추출한 텍스트가 있으면 재사용"""
+        if self._texts is not None:
+            return self._texts[index]
+        return self._get_paragraph_text(self._paragraphs[index])
+
+    def _folded_paragraph_texts(self) -> List[str]:
+        """대소문자 정규화된 단락 텍스트 (한 번 계산 후 재사용)"""
+        if self._folded_texts is None:
+            self._folded_texts = [_fold(text) for text in self._paragraph_texts()]
+        return self._folded_texts
+
+    def _joined_paragraph_texts(self) -> Tuple[str, List[int]]:
+        """단락 텍스트를 구분자로 이어붙인 전체 문자열과 각 단락의 시작 위치"""
+        if self._joined is None:
+            starts = []
+            pos = 0
+            for text in self._paragraph_texts():
+                starts.append(pos)
+                pos += len(text) + len(_JOIN_SEP)
+            self._joined = (_JOIN_SEP.join(self._paragraph_texts()), starts)
+        return self._joined
+
+    def _make_result(self, index: int, text: str, start: int, end: int) -> SearchResult:
+        """매칭 위치로 검색 결과 생성 (매칭 전후 50자 컨텍스트 포함)"""
+        ctx_start = max(0, start - 50)
+        ctx_end = min(len(text), end + 50)
+        context = text[ctx_start:ctx_end]
+        if ctx_start > 0:
+            context = "..." + context
+        if ctx_end < len(text):
+            context = context + "..."
+
+        return SearchResult(
+            paragraph_index=index,
+            paragraph_id=self._paragraphs[index].get("id", ""),
+            text=text,
+            match_start=start,
+            match_end=end,
+            context=context,
+            page_estimate=self._estimate_page(index),
+        )
+
+    def _search_joined(
+        self, literal_pattern: re.Pattern, limit: Optional[int] = None
+    ) -> List[SearchResult]:
+        """리터럴 패턴을 이어붙인 전체 텍스트에 한 번에 매칭 (단락별 루프 없음)"""
+        joined, starts = self._joined_paragraph_texts()
+        if not starts:
+            return []
+        texts = self._paragraph_texts()
+        results = []
+
+        for match in literal_pattern.finditer(joined):
+            if len(results) == limit:
+                break
+            i = bisect.bisect_right(starts, match.start()) - 1
+            offset = starts[i]
+            results.append(
+                self._make_result(i, texts[i], match.start() - offset, match.end() - offset)
+            )
+
+        return results
+
     def _estimate_page(self, para_index: int) -> int:
         """단락 인덱스로 페이지 번호 추정 (명시적 브레이크 기준)"""
-        page = 1
-        for break_idx in self._page_breaks:
-            if break_idx < para_index:
-                page += 1
-            else:
-                break
-        return page
+        # _page_breaks는 단락 순서대로 수집되어 정렬되어 있음
+        return bisect.bisect_left(self._page_breaks, para_index) + 1
 
     # ============================================================
     # 1. 페이지 브레이크 탐지
@@ -107,7 +236,7 @@ class HwpxSearcher:
             col_break = p.get("columnBreak") == "1"
 
             if page_break or col_break:
-                text = self._get_paragraph_text(p)
+                text = self._cached_paragraph_text(i)
                 results.append(PageBreakInfo(
                     paragraph_index=i,
                     paragraph_id=p.get("id", ""),
@@ -135,18 +264,18 @@ class HwpxSearcher:
             return None
 
         p = self._paragraphs[index]
-        text = self._get_paragraph_text(p)
+        text = self._cached_paragraph_text(index)
 
         # 문자 스타일 ID 수집
         char_pr_ids = []
-        for run in p.xpath("./hp:run", namespaces=NS):
+        for run in _XPATH_RUNS(p):
             char_id = run.get("charPrIDRef")
             if char_id:
                 char_pr_ids.append(int(char_id))
 
         # 테이블/이미지 존재 여부
-        has_table = len(p.xpath(".//hp:tbl", namespaces=NS)) > 0
-        has_image = len(p.xpath(".//hp:pic", namespaces=NS)) > 0
+        has_table = len(_XPATH_TABLES(p)) > 0
+        has_image = len(_XPATH_PICS(p)) > 0
 
         return ParagraphInfo(
             index=index,
@@ -181,63 +310,57 @@ class HwpxSearcher:
     # 3. 텍스트 검색
     # ============================================================
 
-    def search(self, query: str, case_sensitive: bool = False) -> List[SearchResult]:
-        """텍스트 검색"""
+    def search(self, query: str, case_sensitive: bool = False,
+               limit: Optional[int] = None) -> List[SearchResult]:
+        """텍스트 검색 (limit 지정 시 그 개수만큼 찾으면 중단)"""
+        if _JOIN_SEP in query:
+            return []
+
+        if case_sensitive:
+            return self._search_joined(re.compile(re.escape(query)), limit)
+
         results = []
-        flags = 0 if case_sensitive else re.IGNORECASE
-        pattern = re.compile(re.escape(query), flags)
+        pattern = re.compile(re.escape(query), re.IGNORECASE)
+        texts = self._paragraph_texts()
+        folded_texts = self._folded_paragraph_texts()
+        folded_query = _fold(query)
 
-        for i, p in enumerate(self._paragraphs):
-            text = self._get_paragraph_text(p)
+        for i, text in enumerate(texts):
+            # 포함 여부를 먼저 단순 문자열 비교로 걸러내고, 위치는 정규식으로 구함
+            if folded_query not in folded_texts[i]:
+                continue
 
             for match in pattern.finditer(text):
-                # 컨텍스트 추출 (매칭 전후 50자)
-                ctx_start = max(0, match.start() - 50)
-                ctx_end = min(len(text), match.end() + 50)
-                context = text[ctx_start:ctx_end]
-                if ctx_start > 0:
-                    context = "..." + context
-                if ctx_end < len(text):
-                    context = context + "..."
-
-                results.append(SearchResult(
-                    paragraph_index=i,
-                    paragraph_id=p.get("id", ""),
-                    text=text,
-                    match_start=match.start(),
-                    match_end=match.end(),
-                    context=context,
-                    page_estimate=self._estimate_page(i),
-                ))
+                if len(results) == limit:
+                    return results
+                results.append(self._make_result(i, text, match.start(), match.end()))
 
         return results
 
-    def search_regex(self, pattern: str, flags: int = 0) -> List[SearchResult]:
-        """정규식 검색"""
+    def search_any(self, queries: List[str], case_sensitive: bool = False,
+                   limit: Optional[int] = None) -> List[SearchResult]:
+        """여러 텍스트 중 하나라도 일치하는 위치 검색 (단락을 한 번만 순회)"""
+        # 겹치는 검색어는 긴 것이 먼저 매칭되도록 길이 역순 정렬
+        terms = sorted({q for q in queries if q and _JOIN_SEP not in q}, key=len, reverse=True)
+        if not terms:
+            return []
+        if case_sensitive:
+            return self._search_joined(re.compile("|".join(map(re.escape, terms))), limit)
+        pattern = re.compile("|".join(map(re.escape, terms)), re.IGNORECASE)
+        return self.search_regex(pattern, limit=limit)
+
+    def search_regex(self, pattern: Union[str, re.Pattern], flags: int = 0,
+                     limit: Optional[int] = None) -> List[SearchResult]:
+        """정규식 검색 (미리 컴파일된 패턴도 허용, 이 경우 flags는 무시)"""
         results = []
-        regex = re.compile(pattern, flags)
-
-        for i, p in enumerate(self._paragraphs):
-            text = self._get_paragraph_text(p)
+        regex = pattern if isinstance(pattern, re.Pattern) else re.compile(pattern, flags)
+        texts = self._paragraph_texts()
 
+        for i, text in enumerate(texts):
             for match in regex.finditer(text):
-                ctx_start = max(0, match.start() - 50)
-                ctx_end = min(len(text), match.end() + 50)
-                context = text[ctx_start:ctx_end]
-                if ctx_start > 0:
-                    context = "..." + context
-                if ctx_end < len(text):
-                    context = context + "..."
-
-                results.append(SearchResult(
-                    paragraph_index=i,
-                    paragraph_id=p.get("id", ""),
-                    text=text,
-                    match_start=match.start(),
-                    match_end=match.end(),
-                    context=context,
-                    page_estimate=self._estimate_page(i),
-                ))
+                if len(results) == limit:
+                    return results
+                results.append(self._make_result(i, text, match.start(), match.end()))
 
         return results
 
@@ -247,12 +370,7 @@ class HwpxSearcher:
 
     def get_all_text(self) -> str:
         """전체 텍스트 추출"""
-        texts = []
-        for p in self._paragraphs:
-            text = self._get_paragraph_text(p)
-            if text.strip():
-                texts.append(text)
-        return "\n".join(texts)
+        return "\n".join(text for text in self._paragraph_texts() if text.strip())
 
     def get_text_by_page(self, page: int) -> str:
         """특정 페이지의 텍스트 추출 (추정)"""
@@ -262,13 +380,13 @@ class HwpxSearcher:
     def get_tables_info(self) -> List[dict]:
         """모든 테이블 정보"""
         tables = []
-        for i, tbl in enumerate(self.root.xpath(".//hp:tbl", namespaces=NS)):
+        for i, tbl in enumerate(_XPATH_TABLES(self.root)):
             row_cnt = tbl.get("rowCnt", "0")
             col_cnt = tbl.get("colCnt", "0")
 
             # 테이블 내 텍스트
             texts = []
-            for t in tbl.xpath(".//hp:t", namespaces=NS):
+            for t in _XPATH_TEXTS(tbl):
                 if t.text:
                     texts.append(t.text)
 
@@ -283,12 +401,12 @@ class HwpxSearcher:
     def get_images_info(self) -> List[dict]:
         """모든 이미지 정보"""
         images = []
-        for i, pic in enumerate(self.root.xpath(".//hp:pic", namespaces=NS)):
-            img = pic.xpath(".//hc:img", namespaces=NS)
+        for i, pic in enumerate(_XPATH_PICS(self.root)):
+            img = _XPATH_IMGS(pic)
             binary_ref = img[0].get("binaryItemIDRef") if img else ""
 
             # 크기
-            cur_sz = pic.xpath("./hp:curSz", namespaces=NS)
+            cur_sz = _XPATH_CUR_SZ(pic)
             width = cur_sz[0].get("width") if cur_sz else "0"
             height = cur_sz[0].get("height") if cur_sz else "0"
 
@@ -6,10 +6,14 @@ IR 모델을 HWPX 파일로 변환하는 메인 라이터.
 
 from __future__ import annotations
 
+import copy
 import io
+import itertools
+import os
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import BinaryIO, Callable, Dict, List, Optional
 
 from lxml import etree
 
@@ -31,36 +35,71 @@ from pdf2hwpx.hwpx_ir.components import (
 )
 
 
+# 섹션 빌드용 스레드 풀 - 템플릿 복사(zip I/O, zlib)와 섹션 트리 생성을 겹쳐 실행
+_SECTION_EXECUTOR = ThreadPoolExecutor(
+    max_workers=min(4, os.cpu_count() or 1),
+    thread_name_prefix="hwpx-section",
+)
+
+# DEFLATE 압축 레벨 (속도 우선, 기본값 6 대비 용량 차이는 작음)
+_ZIP_COMPRESSLEVEL = 1
+
+# 이미 압축된 미디어 타입 - 재압축 없이 STORED로 저장
+_STORED_MEDIA_TYPES = frozenset({"image/png", "image/jpeg", "image/gif"})
+
+# section0.xml 루트 네임스페이스 맵
+_SECTION_NSMAP = {
+    prefix: NS[prefix] for prefix in ("ha", "hp", "hp10", "hs", "hc", "hh", "hpf")
+}
+
+# 컨트롤 단락(테이블/이미지/수식)의 고정 속성
+_CONTROL_PARA_ATTRS = {
+    "paraPrIDRef": "0",
+    "styleIDRef": "0",
+    "pageBreak": "0",
+    "columnBreak": "0",
+    "merged": "0",
+}
+
+# 컨트롤 단락의 고정 linesegarray - 한 번 만들어 두고 deepcopy로 복제
+_CONTROL_LINESEG_TEMPLATE = etree.Element(qname("hp", "linesegarray"))
+etree.SubElement(
+    _CONTROL_LINESEG_TEMPLATE,
+    qname("hp", "lineseg"),
+    {
+        "textpos": "0",
+        "vertpos": "0",
+        "vertsize": "1000",
+        "textheight": "1000",
+        "baseline": "850",
+        "spacing": "600",
+        "horzpos": "0",
+        "horzsize": "0",
+        "flags": "393216",
+    },
+)
+
+
 @dataclass(frozen=True)
 class HwpxBinaryItem:
-    """HWPX 바이너리 항목"""
+    """HWPX 바이너리 항목
+
+    path가 지정되면 data 대신 해당 파일을 zip에 스트리밍으로 복사합니다.
+    """
     id: str
     filename: str
-    data: bytes
+    data: bytes = b""
+    path: Optional[str] = None
 
 
 class HwpxIdContext:
     """HWPX 요소 ID 관리"""
 
     def __init__(self):
-        self.para_id = 0
-        self.tbl_id = 0
-        self.pic_id = 2000000000
-
-    def next_para_id(self) -> int:
-        pid = self.para_id
-        self.para_id += 1
-        return pid
-
-    def next_tbl_id(self) -> int:
-        tid = self.tbl_id
-        self.tbl_id += 1
-        return tid
-
-    def next_pic_id(self) -> int:
-        pid = self.pic_id
-        self.pic_id += 1
-        return pid
+        # next_*_id()는 카운터의 __next__를 그대로 바인딩 (호출당 C 함수 1회)
+        self.next_para_id: Callable[[], int] = itertools.count(0).__next__
+        self.next_tbl_id: Callable[[], int] = itertools.count(0).__next__
+        self.next_pic_id: Callable[[], int] = itertools.count(2000000000).__next__
 
 
 class StyleManager:
@@ -173,8 +212,7 @@ class StyleManager:
 
     def get_font_id(self, font_name: str) -> int:
         """폰트 ID 반환 (없으면 기본 1)"""
-        if not font_name:
-            return self.DEFAULT_FONT_ID
+        # font_map에는 빈 이름이 등록되지 않으므로 ""/None도 기본값으로 떨어짐
         return self.font_map.get(font_name, self.DEFAULT_FONT_ID)
 
     def get_char_pr_id(self, run: IrTextRun) -> int:
@@ -201,6 +239,10 @@ class HwpxIrWriter:
         self.template_hwpx_path = template_hwpx_path
         self.style_manager: Optional[StyleManager] = None
 
+        # 템플릿 header.xml → 갱신된 header.xml 캐시
+        self._template_header_xml: Optional[bytes] = None
+        self._updated_header_xml: Optional[bytes] = None
+
         # 컴포넌트 라이터들 (lazy init)
         self._paragraph_writer: Optional[ParagraphWriter] = None
         self._table_writer: Optional[TableWriter] = None
@@ -222,22 +264,31 @@ class HwpxIrWriter:
 
     def write(self, doc: IrDocument, binary_items: Dict[str, HwpxBinaryItem]) -> bytes:
         """IrDocument를 HWPX 바이트로 변환"""
+        mem = io.BytesIO()
+        self.write_to(doc, binary_items, mem)
+        return mem.getvalue()
+
+    def write_to(
+        self, doc: IrDocument, binary_items: Dict[str, HwpxBinaryItem], output: BinaryIO
+    ) -> None:
+        """IrDocument를 HWPX로 변환해 파일 객체에 바로 쓰기 (전체 바이트를 메모리에 두지 않음)"""
         with zipfile.ZipFile(self.template_hwpx_path, "r") as src:
             # header.xml 읽어서 StyleManager 초기화
             try:
                 header_xml = src.read("Contents/header.xml")
-                self.style_manager = StyleManager(header_xml)
             except KeyError:
-                self.style_manager = None
+                header_xml = None
+            self._load_style_manager(header_xml)
 
             self._init_writers()
 
             template_content_hpf: Optional[bytes] = None
 
-            mem = io.BytesIO()
-            with zipfile.ZipFile(mem, "w", compression=zipfile.ZIP_DEFLATED) as out:
-                # 섹션 빌드
-                section_xml = self._build_section0(doc)
+            with zipfile.ZipFile(
+                output, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=_ZIP_COMPRESSLEVEL
+            ) as out:
+                # 섹션 빌드 (템플릿 복사와 병행)
+                section_future = _SECTION_EXECUTOR.submit(self._build_section0, doc)
 
                 # 템플릿 파일들 복사
                 for info in src.infolist():
@@ -248,17 +299,22 @@ class HwpxIrWriter:
                         continue
                     if info.filename == "Contents/header.xml":
                         if self.style_manager:
-                            out.writestr(info.filename, self.style_manager.get_updated_header_xml())
+                            out.writestr(info.filename, self._updated_header_xml)
                         else:
                             out.writestr(info.filename, src.read(info.filename))
                         continue
                     if info.filename.startswith("BinData/"):
                         continue
 
-                    out.writestr(info, src.read(info.filename))
+                    # 템플릿 항목의 압축 방식(STORED/DEFLATED)은 그대로 유지
+                    out.writestr(info, src.read(info.filename), compresslevel=_ZIP_COMPRESSLEVEL)
 
-                # 섹션 쓰기
-                out.writestr("Contents/section0.xml", section_xml)
+                # 섹션 쓰기 - 중간 bytes 없이 zip 항목으로 바로 직렬화
+                section_root = section_future.result()
+                with out.open("Contents/section0.xml", "w") as dst:
+                    etree.ElementTree(section_root).write(
+                        dst, xml_declaration=True, encoding="UTF-8", standalone=True
+                    )
 
                 # content.hpf 업데이트
                 if template_content_hpf:
@@ -267,24 +323,34 @@ class HwpxIrWriter:
 
                 # 바이너리 항목들 쓰기
                 for item in binary_items.values():
-                    out.writestr(f"BinData/{item.filename}", item.data)
-
-            return mem.getvalue()
-
-    def _build_section0(self, doc: IrDocument) -> bytes:
-        """섹션 XML 생성"""
-        root = etree.Element(
-            qname("hs", "sec"),
-            nsmap={
-                "ha": NS["ha"],
-                "hp": NS["hp"],
-                "hp10": NS["hp10"],
-                "hs": NS["hs"],
-                "hc": NS["hc"],
-                "hh": NS["hh"],
-                "hpf": NS["hpf"],
-            },
-        )
+                    if guess_media_type(item.filename) in _STORED_MEDIA_TYPES:
+                        compress_type = zipfile.ZIP_STORED
+                    else:
+                        compress_type = zipfile.ZIP_DEFLATED
+                    arcname = f"BinData/{item.filename}"
+                    if item.path is not None:
+                        out.write(item.path, arcname, compress_type=compress_type)
+                    else:
+                        out.writestr(arcname, item.data, compress_type=compress_type)
+
+    def _load_style_manager(self, header_xml: Optional[bytes]) -> None:
+        """StyleManager 초기화 (템플릿 header.xml이 같으면 이전 결과 재사용)"""
+        if header_xml is None:
+            self.style_manager = None
+            self._template_header_xml = None
+            self._updated_header_xml = None
+            return
+
+        if self.style_manager is not None and header_xml == self._template_header_xml:
+            return
+
+        self.style_manager = StyleManager(header_xml)
+        self._template_header_xml = header_xml
+        self._updated_header_xml = self.style_manager.get_updated_header_xml()
+
+    def _build_section0(self, doc: IrDocument) -> etree._Element:
+        """섹션 XML 트리 생성"""
+        root = etree.Element(qname("hs", "sec"), nsmap=_SECTION_NSMAP)
 
         context = HwpxIdContext()
 
@@ -313,8 +379,7 @@ class HwpxIrWriter:
                 # 컨트롤 삽입
                 if len(anchor_para) > 0:
                     run = anchor_para[0]
-                    for ctrl in reversed(controls):
-                        run.insert(0, ctrl)
+                    run[:0] = controls
 
                 # 나머지 블록 처리
                 for b in processing_blocks:
@@ -327,7 +392,7 @@ class HwpxIrWriter:
                 for el in elements:
                     root.append(el)
 
-        return etree.tostring(root, xml_declaration=True, encoding="UTF-8", standalone=True)
+        return root
 
     def _process_block(self, block: IrBlock, context: HwpxIdContext) -> List[etree._Element]:
         """블록을 XML 요소로 변환"""
@@ -369,27 +434,13 @@ class HwpxIrWriter:
         """컨트롤을 포함하는 단락 생성"""
         p = etree.Element(qname("hp", "p"))
         p.set("id", str(paragraph_id))
-        p.set("paraPrIDRef", "0")
-        p.set("styleIDRef", "0")
-        p.set("pageBreak", "0")
-        p.set("columnBreak", "0")
-        p.set("merged", "0")
+        p.attrib.update(_CONTROL_PARA_ATTRS)
 
         run = etree.SubElement(p, qname("hp", "run"))
         run.set("charPrIDRef", "0")
         run.append(ctrl)
 
-        linesegarray = etree.SubElement(p, qname("hp", "linesegarray"))
-        lineseg = etree.SubElement(linesegarray, qname("hp", "lineseg"))
-        lineseg.set("textpos", "0")
-        lineseg.set("vertpos", "0")
-        lineseg.set("vertsize", "1000")
-        lineseg.set("textheight", "1000")
-        lineseg.set("baseline", "850")
-        lineseg.set("spacing", "600")
-        lineseg.set("horzpos", "0")
-        lineseg.set("horzsize", "0")
-        lineseg.set("flags", "393216")
+        p.append(copy.deepcopy(_CONTROL_LINESEG_TEMPLATE))
 
         return p
 
@@ -399,27 +450,28 @@ class HwpxIrWriter:
         binary_items: Dict[str, HwpxBinaryItem],
     ) -> bytes:
         """content.hpf 업데이트"""
+        # 추가할 항목도, 정리할 BinData 참조도 없으면 파싱 없이 그대로 사용
+        if not binary_items and b"BinData/" not in template_content_hpf:
+            return template_content_hpf
+
         root = etree.fromstring(template_content_hpf)
         manifest = root.find(etree.QName(NS["opf"], "manifest"))
         if manifest is None:
             raise ValueError("Template content.hpf is missing <opf:manifest>")
 
+        # 기존 항목 수집 + 오래된 BinData 참조 정리 (한 번 순회)
         existing_by_id: Dict[str, etree._Element] = {}
-        for item in manifest.findall(etree.QName(NS["opf"], "item")):
+        to_remove: List[etree._Element] = []
+        for item in manifest.iterchildren(etree.QName(NS["opf"], "item")):
             item_id = item.get("id")
-            if item_id:
+            href = item.get("href") or ""
+            if href.startswith("BinData/") and (not item_id or item_id not in binary_items):
+                to_remove.append(item)
+            elif item_id:
                 existing_by_id[item_id] = item
 
-        # 기존 BinData 참조 정리
-        for item in list(manifest.findall(etree.QName(NS["opf"], "item"))):
-            href = item.get("href") or ""
-            if not href.startswith("BinData/"):
-                continue
-            item_id = item.get("id")
-            if not item_id or item_id not in binary_items:
-                manifest.remove(item)
-                if item_id:
-                    existing_by_id.pop(item_id, None)
+        for item in to_remove:
+            manifest.remove(item)
 
         # 새 바이너리 항목 추가
         for binary_item_id, binary_item in binary_items.items():
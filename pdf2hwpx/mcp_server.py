@@ -2,11 +2,21 @@
 
 import asyncio
 import base64
+import binascii
+import contextlib
+import functools
+import hashlib
 import json
+import multiprocessing
+import os
+import re
+import shutil
+import struct
 import tempfile
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, BinaryIO, Callable, Optional, Tuple
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
@@ -18,609 +28,727 @@ from mcp.types import (
 
 from pdf2hwpx import Pdf2Hwpx
 
+try:
+    import orjson
+except ImportError:  # 선택 의존성 - 없으면 표준 json 사용
+    orjson = None
+
 
 # MCP 서버 인스턴스
 server = Server("pdf2hwpx")
 
+# zip 항목 스트리밍 복사 버퍼 크기
+_COPY_BUFSIZE = 1 << 16
+
+# 저장 시 다시 압축하는 section0.xml의 deflate 레벨 (XML은 레벨 1로도 충분히 압축됨)
+_SAVE_COMPRESSLEVEL = 1
+
+# 검색 도구가 표시하는 최대 결과 수 - 검색기에는 초과 여부 확인용으로 하나 더 요청
+_SEARCH_LIMIT = 20
+
+# 이 크기를 넘는 변환 결과는 Base64 대신 파일로 저장해 경로로 반환
+_INLINE_HWPX_MAX_BYTES = 8 << 20
+
+# output_path 없이 받은 큰 변환 결과를 저장할 디렉터리
+# (PDF2HWPX_OUTPUT_DIR 환경변수, 기본: 시스템 임시 디렉터리의 pdf2hwpx)
+_OUTPUT_DIR = Path(os.getenv("PDF2HWPX_OUTPUT_DIR") or Path(tempfile.gettempdir()) / "pdf2hwpx")
+
+# PDF 변환 워커 프로세스 풀 - 변환 중에도 이벤트 루프가 다른 요청을 처리하고,
+# CPU 위주의 PDF 파싱이 GIL에 묶이지 않고 여러 문서를 병렬로 처리하도록 분리
+# (워커는 첫 요청 때 생성되며 이미 여러 스레드가 도는 중이므로 fork 대신 spawn -
+# 다른 스레드가 잡고 있던 락을 복제해 교착되지 않도록)
+_CONVERT_EXECUTOR = ProcessPoolExecutor(
+    max_workers=min(4, os.cpu_count() or 1),
+    mp_context=multiprocessing.get_context("spawn"),
+)
+
+# 편집 도구 직렬화 락 - 저장을 스레드로 넘기는 동안 다른 편집이 저장 전 파일을 읽어
+# 변경 사항을 덮어쓰지 않도록 함 (이벤트 루프 안에서 생성해야 하므로 지연 생성)
+_edit_lock: Optional[asyncio.Lock] = None
+
+
+def _dumps(obj: Any) -> str:
+    """도구 응답용 JSON 직렬화 - orjson이 있으면 C 구현 사용 (출력 형식은 동일)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, ensure_ascii=False, indent=2)
+
 
 # =============================================================================
 # Tool Definitions
 # =============================================================================
 
-@server.list_tools()
-async def list_tools() -> list[Tool]:
-    """사용 가능한 도구 목록"""
-    return [
-        # =====================================================================
-        # PDF 변환
-        # =====================================================================
-        Tool(
-            name="convert_pdf_to_hwpx",
-            description="PDF 파일을 HWPX (한글) 파일로 변환합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "pdf_path": {
-                        "type": "string",
-                        "description": "변환할 PDF 파일 경로",
-                    },
-                    "output_path": {
-                        "type": "string",
-                        "description": "출력 HWPX 파일 경로 (옵션, 기본: PDF 파일명.hwpx)",
-                    },
-                    "backend": {
-                        "type": "string",
-                        "enum": ["pymupdf", "cloud", "openai", "vllm", "mineru", "gemini", "openrouter"],
-                        "description": "PDF 파싱 백엔드 (기본: pymupdf)",
-                        "default": "pymupdf",
-                    },
+# 도구 목록 - 모듈 로드 시 한 번만 생성
+_TOOLS: list[Tool] = [
+    # =====================================================================
+    # PDF 변환
+    # =====================================================================
+    Tool(
+        name="convert_pdf_to_hwpx",
+        description="PDF 파일을 HWPX (한글) 파일로 변환합니다.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "pdf_path": {
+                    "type": "string",
+                    "description": "변환할 PDF 파일 경로",
+                },
+                "output_path": {
+                    "type": "string",
+                    "description": "출력 HWPX 파일 경로 (옵션, 기본: PDF 파일명.hwpx)",
+                },
+                "backend": {
+                    "type": "string",
+                    "enum": [
+                        "pymupdf", "cloud", "openai", "vllm", "mineru", "gemini", "openrouter",
+                    ],
+                    "description": "PDF 파싱 백엔드 (기본: pymupdf)",
+                    "default": "pymupdf",
                 },
-                "required": ["pdf_path"],
             },
+            "required": ["pdf_path"],
+        },
+    ),
+    Tool(
+        name="convert_pdf_bytes_to_hwpx",
+        description=(
+            "Base64 인코딩된 PDF 바이트를 HWPX 바이트로 변환합니다. "
+            "결과가 크거나 output_path를 지정하면 Base64 대신 저장된 파일 경로를 반환합니다 "
+            "(output_path가 없으면 PDF2HWPX_OUTPUT_DIR에 저장)."
         ),
-        Tool(
-            name="convert_pdf_bytes_to_hwpx",
-            description="Base64 인코딩된 PDF 바이트를 HWPX 바이트로 변환합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "pdf_base64": {
-                        "type": "string",
-                        "description": "Base64 인코딩된 PDF 데이터",
-                    },
-                    "backend": {
-                        "type": "string",
-                        "enum": ["pymupdf", "cloud", "openai", "vllm", "mineru", "gemini", "openrouter"],
-                        "description": "PDF 파싱 백엔드 (기본: pymupdf)",
-                        "default": "pymupdf",
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "pdf_base64": {
+                    "type": "string",
+                    "description": "Base64 인코딩된 PDF 데이터",
+                },
+                "output_path": {
+                    "type": "string",
+                    "description": "결과 HWPX를 저장할 경로 (옵션, 지정 시 경로만 반환)",
+                },
+                "backend": {
+                    "type": "string",
+                    "enum": [
+                        "pymupdf", "cloud", "openai", "vllm", "mineru", "gemini", "openrouter",
+                    ],
+                    "description": "PDF 파싱 백엔드 (기본: pymupdf)",
+                    "default": "pymupdf",
                 },
-                "required": ["pdf_base64"],
             },
+            "required": ["pdf_base64"],
+        },
+    ),
+    # =====================================================================
+    # HWPX 정보 조회
+    # =====================================================================
+    Tool(
+        name="get_hwpx_info",
+        description=(
+            "HWPX 파일의 정보를 가져옵니다 "
+            "(단락 수, 테이블 수, 이미지 수, 추정 페이지 수 등)."
         ),
-        # =====================================================================
-        # HWPX 정보 조회
-        # =====================================================================
-        Tool(
-            name="get_hwpx_info",
-            description="HWPX 파일의 정보를 가져옵니다 (단락 수, 테이블 수, 이미지 수, 추정 페이지 수 등).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwpx_path": {
-                        "type": "string",
-                        "description": "정보를 가져올 HWPX 파일 경로",
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwpx_path": {
+                    "type": "string",
+                    "description": "정보를 가져올 HWPX 파일 경로",
                 },
-                "required": ["hwpx_path"],
             },
-        ),
-        Tool(
-            name="get_hwpx_text",
-            description="HWPX 파일의 전체 텍스트를 추출합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwpx_path": {
-                        "type": "string",
-                        "description": "텍스트를 추출할 HWPX 파일 경로",
-                    },
-                    "page": {
-                        "type": "integer",
-                        "description": "특정 페이지만 추출 (옵션, 없으면 전체)",
-                    },
+            "required": ["hwpx_path"],
+        },
+    ),
+    Tool(
+        name="get_hwpx_text",
+        description="HWPX 파일의 전체 텍스트를 추출합니다.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwpx_path": {
+                    "type": "string",
+                    "description": "텍스트를 추출할 HWPX 파일 경로",
+                },
+                "page": {
+                    "type": "integer",
+                    "description": "특정 페이지만 추출 (옵션, 없으면 전체)",
                 },
-                "required": ["hwpx_path"],
             },
-        ),
-        Tool(
-            name="get_hwpx_paragraph",
-            description="HWPX 파일의 특정 단락(들)을 가져옵니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwpx_path": {
-                        "type": "string",
-                        "description": "HWPX 파일 경로",
-                    },
-                    "index": {
-                        "type": "integer",
-                        "description": "단락 인덱스 (0-based)",
-                    },
-                    "start": {
-                        "type": "integer",
-                        "description": "시작 인덱스 (범위 조회시)",
-                    },
-                    "end": {
-                        "type": "integer",
-                        "description": "끝 인덱스 (범위 조회시, exclusive)",
-                    },
+            "required": ["hwpx_path"],
+        },
+    ),
+    Tool(
+        name="get_hwpx_paragraph",
+        description="HWPX 파일의 특정 단락(들)을 가져옵니다.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwpx_path": {
+                    "type": "string",
+                    "description": "HWPX 파일 경로",
+                },
+                "index": {
+                    "type": "integer",
+                    "description": "단락 인덱스 (0-based)",
+                },
+                "start": {
+                    "type": "integer",
+                    "description": "시작 인덱스 (범위 조회시)",
+                },
+                "end": {
+                    "type": "integer",
+                    "description": "끝 인덱스 (범위 조회시, exclusive)",
                 },
-                "required": ["hwpx_path"],
             },
-        ),
-        Tool(
-            name="get_hwpx_tables",
-            description="HWPX 파일의 테이블 정보를 가져옵니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwpx_path": {
-                        "type": "string",
-                        "description": "HWPX 파일 경로",
-                    },
+            "required": ["hwpx_path"],
+        },
+    ),
+    Tool(
+        name="get_hwpx_tables",
+        description="HWPX 파일의 테이블 정보를 가져옵니다.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwpx_path": {
+                    "type": "string",
+                    "description": "HWPX 파일 경로",
                 },
-                "required": ["hwpx_path"],
             },
-        ),
-        Tool(
-            name="get_hwpx_images",
-            description="HWPX 파일의 이미지 정보를 가져옵니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwpx_path": {
-                        "type": "string",
-                        "description": "HWPX 파일 경로",
-                    },
+            "required": ["hwpx_path"],
+        },
+    ),
+    Tool(
+        name="get_hwpx_images",
+        description="HWPX 파일의 이미지 정보를 가져옵니다.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwpx_path": {
+                    "type": "string",
+                    "description": "HWPX 파일 경로",
                 },
-                "required": ["hwpx_path"],
             },
-        ),
-        Tool(
-            name="find_page_breaks",
-            description="HWPX 파일의 페이지 브레이크 위치를 찾습니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwpx_path": {
-                        "type": "string",
-                        "description": "HWPX 파일 경로",
-                    },
+            "required": ["hwpx_path"],
+        },
+    ),
+    Tool(
+        name="find_page_breaks",
+        description="HWPX 파일의 페이지 브레이크 위치를 찾습니다.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwpx_path": {
+                    "type": "string",
+                    "description": "HWPX 파일 경로",
                 },
-                "required": ["hwpx_path"],
             },
-        ),
-        # =====================================================================
-        # 검색
-        # =====================================================================
-        Tool(
-            name="search_hwpx",
-            description="HWPX 파일에서 텍스트를 검색합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwpx_path": {
-                        "type": "string",
-                        "description": "검색할 HWPX 파일 경로",
-                    },
-                    "query": {
-                        "type": "string",
-                        "description": "검색할 텍스트",
-                    },
-                    "case_sensitive": {
-                        "type": "boolean",
-                        "description": "대소문자 구분 여부 (기본: false)",
-                        "default": False,
-                    },
+            "required": ["hwpx_path"],
+        },
+    ),
+    # =====================================================================
+    # 검색
+    # =====================================================================
+    Tool(
+        name="search_hwpx",
+        description="HWPX 파일에서 텍스트를 검색합니다.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwpx_path": {
+                    "type": "string",
+                    "description": "검색할 HWPX 파일 경로",
+                },
+                "query": {
+                    "type": "string",
+                    "description": "검색할 텍스트",
+                },
+                "queries": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "여러 텍스트를 한 번에 검색 (옵션, query와 함께 사용 가능)",
+                },
+                "case_sensitive": {
+                    "type": "boolean",
+                    "description": "대소문자 구분 여부 (기본: false)",
+                    "default": False,
                 },
-                "required": ["hwpx_path", "query"],
             },
-        ),
-        Tool(
-            name="search_hwpx_regex",
-            description="HWPX 파일에서 정규식으로 검색합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwpx_path": {
-                        "type": "string",
-                        "description": "검색할 HWPX 파일 경로",
-                    },
-                    "pattern": {
-                        "type": "string",
-                        "description": "정규식 패턴",
-                    },
-                    "ignore_case": {
-                        "type": "boolean",
-                        "description": "대소문자 무시 여부 (기본: false)",
-                        "default": False,
-                    },
+            "required": ["hwpx_path"],
+        },
+    ),
+    Tool(
+        name="search_hwpx_regex",
+        description="HWPX 파일에서 정규식으로 검색합니다.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwpx_path": {
+                    "type": "string",
+                    "description": "검색할 HWPX 파일 경로",
+                },
+                "pattern": {
+                    "type": "string",
+                    "description": "정규식 패턴",
+                },
+                "ignore_case": {
+                    "type": "boolean",
+                    "description": "대소문자 무시 여부 (기본: false)",
+                    "default": False,
                 },
-                "required": ["hwpx_path", "pattern"],
             },
-        ),
-        # =====================================================================
-        # 텍스트 편집
-        # =====================================================================
-        Tool(
-            name="replace_text",
-            description="HWPX 파일의 텍스트를 치환합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwpx_path": {
-                        "type": "string",
-                        "description": "수정할 HWPX 파일 경로",
-                    },
-                    "old_text": {
-                        "type": "string",
-                        "description": "찾을 텍스트",
-                    },
-                    "new_text": {
-                        "type": "string",
-                        "description": "바꿀 텍스트",
-                    },
-                    "count": {
-                        "type": "integer",
-                        "description": "최대 치환 횟수 (-1이면 전체, 기본: -1)",
-                        "default": -1,
-                    },
-                    "output_path": {
-                        "type": "string",
-                        "description": "출력 파일 경로 (옵션, 기본: 원본 파일 덮어쓰기)",
-                    },
+            "required": ["hwpx_path", "pattern"],
+        },
+    ),
+    # =====================================================================
+    # 텍스트 편집
+    # =====================================================================
+    Tool(
+        name="replace_text",
+        description="HWPX 파일의 텍스트를 치환합니다.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwpx_path": {
+                    "type": "string",
+                    "description": "수정할 HWPX 파일 경로",
+                },
+                "old_text": {
+                    "type": "string",
+                    "description": "찾을 텍스트",
+                },
+                "new_text": {
+                    "type": "string",
+                    "description": "바꿀 텍스트",
+                },
+                "count": {
+                    "type": "integer",
+                    "description": "최대 치환 횟수 (-1이면 전체, 기본: -1)",
+                    "default": -1,
+                },
+                "output_path": {
+                    "type": "string",
+                    "description": "출력 파일 경로 (옵션, 기본: 원본 파일 덮어쓰기)",
                 },
-                "required": ["hwpx_path", "old_text", "new_text"],
             },
-        ),
-        Tool(
-            name="set_paragraph_text",
-            description="HWPX 파일의 특정 단락 텍스트를 교체합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwpx_path": {
-                        "type": "string",
-                        "description": "수정할 HWPX 파일 경로",
-                    },
-                    "index": {
-                        "type": "integer",
-                        "description": "단락 인덱스 (0-based)",
-                    },
-                    "text": {
-                        "type": "string",
-                        "description": "새 텍스트",
-                    },
-                    "char_style_id": {
-                        "type": "integer",
-                        "description": "문자 스타일 ID (기본: 0)",
-                        "default": 0,
-                    },
-                    "output_path": {
-                        "type": "string",
-                        "description": "출력 파일 경로 (옵션)",
-                    },
+            "required": ["hwpx_path", "old_text", "new_text"],
+        },
+    ),
+    Tool(
+        name="set_paragraph_text",
+        description="HWPX 파일의 특정 단락 텍스트를 교체합니다.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwpx_path": {
+                    "type": "string",
+                    "description": "수정할 HWPX 파일 경로",
+                },
+                "index": {
+                    "type": "integer",
+                    "description": "단락 인덱스 (0-based)",
+                },
+                "text": {
+                    "type": "string",
+                    "description": "새 텍스트",
+                },
+                "char_style_id": {
+                    "type": "integer",
+                    "description": "문자 스타일 ID (기본: 0)",
+                    "default": 0,
+                },
+                "output_path": {
+                    "type": "string",
+                    "description": "출력 파일 경로 (옵션)",
                 },
-                "required": ["hwpx_path", "index", "text"],
             },
-        ),
-        # =====================================================================
-        # 단락 삽입/삭제
-        # =====================================================================
-        Tool(
-            name="insert_paragraph",
-            description="HWPX 파일에 새 단락을 삽입합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwpx_path": {
-                        "type": "string",
-                        "description": "수정할 HWPX 파일 경로",
-                    },
-                    "text": {
-                        "type": "string",
-                        "description": "삽입할 텍스트",
-                    },
-                    "position": {
-                        "type": "string",
-                        "enum": ["before", "after", "end"],
-                        "description": "삽입 위치 (before: 단락 앞, after: 단락 뒤, end: 문서 끝)",
-                        "default": "end",
-                    },
-                    "index": {
-                        "type": "integer",
-                        "description": "기준 단락 인덱스 (position이 before/after일 때 필수)",
-                    },
-                    "para_style_id": {
-                        "type": "integer",
-                        "description": "단락 스타일 ID (기본: 0)",
-                        "default": 0,
-                    },
-                    "char_style_id": {
-                        "type": "integer",
-                        "description": "문자 스타일 ID (기본: 0)",
-                        "default": 0,
-                    },
-                    "output_path": {
-                        "type": "string",
-                        "description": "출력 파일 경로 (옵션)",
-                    },
+            "required": ["hwpx_path", "index", "text"],
+        },
+    ),
+    # =====================================================================
+    # 단락 삽입/삭제
+    # =====================================================================
+    Tool(
+        name="insert_paragraph",
+        description="HWPX 파일에 새 단락을 삽입합니다.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwpx_path": {
+                    "type": "string",
+                    "description": "수정할 HWPX 파일 경로",
+                },
+                "text": {
+                    "type": "string",
+                    "description": "삽입할 텍스트",
+                },
+                "position": {
+                    "type": "string",
+                    "enum": ["before", "after", "end"],
+                    "description": "삽입 위치 (before: 단락 앞, after: 단락 뒤, end: 문서 끝)",
+                    "default": "end",
+                },
+                "index": {
+                    "type": "integer",
+                    "description": "기준 단락 인덱스 (position이 before/after일 때 필수)",
+                },
+                "para_style_id": {
+                    "type": "integer",
+                    "description": "단락 스타일 ID (기본: 0)",
+                    "default": 0,
+                },
+                "char_style_id": {
+                    "type": "integer",
+                    "description": "문자 스타일 ID (기본: 0)",
+                    "default": 0,
+                },
+                "output_path": {
+                    "type": "string",
+                    "description": "출력 파일 경로 (옵션)",
                 },
-                "required": ["hwpx_path", "text"],
             },
-        ),
-        Tool(
-            name="delete_paragraph",
-            description="HWPX 파일의 단락을 삭제합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwpx_path": {
-                        "type": "string",
-                        "description": "수정할 HWPX 파일 경로",
-                    },
-                    "index": {
-                        "type": "integer",
-                        "description": "삭제할 단락 인덱스",
-                    },
-                    "start": {
-                        "type": "integer",
-                        "description": "삭제 시작 인덱스 (범위 삭제시)",
-                    },
-                    "end": {
-                        "type": "integer",
-                        "description": "삭제 끝 인덱스 (범위 삭제시, exclusive)",
-                    },
-                    "output_path": {
-                        "type": "string",
-                        "description": "출력 파일 경로 (옵션)",
-                    },
+            "required": ["hwpx_path", "text"],
+        },
+    ),
+    Tool(
+        name="delete_paragraph",
+        description="HWPX 파일의 단락을 삭제합니다.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwpx_path": {
+                    "type": "string",
+                    "description": "수정할 HWPX 파일 경로",
+                },
+                "index": {
+                    "type": "integer",
+                    "description": "삭제할 단락 인덱스",
+                },
+                "start": {
+                    "type": "integer",
+                    "description": "삭제 시작 인덱스 (범위 삭제시)",
+                },
+                "end": {
+                    "type": "integer",
+                    "description": "삭제 끝 인덱스 (범위 삭제시, exclusive)",
+                },
+                "output_path": {
+                    "type": "string",
+                    "description": "출력 파일 경로 (옵션)",
                 },
-                "required": ["hwpx_path"],
             },
-        ),
-        # =====================================================================
-        # 단락 복사/이동
-        # =====================================================================
-        Tool(
-            name="copy_paragraph",
-            description="HWPX 파일의 단락을 복사합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwpx_path": {
-                        "type": "string",
-                        "description": "수정할 HWPX 파일 경로",
-                    },
-                    "from_index": {
-                        "type": "integer",
-                        "description": "복사할 단락 인덱스",
-                    },
-                    "to_index": {
-                        "type": "integer",
-                        "description": "복사 대상 위치 인덱스",
-                    },
-                    "output_path": {
-                        "type": "string",
-                        "description": "출력 파일 경로 (옵션)",
-                    },
+            "required": ["hwpx_path"],
+        },
+    ),
+    # =====================================================================
+    # 단락 복사/이동
+    # =====================================================================
+    Tool(
+        name="copy_paragraph",
+        description="HWPX 파일의 단락을 복사합니다.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwpx_path": {
+                    "type": "string",
+                    "description": "수정할 HWPX 파일 경로",
+                },
+                "from_index": {
+                    "type": "integer",
+                    "description": "복사할 단락 인덱스",
+                },
+                "to_index": {
+                    "type": "integer",
+                    "description": "복사 대상 위치 인덱스",
+                },
+                "output_path": {
+                    "type": "string",
+                    "description": "출력 파일 경로 (옵션)",
                 },
-                "required": ["hwpx_path", "from_index", "to_index"],
             },
-        ),
-        Tool(
-            name="move_paragraph",
-            description="HWPX 파일의 단락을 이동합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwpx_path": {
-                        "type": "string",
-                        "description": "수정할 HWPX 파일 경로",
-                    },
-                    "from_index": {
-                        "type": "integer",
-                        "description": "이동할 단락 인덱스",
-                    },
-                    "to_index": {
-                        "type": "integer",
-                        "description": "이동 대상 위치 인덱스",
-                    },
-                    "output_path": {
-                        "type": "string",
-                        "description": "출력 파일 경로 (옵션)",
-                    },
+            "required": ["hwpx_path", "from_index", "to_index"],
+        },
+    ),
+    Tool(
+        name="move_paragraph",
+        description="HWPX 파일의 단락을 이동합니다.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwpx_path": {
+                    "type": "string",
+                    "description": "수정할 HWPX 파일 경로",
+                },
+                "from_index": {
+                    "type": "integer",
+                    "description": "이동할 단락 인덱스",
+                },
+                "to_index": {
+                    "type": "integer",
+                    "description": "이동 대상 위치 인덱스",
+                },
+                "output_path": {
+                    "type": "string",
+                    "description": "출력 파일 경로 (옵션)",
                 },
-                "required": ["hwpx_path", "from_index", "to_index"],
             },
-        ),
-        # =====================================================================
-        # 스타일 변경
-        # =====================================================================
-        Tool(
-            name="set_paragraph_style",
-            description="HWPX 파일의 단락 스타일을 변경합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwpx_path": {
-                        "type": "string",
-                        "description": "수정할 HWPX 파일 경로",
-                    },
-                    "index": {
-                        "type": "integer",
-                        "description": "단락 인덱스",
-                    },
-                    "para_style_id": {
-                        "type": "integer",
-                        "description": "단락 스타일 ID",
-                    },
-                    "output_path": {
-                        "type": "string",
-                        "description": "출력 파일 경로 (옵션)",
-                    },
+            "required": ["hwpx_path", "from_index", "to_index"],
+        },
+    ),
+    # =====================================================================
+    # 스타일 변경
+    # =====================================================================
+    Tool(
+        name="set_paragraph_style",
+        description="HWPX 파일의 단락 스타일을 변경합니다.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwpx_path": {
+                    "type": "string",
+                    "description": "수정할 HWPX 파일 경로",
+                },
+                "index": {
+                    "type": "integer",
+                    "description": "단락 인덱스",
+                },
+                "para_style_id": {
+                    "type": "integer",
+                    "description": "단락 스타일 ID",
+                },
+                "output_path": {
+                    "type": "string",
+                    "description": "출력 파일 경로 (옵션)",
                 },
-                "required": ["hwpx_path", "index", "para_style_id"],
             },
-        ),
-        Tool(
-            name="set_char_style",
-            description="HWPX 파일의 단락 내 문자 스타일을 변경합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwpx_path": {
-                        "type": "string",
-                        "description": "수정할 HWPX 파일 경로",
-                    },
-                    "index": {
-                        "type": "integer",
-                        "description": "단락 인덱스",
-                    },
-                    "char_style_id": {
-                        "type": "integer",
-                        "description": "문자 스타일 ID",
-                    },
-                    "output_path": {
-                        "type": "string",
-                        "description": "출력 파일 경로 (옵션)",
-                    },
+            "required": ["hwpx_path", "index", "para_style_id"],
+        },
+    ),
+    Tool(
+        name="set_char_style",
+        description="HWPX 파일의 단락 내 문자 스타일을 변경합니다.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwpx_path": {
+                    "type": "string",
+                    "description": "수정할 HWPX 파일 경로",
+                },
+                "index": {
+                    "type": "integer",
+                    "description": "단락 인덱스",
+                },
+                "char_style_id": {
+                    "type": "integer",
+                    "description": "문자 스타일 ID",
+                },
+                "output_path": {
+                    "type": "string",
+                    "description": "출력 파일 경로 (옵션)",
                 },
-                "required": ["hwpx_path", "index", "char_style_id"],
             },
-        ),
-        # =====================================================================
-        # 페이지/열 브레이크
-        # =====================================================================
-        Tool(
-            name="set_page_break",
-            description="HWPX 파일의 단락에 페이지 브레이크를 설정합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwpx_path": {
-                        "type": "string",
-                        "description": "수정할 HWPX 파일 경로",
-                    },
-                    "index": {
-                        "type": "integer",
-                        "description": "단락 인덱스",
-                    },
-                    "enable": {
-                        "type": "boolean",
-                        "description": "페이지 브레이크 활성화 여부 (기본: true)",
-                        "default": True,
-                    },
-                    "output_path": {
-                        "type": "string",
-                        "description": "출력 파일 경로 (옵션)",
-                    },
+            "required": ["hwpx_path", "index", "char_style_id"],
+        },
+    ),
+    # =====================================================================
+    # 페이지/열 브레이크
+    # =====================================================================
+    Tool(
+        name="set_page_break",
+        description="HWPX 파일의 단락에 페이지 브레이크를 설정합니다.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwpx_path": {
+                    "type": "string",
+                    "description": "수정할 HWPX 파일 경로",
+                },
+                "index": {
+                    "type": "integer",
+                    "description": "단락 인덱스",
+                },
+                "enable": {
+                    "type": "boolean",
+                    "description": "페이지 브레이크 활성화 여부 (기본: true)",
+                    "default": True,
+                },
+                "output_path": {
+                    "type": "string",
+                    "description": "출력 파일 경로 (옵션)",
                 },
-                "required": ["hwpx_path", "index"],
             },
-        ),
-        Tool(
-            name="set_column_break",
-            description="HWPX 파일의 단락에 열 브레이크를 설정합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwpx_path": {
-                        "type": "string",
-                        "description": "수정할 HWPX 파일 경로",
-                    },
-                    "index": {
-                        "type": "integer",
-                        "description": "단락 인덱스",
-                    },
-                    "enable": {
-                        "type": "boolean",
-                        "description": "열 브레이크 활성화 여부 (기본: true)",
-                        "default": True,
-                    },
-                    "output_path": {
-                        "type": "string",
-                        "description": "출력 파일 경로 (옵션)",
-                    },
+            "required": ["hwpx_path", "index"],
+        },
+    ),
+    Tool(
+        name="set_column_break",
+        description="HWPX 파일의 단락에 열 브레이크를 설정합니다.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwpx_path": {
+                    "type": "string",
+                    "description": "수정할 HWPX 파일 경로",
+                },
+                "index": {
+                    "type": "integer",
+                    "description": "단락 인덱스",
+                },
+                "enable": {
+                    "type": "boolean",
+                    "description": "열 브레이크 활성화 여부 (기본: true)",
+                    "default": True,
+                },
+                "output_path": {
+                    "type": "string",
+                    "description": "출력 파일 경로 (옵션)",
                 },
-                "required": ["hwpx_path", "index"],
             },
-        ),
-        # =====================================================================
-        # 테이블 삽입
-        # =====================================================================
-        Tool(
-            name="insert_table",
-            description="HWPX 파일에 테이블을 삽입합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwpx_path": {
-                        "type": "string",
-                        "description": "수정할 HWPX 파일 경로",
-                    },
-                    "after_index": {
-                        "type": "integer",
-                        "description": "삽입 위치 (이 단락 뒤에 삽입)",
-                    },
-                    "rows": {
-                        "type": "integer",
-                        "description": "행 수",
-                    },
-                    "cols": {
-                        "type": "integer",
-                        "description": "열 수",
-                    },
-                    "data": {
-                        "type": "array",
-                        "items": {
-                            "type": "array",
-                            "items": {"type": "string"}
-                        },
-                        "description": "테이블 데이터 (2D 문자열 배열, 옵션)",
-                    },
-                    "col_widths": {
+            "required": ["hwpx_path", "index"],
+        },
+    ),
+    # =====================================================================
+    # 테이블 삽입
+    # =====================================================================
+    Tool(
+        name="insert_table",
+        description="HWPX 파일에 테이블을 삽입합니다.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwpx_path": {
+                    "type": "string",
+                    "description": "수정할 HWPX 파일 경로",
+                },
+                "after_index": {
+                    "type": "integer",
+                    "description": "삽입 위치 (이 단락 뒤에 삽입)",
+                },
+                "rows": {
+                    "type": "integer",
+                    "description": "행 수",
+                },
+                "cols": {
+                    "type": "integer",
+                    "description": "열 수",
+                },
+                "data": {
+                    "type": "array",
+                    "items": {
                         "type": "array",
-                        "items": {"type": "integer"},
-                        "description": "열 너비 배열 (HWPUNIT, 옵션)",
-                    },
-                    "output_path": {
-                        "type": "string",
-                        "description": "출력 파일 경로 (옵션)",
+                        "items": {"type": "string"}
                     },
+                    "description": "테이블 데이터 (2D 문자열 배열, 옵션)",
+                },
+                "col_widths": {
+                    "type": "array",
+                    "items": {"type": "integer"},
+                    "description": "열 너비 배열 (HWPUNIT, 옵션)",
+                },
+                "output_path": {
+                    "type": "string",
+                    "description": "출력 파일 경로 (옵션)",
                 },
-                "required": ["hwpx_path", "after_index", "rows", "cols"],
             },
+            "required": ["hwpx_path", "after_index", "rows", "cols"],
+        },
+    ),
+    # =====================================================================
+    # 이미지 삽입
+    # =====================================================================
+    Tool(
+        name="insert_image",
+        description=(
+            "HWPX 파일에 이미지를 삽입합니다. "
+            "이미지 바이너리는 별도로 BinData/에 추가해야 합니다."
         ),
-        # =====================================================================
-        # 이미지 삽입
-        # =====================================================================
-        Tool(
-            name="insert_image",
-            description="HWPX 파일에 이미지를 삽입합니다. 이미지 바이너리는 별도로 BinData/에 추가해야 합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hwpx_path": {
-                        "type": "string",
-                        "description": "수정할 HWPX 파일 경로",
-                    },
-                    "after_index": {
-                        "type": "integer",
-                        "description": "삽입 위치 (이 단락 뒤에 삽입)",
-                    },
-                    "binary_item_id": {
-                        "type": "string",
-                        "description": "BinData 항목 ID (예: 'IMG1')",
-                    },
-                    "width": {
-                        "type": "integer",
-                        "description": "너비 (HWPUNIT)",
-                    },
-                    "height": {
-                        "type": "integer",
-                        "description": "높이 (HWPUNIT)",
-                    },
-                    "output_path": {
-                        "type": "string",
-                        "description": "출력 파일 경로 (옵션)",
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwpx_path": {
+                    "type": "string",
+                    "description": "수정할 HWPX 파일 경로",
+                },
+                "after_index": {
+                    "type": "integer",
+                    "description": "삽입 위치 (이 단락 뒤에 삽입)",
+                },
+                "binary_item_id": {
+                    "type": "string",
+                    "description": "BinData 항목 ID (예: 'IMG1')",
+                },
+                "width": {
+                    "type": "integer",
+                    "description": "너비 (HWPUNIT)",
+                },
+                "height": {
+                    "type": "integer",
+                    "description": "높이 (HWPUNIT)",
+                },
+                "output_path": {
+                    "type": "string",
+                    "description": "출력 파일 경로 (옵션)",
                 },
-                "required": ["hwpx_path", "after_index", "binary_item_id", "width", "height"],
             },
+            "required": ["hwpx_path", "after_index", "binary_item_id", "width", "height"],
+        },
+    ),
+    # =====================================================================
+    # 일괄 편집
+    # =====================================================================
+    Tool(
+        name="batch_edit",
+        description=(
+            "HWPX 파일에 여러 편집 작업을 한 번에 적용합니다 (파일을 한 번만 읽고 한 번만 저장). "
+            "하나라도 실패하면 아무것도 저장하지 않습니다."
         ),
-    ]
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hwpx_path": {
+                    "type": "string",
+                    "description": "수정할 HWPX 파일 경로",
+                },
+                "operations": {
+                    "type": "array",
+                    "description": "순서대로 적용할 편집 작업 목록",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "op": {
+                                "type": "string",
+                                "enum": [
+                                    "replace_text", "set_paragraph_text",
+                                    "insert_paragraph", "delete_paragraph",
+                                    "copy_paragraph", "move_paragraph",
+                                    "set_paragraph_style", "set_char_style",
+                                    "set_page_break", "set_column_break",
+                                    "insert_table", "insert_image",
+                                ],
+                                "description": "편집 도구 이름",
+                            },
+                            "args": {
+                                "type": "object",
+                                "description": "해당 도구의 인자 (hwpx_path, output_path 제외)",
+                            },
+                        },
+                        "required": ["op"],
+                    },
+                },
+                "output_path": {
+                    "type": "string",
+                    "description": "출력 파일 경로 (옵션, 기본: 원본 파일 덮어쓰기)",
+                },
+            },
+            "required": ["hwpx_path", "operations"],
+        },
+    ),
+]
+
+
+@server.list_tools()
+async def list_tools() -> list[Tool]:
+    """사용 가능한 도구 목록"""
+    return _TOOLS
 
 
 # =============================================================================
@@ -630,41 +758,22 @@ async def list_tools() -> list[Tool]:
 @server.call_tool()
 async def call_tool(name: str, arguments: dict[str, Any]) -> CallToolResult:
     """도구 실행"""
-    try:
-        # 도구 이름을 함수에 매핑
-        tool_handlers = {
-            "convert_pdf_to_hwpx": handle_convert_pdf_to_hwpx,
-            "convert_pdf_bytes_to_hwpx": handle_convert_pdf_bytes_to_hwpx,
-            "get_hwpx_info": handle_get_hwpx_info,
-            "get_hwpx_text": handle_get_hwpx_text,
-            "get_hwpx_paragraph": handle_get_hwpx_paragraph,
-            "get_hwpx_tables": handle_get_hwpx_tables,
-            "get_hwpx_images": handle_get_hwpx_images,
-            "find_page_breaks": handle_find_page_breaks,
-            "search_hwpx": handle_search_hwpx,
-            "search_hwpx_regex": handle_search_hwpx_regex,
-            "replace_text": handle_replace_text,
-            "set_paragraph_text": handle_set_paragraph_text,
-            "insert_paragraph": handle_insert_paragraph,
-            "delete_paragraph": handle_delete_paragraph,
-            "copy_paragraph": handle_copy_paragraph,
-            "move_paragraph": handle_move_paragraph,
-            "set_paragraph_style": handle_set_paragraph_style,
-            "set_char_style": handle_set_char_style,
-            "set_page_break": handle_set_page_break,
-            "set_column_break": handle_set_column_break,
-            "insert_table": handle_insert_table,
-            "insert_image": handle_insert_image,
-        }
+    global _edit_lock
+    handler = _TOOL_HANDLERS.get(name)
+    if handler is None:
+        return CallToolResult(
+            content=[TextContent(type="text", text=f"Unknown tool: {name}")],
+            isError=True,
+        )
 
-        handler = tool_handlers.get(name)
-        if handler:
-            return await handler(arguments)
-        else:
-            return CallToolResult(
-                content=[TextContent(type="text", text=f"Unknown tool: {name}")],
-                isError=True,
-            )
+    if name in _EDIT_TOOLS and _edit_lock is None:
+        _edit_lock = asyncio.Lock()
+
+    try:
+        if name in _EDIT_TOOLS:
+            async with _edit_lock:
+                return await handler(arguments)
+        return await handler(arguments)
     except Exception as e:
         return CallToolResult(
             content=[TextContent(type="text", text=f"Error: {str(e)}")],
@@ -676,37 +785,204 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> CallToolResult:
 # Helper Functions
 # =============================================================================
 
-def _load_section_xml(hwpx_path: Path) -> bytes:
-    """HWPX 파일에서 section0.xml 로드"""
-    with zipfile.ZipFile(hwpx_path, "r") as zf:
+def _file_key(hwpx_path: Path, st: os.stat_result) -> Tuple[str, int, int, int]:
+    """파일 버전 캐시 키 (경로, inode, mtime, 크기)"""
+    return str(hwpx_path.absolute()), st.st_ino, st.st_mtime_ns, st.st_size
+
+
+def _load_section_xml(hwpx_path: Path, st: os.stat_result) -> bytes:
+    """HWPX 파일에서 section0.xml 로드 (파일이 바뀌지 않았으면 캐시 사용)"""
+    return _read_section_xml(*_file_key(hwpx_path, st))
+
+
+@functools.lru_cache(maxsize=32)
+def _read_section_xml(path: str, ino: int, mtime_ns: int, size: int) -> bytes:
+    """section0.xml 읽기 - (경로, inode, mtime, 크기)가 같으면 재사용"""
+    with zipfile.ZipFile(path, "r") as zf:
         return zf.read("Contents/section0.xml")
 
 
-def _save_hwpx(hwpx_path: Path, output_path: Path, section_xml: bytes):
-    """수정된 section XML로 HWPX 파일 저장"""
-    with zipfile.ZipFile(hwpx_path, "r") as zf_in:
-        with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zf_out:
-            for item in zf_in.namelist():
-                if item == "Contents/section0.xml":
-                    zf_out.writestr(item, section_xml)
-                else:
-                    zf_out.writestr(item, zf_in.read(item))
-
-
-def _get_searcher(hwpx_path: Path):
-    """HwpxSearcher 인스턴스 생성"""
+@functools.lru_cache(maxsize=8)
+def _read_searcher(path: str, ino: int, mtime_ns: int, size: int):
+    """파싱된 HwpxSearcher - 읽기 전용이므로 같은 파일 버전이면 공유
+
+    section0.xml은 _read_section_xml 캐시에서 가져옵니다 (핸들러가 미리 스레드에서 읽어 둠).
+    """
     from pdf2hwpx.hwpx_ir.components.query import HwpxSearcher
-    section_xml = _load_section_xml(hwpx_path)
-    return HwpxSearcher(section_xml)
+    return HwpxSearcher(_read_section_xml(path, ino, mtime_ns, size))
+
+
+@functools.lru_cache(maxsize=64)
+def _read_counts(path: str, ino: int, mtime_ns: int, size: int) -> dict:
+    """단락/테이블/이미지/브레이크 수와 포함된 파일 목록 - 전체 트리를 만들지 않고 스트리밍 집계
+
+    반환된 dict는 캐시와 공유되므로 호출자가 수정하면 안 됩니다.
+    """
+    from pdf2hwpx.hwpx_ir.components.query.searcher import count_section_elements
+
+    with zipfile.ZipFile(path, "r") as zf:
+        with zf.open("Contents/section0.xml") as stream:
+            counts = count_section_elements(stream)
+        counts["files"] = zf.namelist()
+
+    return counts
+
+
+@functools.lru_cache(maxsize=64)
+def _read_metadata(path: str, ino: int, mtime_ns: int, size: int) -> dict:
+    """읽기 전용 메타데이터 (테이블/이미지/페이지 브레이크) - 같은 파일 버전이면 재사용
+
+    반환된 dict는 캐시와 공유되므로 호출자가 수정하면 안 됩니다.
+    """
+    searcher = _read_searcher(path, ino, mtime_ns, size)
+
+    return {
+        "tables": searcher.get_tables_info(),
+        "images": searcher.get_images_info(),
+        "page_breaks": [{
+            "paragraph_index": b.paragraph_index,
+            "paragraph_id": b.paragraph_id,
+            "break_type": b.break_type,
+            "text_preview": b.text_preview,
+        } for b in searcher.find_page_breaks()],
+    }
 
 
-def _get_editor(hwpx_path: Path):
-    """HwpxEditor 인스턴스 생성"""
+@functools.lru_cache(maxsize=64)
+def _read_metadata_json(field: str, path: str, ino: int, mtime_ns: int, size: int) -> str:
+    """메타데이터 항목의 JSON 문자열 - 같은 파일 버전이면 직렬화 결과도 재사용"""
+    return _dumps(_read_metadata(path, ino, mtime_ns, size)[field])
+
+
+def _save_hwpx(hwpx_path: Path, output_path: Path, section_xml: bytes):
+    """수정된 section XML로 HWPX 파일 저장
+
+    변경되지 않은 항목은 압축을 풀지 않고 압축된 데이터 그대로 복사합니다 (재압축 없음).
+    원본을 읽는 도중 덮어쓰지 않도록 같은 디렉터리의 임시 파일에 쓰고 fsync한 뒤 교체합니다.
+    """
+    fd, tmp_name = tempfile.mkstemp(suffix=".hwpx", dir=output_path.parent)
+    try:
+        with os.fdopen(fd, "wb") as tmp_file, open(hwpx_path, "rb") as src_file:
+            with zipfile.ZipFile(src_file, "r") as zf_in:
+                with zipfile.ZipFile(tmp_file, "w", zipfile.ZIP_DEFLATED) as zf_out:
+                    for info in zf_in.infolist():
+                        if info.filename == "Contents/section0.xml":
+                            zf_out.writestr(
+                                info.filename,
+                                section_xml,
+                                compress_type=zipfile.ZIP_DEFLATED,
+                                compresslevel=_SAVE_COMPRESSLEVEL,
+                            )
+                            continue
+                        _copy_zip_member_raw(src_file, tmp_file, zf_out, info)
+            # 교체 전에 디스크에 기록해, 중간에 죽어도 반쯤 쓴 파일이 원본 자리에 남지 않도록 함
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+        shutil.copymode(hwpx_path, tmp_name)
+        os.replace(tmp_name, output_path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_name)
+        raise
+
+
+def _copy_zip_member_raw(
+    src: BinaryIO, dst: BinaryIO, zf_out: zipfile.ZipFile, info: zipfile.ZipInfo
+) -> None:
+    """zip 항목을 압축된 데이터 그대로 복사 (압축 해제/재압축 없음)
+
+    zipfile에는 원시 복사 API가 없으므로 로컬 헤더를 직접 쓰고 zf_out의
+    중앙 디렉터리 목록에 등록합니다.
+    """
+    # 원본 로컬 헤더 뒤 (파일명 + extra 필드 다음)가 압축 데이터 시작 위치
+    src.seek(info.header_offset)
+    fields = struct.unpack(zipfile.structFileHeader, src.read(zipfile.sizeFileHeader))
+    src.seek(fields[-2] + fields[-1], os.SEEK_CUR)
+
+    out_info = zipfile.ZipInfo(info.filename, info.date_time)
+    out_info.compress_type = info.compress_type
+    out_info.external_attr = info.external_attr
+    # 크기/CRC를 로컬 헤더에 바로 쓰므로 데이터 디스크립터 플래그(bit 3)는 제거
+    out_info.flag_bits = info.flag_bits & ~0x08
+    out_info.CRC = info.CRC
+    out_info.compress_size = info.compress_size
+    out_info.file_size = info.file_size
+    out_info.header_offset = dst.tell()
+    dst.write(out_info.FileHeader())
+
+    remaining = info.compress_size
+    while remaining:
+        chunk = src.read(min(_COPY_BUFSIZE, remaining))
+        if not chunk:
+            raise zipfile.BadZipFile(f"Truncated zip member: {info.filename}")
+        dst.write(chunk)
+        remaining -= len(chunk)
+
+    zf_out.filelist.append(out_info)
+    zf_out.NameToInfo[out_info.filename] = out_info
+    zf_out.start_dir = dst.tell()
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_regex(pattern: str, ignore_case: bool) -> re.Pattern:
+    """검색 정규식 컴파일 (같은 패턴 반복 호출 시 재사용)"""
+    return re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+
+
+async def _get_searcher(hwpx_path: Path, st: os.stat_result):
+    """HwpxSearcher 인스턴스 (파일이 바뀌지 않았으면 캐시 사용)
+
+    zip 읽기/압축 해제는 이벤트 루프 밖 스레드에서 하고, 파싱만 루프 스레드에서 합니다.
+    """
+    await asyncio.to_thread(_load_section_xml, hwpx_path, st)
+    return _read_searcher(*_file_key(hwpx_path, st))
+
+
+async def _get_editor(hwpx_path: Path, st: os.stat_result):
+    """HwpxEditor 인스턴스 생성 (zip 읽기는 이벤트 루프 밖 스레드에서)"""
     from pdf2hwpx.hwpx_ir.components.query import HwpxEditor
-    section_xml = _load_section_xml(hwpx_path)
+    section_xml = await asyncio.to_thread(_load_section_xml, hwpx_path, st)
     return HwpxEditor(section_xml)
 
 
+def _convert_pdf(pdf_path: Path, output_path: Path, backend: str) -> Path:
+    """PDF 파일 → HWPX 파일 변환 (워커에서 실행)"""
+    converter = Pdf2Hwpx(backend=backend)
+    return converter.convert(pdf_path, output_path)
+
+
+def _convert_pdf_bytes(
+    pdf_bytes: bytes, backend: str, output_path: Optional[Path] = None
+) -> Tuple[Optional[bytes], Optional[Path]]:
+    """PDF 바이트 → HWPX 변환 (워커에서 실행)
+
+    output_path가 있거나 결과가 크면 워커에서 바로 파일로 쓰고 경로만 돌려줌
+    (큰 결과를 서버 프로세스로 다시 보내 이벤트 루프에서 쓰지 않도록).
+
+    Returns:
+        (인라인으로 반환할 HWPX 바이트, 저장한 파일 경로) 중 하나만 값이 있음
+    """
+    converter = Pdf2Hwpx(backend=backend)
+    hwpx_bytes = converter.convert_bytes(pdf_bytes)
+
+    if output_path is None:
+        if len(hwpx_bytes) <= _INLINE_HWPX_MAX_BYTES:
+            return hwpx_bytes, None
+        # 같은 PDF/백엔드는 같은 파일을 덮어써 반복 변환해도 파일이 쌓이지 않음
+        digest = hashlib.sha256(pdf_bytes).hexdigest()[:32]
+        _OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+        output_path = _OUTPUT_DIR / f"{digest}-{backend}.hwpx"
+
+    output_path.write_bytes(hwpx_bytes)
+    return None, output_path
+
+
+async def _run_in_executor(func, *args):
+    """블로킹 변환 작업을 워커 프로세스에서 실행 (func과 인자는 pickle 가능해야 함)"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_CONVERT_EXECUTOR, func, *args)
+
+
 def _check_file_exists(path: Path) -> Optional[CallToolResult]:
     """파일 존재 여부 확인"""
     if not path.exists():
@@ -717,6 +993,33 @@ def _check_file_exists(path: Path) -> Optional[CallToolResult]:
     return None
 
 
+def _stat_file(path: Path) -> Tuple[Optional[os.stat_result], Optional[CallToolResult]]:
+    """파일 stat (존재 확인 겸용) - 결과를 재사용해 중복 syscall 방지"""
+    try:
+        return path.stat(), None
+    except OSError:
+        return None, CallToolResult(
+            content=[TextContent(type="text", text=f"파일을 찾을 수 없습니다: {path}")],
+            isError=True,
+        )
+
+
+def _with_hwpx_file(handler):
+    """hwpx_path를 Path로 변환하고 stat까지 마친 뒤 핸들러에 (args, hwpx_path, st)로 전달
+
+    파일이 없으면 핸들러를 호출하지 않고 오류 결과를 반환합니다.
+    """
+    @functools.wraps(handler)
+    async def wrapper(args: dict) -> CallToolResult:
+        hwpx_path = Path(args["hwpx_path"])
+        st, error = _stat_file(hwpx_path)
+        if error:
+            return error
+        return await handler(args, hwpx_path, st)
+
+    return wrapper
+
+
 # =============================================================================
 # PDF 변환 Handlers
 # =============================================================================
@@ -735,8 +1038,7 @@ async def handle_convert_pdf_to_hwpx(args: dict) -> CallToolResult:
     else:
         output_path = Path(output_path)
 
-    converter = Pdf2Hwpx(backend=backend)
-    result = converter.convert(pdf_path, output_path)
+    result = await _run_in_executor(_convert_pdf, pdf_path, output_path, backend)
 
     return CallToolResult(
         content=[TextContent(type="text", text=f"변환 완료: {result}")]
@@ -747,11 +1049,22 @@ async def handle_convert_pdf_bytes_to_hwpx(args: dict) -> CallToolResult:
     """PDF 바이트를 HWPX 바이트로 변환"""
     pdf_base64 = args["pdf_base64"]
     backend = args.get("backend", "pymupdf")
+    output_path = args.get("output_path")
 
-    pdf_bytes = base64.b64decode(pdf_base64)
-    converter = Pdf2Hwpx(backend=backend)
-    hwpx_bytes = converter.convert_bytes(pdf_bytes)
-    hwpx_base64 = base64.b64encode(hwpx_bytes).decode("utf-8")
+    # ASCII str을 그대로 디코딩 (bytes로 인코딩하는 중간 복사본을 만들지 않음)
+    pdf_bytes = binascii.a2b_base64(pdf_base64)
+    if output_path is not None:
+        output_path = Path(output_path)
+    hwpx_bytes, output_path = await _run_in_executor(
+        _convert_pdf_bytes, pdf_bytes, backend, output_path
+    )
+
+    if output_path is not None:
+        return CallToolResult(
+            content=[TextContent(type="text", text=f"변환 완료: {output_path}")]
+        )
+
+    hwpx_base64 = base64.b64encode(hwpx_bytes).decode("ascii")
 
     return CallToolResult(
         content=[TextContent(type="text", text=hwpx_base64)]
@@ -762,41 +1075,31 @@ async def handle_convert_pdf_bytes_to_hwpx(args: dict) -> CallToolResult:
 # 정보 조회 Handlers
 # =============================================================================
 
-async def handle_get_hwpx_info(args: dict) -> CallToolResult:
+@_with_hwpx_file
+async def handle_get_hwpx_info(args: dict, hwpx_path: Path, st: os.stat_result) -> CallToolResult:
     """HWPX 파일 정보"""
-    hwpx_path = Path(args["hwpx_path"])
-
-    if error := _check_file_exists(hwpx_path):
-        return error
-
-    searcher = _get_searcher(hwpx_path)
-
-    with zipfile.ZipFile(hwpx_path, "r") as zf:
-        file_list = zf.namelist()
+    counts = await asyncio.to_thread(_read_counts, *_file_key(hwpx_path, st))
 
     info = {
         "파일": str(hwpx_path),
-        "단락 수": searcher.get_paragraph_count(),
-        "테이블 수": len(searcher.get_tables_info()),
-        "이미지 수": len(searcher.get_images_info()),
-        "추정 페이지 수": searcher.get_page_count_estimate(),
-        "포함된 파일": file_list,
+        "단락 수": counts["paragraphs"],
+        "테이블 수": counts["tables"],
+        "이미지 수": counts["images"],
+        "추정 페이지 수": counts["page_breaks"] + 1,
+        "포함된 파일": counts["files"],
     }
 
     return CallToolResult(
-        content=[TextContent(type="text", text=json.dumps(info, ensure_ascii=False, indent=2))]
+        content=[TextContent(type="text", text=_dumps(info))]
     )
 
 
-async def handle_get_hwpx_text(args: dict) -> CallToolResult:
+@_with_hwpx_file
+async def handle_get_hwpx_text(args: dict, hwpx_path: Path, st: os.stat_result) -> CallToolResult:
     """HWPX 전체/페이지별 텍스트 추출"""
-    hwpx_path = Path(args["hwpx_path"])
     page = args.get("page")
 
-    if error := _check_file_exists(hwpx_path):
-        return error
-
-    searcher = _get_searcher(hwpx_path)
+    searcher = await _get_searcher(hwpx_path, st)
 
     if page is not None:
         text = searcher.get_text_by_page(page)
@@ -810,17 +1113,16 @@ async def handle_get_hwpx_text(args: dict) -> CallToolResult:
     )
 
 
-async def handle_get_hwpx_paragraph(args: dict) -> CallToolResult:
+@_with_hwpx_file
+async def handle_get_hwpx_paragraph(
+    args: dict, hwpx_path: Path, st: os.stat_result
+) -> CallToolResult:
     """HWPX 단락 조회"""
-    hwpx_path = Path(args["hwpx_path"])
     index = args.get("index")
     start = args.get("start")
     end = args.get("end")
 
-    if error := _check_file_exists(hwpx_path):
-        return error
-
-    searcher = _get_searcher(hwpx_path)
+    searcher = await _get_searcher(hwpx_path, st)
 
     if index is not None:
         para = searcher.get_paragraph(index)
@@ -854,515 +1156,490 @@ async def handle_get_hwpx_paragraph(args: dict) -> CallToolResult:
         )
 
     return CallToolResult(
-        content=[TextContent(type="text", text=json.dumps(result, ensure_ascii=False, indent=2))]
+        content=[TextContent(type="text", text=_dumps(result))]
     )
 
 
-async def handle_get_hwpx_tables(args: dict) -> CallToolResult:
+@_with_hwpx_file
+async def handle_get_hwpx_tables(args: dict, hwpx_path: Path, st: os.stat_result) -> CallToolResult:
     """HWPX 테이블 정보"""
-    hwpx_path = Path(args["hwpx_path"])
-
-    if error := _check_file_exists(hwpx_path):
-        return error
-
-    searcher = _get_searcher(hwpx_path)
-    tables = searcher.get_tables_info()
-
-    return CallToolResult(
-        content=[TextContent(type="text", text=json.dumps(tables, ensure_ascii=False, indent=2))]
-    )
+    await asyncio.to_thread(_load_section_xml, hwpx_path, st)
+    text = _read_metadata_json("tables", *_file_key(hwpx_path, st))
+    return CallToolResult(content=[TextContent(type="text", text=text)])
 
 
-async def handle_get_hwpx_images(args: dict) -> CallToolResult:
+@_with_hwpx_file
+async def handle_get_hwpx_images(args: dict, hwpx_path: Path, st: os.stat_result) -> CallToolResult:
     """HWPX 이미지 정보"""
-    hwpx_path = Path(args["hwpx_path"])
+    await asyncio.to_thread(_load_section_xml, hwpx_path, st)
+    text = _read_metadata_json("images", *_file_key(hwpx_path, st))
+    return CallToolResult(content=[TextContent(type="text", text=text)])
 
-    if error := _check_file_exists(hwpx_path):
-        return error
-
-    searcher = _get_searcher(hwpx_path)
-    images = searcher.get_images_info()
 
-    return CallToolResult(
-        content=[TextContent(type="text", text=json.dumps(images, ensure_ascii=False, indent=2))]
-    )
-
-
-async def handle_find_page_breaks(args: dict) -> CallToolResult:
+@_with_hwpx_file
+async def handle_find_page_breaks(
+    args: dict, hwpx_path: Path, st: os.stat_result
+) -> CallToolResult:
     """페이지 브레이크 찾기"""
-    hwpx_path = Path(args["hwpx_path"])
-
-    if error := _check_file_exists(hwpx_path):
-        return error
-
-    searcher = _get_searcher(hwpx_path)
-    breaks = searcher.find_page_breaks()
-
-    result = [{
-        "paragraph_index": b.paragraph_index,
-        "paragraph_id": b.paragraph_id,
-        "break_type": b.break_type,
-        "text_preview": b.text_preview,
-    } for b in breaks]
-
-    return CallToolResult(
-        content=[TextContent(type="text", text=json.dumps(result, ensure_ascii=False, indent=2))]
-    )
+    await asyncio.to_thread(_load_section_xml, hwpx_path, st)
+    text = _read_metadata_json("page_breaks", *_file_key(hwpx_path, st))
+    return CallToolResult(content=[TextContent(type="text", text=text)])
 
 
 # =============================================================================
 # 검색 Handlers
 # =============================================================================
 
-async def handle_search_hwpx(args: dict) -> CallToolResult:
+def _search_header(results: list) -> str:
+    """검색 결과 개수 헤더 (표시 한도를 넘으면 정확한 총수 대신 '이상'으로 표기)"""
+    if len(results) > _SEARCH_LIMIT:
+        return f"검색 결과: {_SEARCH_LIMIT}개 이상 (처음 {_SEARCH_LIMIT}개만 표시)\n\n"
+    return f"검색 결과: {len(results)}개\n\n"
+
+
+@_with_hwpx_file
+async def handle_search_hwpx(args: dict, hwpx_path: Path, st: os.stat_result) -> CallToolResult:
     """HWPX에서 텍스트 검색"""
-    hwpx_path = Path(args["hwpx_path"])
-    query = args["query"]
+    query = args.get("query")
+    queries = args.get("queries")
     case_sensitive = args.get("case_sensitive", False)
 
-    if error := _check_file_exists(hwpx_path):
-        return error
+    if query is None and not queries:
+        return CallToolResult(
+            content=[TextContent(type="text", text="query 또는 queries를 지정해주세요.")],
+            isError=True,
+        )
 
-    searcher = _get_searcher(hwpx_path)
-    results = searcher.search(query, case_sensitive=case_sensitive)
+    searcher = await _get_searcher(hwpx_path, st)
+    if queries:
+        # 여러 검색어는 하나의 패턴으로 묶어 단락을 한 번만 순회
+        terms = queries + [query] if query is not None else queries
+        results = searcher.search_any(terms, case_sensitive=case_sensitive, limit=_SEARCH_LIMIT + 1)
+    else:
+        results = searcher.search(query, case_sensitive=case_sensitive, limit=_SEARCH_LIMIT + 1)
 
     if not results:
         return CallToolResult(
             content=[TextContent(type="text", text="검색 결과가 없습니다.")]
         )
 
-    output = f"검색 결과: {len(results)}개\n\n"
-    for i, r in enumerate(results[:20]):
-        output += f"{i+1}. 단락 {r.paragraph_index} (페이지 ~{r.page_estimate}): {r.context}\n"
-
-    if len(results) > 20:
-        output += f"\n... 외 {len(results) - 20}개"
+    output = _search_header(results)
+    for i, r in enumerate(results[:_SEARCH_LIMIT]):
+        matched = f"[{r.text[r.match_start:r.match_end]}] " if queries else ""
+        output += (
+            f"{i+1}. 단락 {r.paragraph_index} (페이지 ~{r.page_estimate}): "
+            f"{matched}{r.context}\n"
+        )
 
     return CallToolResult(
         content=[TextContent(type="text", text=output)]
     )
 
 
-async def handle_search_hwpx_regex(args: dict) -> CallToolResult:
+@_with_hwpx_file
+async def handle_search_hwpx_regex(
+    args: dict, hwpx_path: Path, st: os.stat_result
+) -> CallToolResult:
     """HWPX에서 정규식 검색"""
-    import re
-
-    hwpx_path = Path(args["hwpx_path"])
     pattern = args["pattern"]
     ignore_case = args.get("ignore_case", False)
 
-    if error := _check_file_exists(hwpx_path):
-        return error
-
-    searcher = _get_searcher(hwpx_path)
-    flags = re.IGNORECASE if ignore_case else 0
-    results = searcher.search_regex(pattern, flags=flags)
+    searcher = await _get_searcher(hwpx_path, st)
+    results = searcher.search_regex(_compile_regex(pattern, ignore_case), limit=_SEARCH_LIMIT + 1)
 
     if not results:
         return CallToolResult(
             content=[TextContent(type="text", text="검색 결과가 없습니다.")]
         )
 
-    output = f"검색 결과: {len(results)}개\n\n"
-    for i, r in enumerate(results[:20]):
+    output = _search_header(results)
+    for i, r in enumerate(results[:_SEARCH_LIMIT]):
         output += f"{i+1}. 단락 {r.paragraph_index}: {r.context}\n"
 
-    if len(results) > 20:
-        output += f"\n... 외 {len(results) - 20}개"
-
     return CallToolResult(
         content=[TextContent(type="text", text=output)]
     )
 
 
 # =============================================================================
-# 텍스트 편집 Handlers
+# 편집 작업 (단일 편집 도구와 batch_edit 공용)
 # =============================================================================
 
-async def handle_replace_text(args: dict) -> CallToolResult:
-    """텍스트 치환"""
-    hwpx_path = Path(args["hwpx_path"])
-    old_text = args["old_text"]
-    new_text = args["new_text"]
-    count = args.get("count", -1)
-    output_path = Path(args.get("output_path", str(hwpx_path)))
-
-    if error := _check_file_exists(hwpx_path):
-        return error
-
-    editor = _get_editor(hwpx_path)
-    replaced = editor.replace_text(old_text, new_text, count=count)
-
+def _edit_op_replace_text(editor, args: dict) -> Tuple[bool, str]:
+    replaced = editor.replace_text(args["old_text"], args["new_text"], count=args.get("count", -1))
     if replaced == 0:
-        return CallToolResult(
-            content=[TextContent(type="text", text=f"'{old_text}'를 찾을 수 없습니다.")]
-        )
-
-    _save_hwpx(hwpx_path, output_path, editor.to_bytes())
-
-    return CallToolResult(
-        content=[TextContent(type="text", text=f"{replaced}개 치환됨. 저장됨: {output_path}")]
-    )
+        return False, f"'{args['old_text']}'를 찾을 수 없습니다."
+    return True, f"{replaced}개 치환됨"
 
 
-async def handle_set_paragraph_text(args: dict) -> CallToolResult:
-    """단락 텍스트 교체"""
-    hwpx_path = Path(args["hwpx_path"])
+def _edit_op_set_paragraph_text(editor, args: dict) -> Tuple[bool, str]:
     index = args["index"]
-    text = args["text"]
-    char_style_id = args.get("char_style_id", 0)
-    output_path = Path(args.get("output_path", str(hwpx_path)))
-
-    if error := _check_file_exists(hwpx_path):
-        return error
-
-    editor = _get_editor(hwpx_path)
-    success = editor.set_paragraph_text(index, text, char_pr_id=char_style_id)
-
-    if not success:
-        return CallToolResult(
-            content=[TextContent(type="text", text=f"단락 {index}를 찾을 수 없습니다.")],
-            isError=True,
-        )
-
-    _save_hwpx(hwpx_path, output_path, editor.to_bytes())
-
-    return CallToolResult(
-        content=[TextContent(type="text", text=f"단락 {index} 텍스트 교체됨. 저장됨: {output_path}")]
-    )
-
+    if not editor.set_paragraph_text(index, args["text"], char_pr_id=args.get("char_style_id", 0)):
+        return False, f"단락 {index}를 찾을 수 없습니다."
+    return True, f"단락 {index} 텍스트 교체됨"
 
-# =============================================================================
-# 단락 삽입/삭제 Handlers
-# =============================================================================
 
-async def handle_insert_paragraph(args: dict) -> CallToolResult:
-    """단락 삽입"""
-    hwpx_path = Path(args["hwpx_path"])
+def _edit_op_insert_paragraph(editor, args: dict) -> Tuple[bool, str]:
     text = args["text"]
     position = args.get("position", "end")
     index = args.get("index")
-    para_style_id = args.get("para_style_id", 0)
-    char_style_id = args.get("char_style_id", 0)
-    output_path = Path(args.get("output_path", str(hwpx_path)))
-
-    if error := _check_file_exists(hwpx_path):
-        return error
-
-    editor = _get_editor(hwpx_path)
+    style = {
+        "para_pr_id": args.get("para_style_id", 0),
+        "char_pr_id": args.get("char_style_id", 0),
+    }
 
     if position == "end":
-        success = editor.append_paragraph(text, para_pr_id=para_style_id, char_pr_id=char_style_id)
+        success = editor.append_paragraph(text, **style)
         pos_desc = "문서 끝"
-    elif position == "after":
-        if index is None:
-            return CallToolResult(
-                content=[TextContent(type="text", text="position='after'일 때 index가 필요합니다.")],
-                isError=True,
-            )
-        success = editor.insert_paragraph_after(index, text, para_pr_id=para_style_id, char_pr_id=char_style_id)
-        pos_desc = f"단락 {index} 뒤"
-    elif position == "before":
+    elif position in ("after", "before"):
         if index is None:
-            return CallToolResult(
-                content=[TextContent(type="text", text="position='before'일 때 index가 필요합니다.")],
-                isError=True,
-            )
-        success = editor.insert_paragraph_before(index, text, para_pr_id=para_style_id, char_pr_id=char_style_id)
-        pos_desc = f"단락 {index} 앞"
+            return False, f"position='{position}'일 때 index가 필요합니다."
+        if position == "after":
+            success = editor.insert_paragraph_after(index, text, **style)
+            pos_desc = f"단락 {index} 뒤"
+        else:
+            success = editor.insert_paragraph_before(index, text, **style)
+            pos_desc = f"단락 {index} 앞"
     else:
-        return CallToolResult(
-            content=[TextContent(type="text", text=f"알 수 없는 position: {position}")],
-            isError=True,
-        )
+        return False, f"알 수 없는 position: {position}"
 
     if not success:
-        return CallToolResult(
-            content=[TextContent(type="text", text="단락 삽입 실패")],
-            isError=True,
-        )
+        return False, "단락 삽입 실패"
+    return True, f"{pos_desc}에 단락 삽입됨"
 
-    _save_hwpx(hwpx_path, output_path, editor.to_bytes())
 
-    return CallToolResult(
-        content=[TextContent(type="text", text=f"{pos_desc}에 단락 삽입됨. 저장됨: {output_path}")]
-    )
-
-
-async def handle_delete_paragraph(args: dict) -> CallToolResult:
-    """단락 삭제"""
-    hwpx_path = Path(args["hwpx_path"])
+def _edit_op_delete_paragraph(editor, args: dict) -> Tuple[bool, str]:
     index = args.get("index")
     start = args.get("start")
     end = args.get("end")
-    output_path = Path(args.get("output_path", str(hwpx_path)))
-
-    if error := _check_file_exists(hwpx_path):
-        return error
-
-    editor = _get_editor(hwpx_path)
 
     if index is not None:
-        success = editor.delete_paragraph(index)
-        if not success:
-            return CallToolResult(
-                content=[TextContent(type="text", text=f"단락 {index}를 찾을 수 없습니다.")],
-                isError=True,
-            )
-        msg = f"단락 {index} 삭제됨"
-    elif start is not None and end is not None:
+        if not editor.delete_paragraph(index):
+            return False, f"단락 {index}를 찾을 수 없습니다."
+        return True, f"단락 {index} 삭제됨"
+    if start is not None and end is not None:
         deleted = editor.delete_paragraphs_range(start, end)
-        msg = f"{deleted}개 단락 삭제됨 ({start}~{end-1})"
-    else:
-        return CallToolResult(
-            content=[TextContent(type="text", text="index 또는 start/end를 지정해주세요.")],
-            isError=True,
-        )
+        return True, f"{deleted}개 단락 삭제됨 ({start}~{end-1})"
+    return False, "index 또는 start/end를 지정해주세요."
 
-    _save_hwpx(hwpx_path, output_path, editor.to_bytes())
 
-    return CallToolResult(
-        content=[TextContent(type="text", text=f"{msg}. 저장됨: {output_path}")]
-    )
+def _edit_op_copy_paragraph(editor, args: dict) -> Tuple[bool, str]:
+    from_index, to_index = args["from_index"], args["to_index"]
+    if not editor.copy_paragraph(from_index, to_index):
+        return False, "단락 복사 실패"
+    return True, f"단락 {from_index} → {to_index} 복사됨"
 
 
-# =============================================================================
-# 단락 복사/이동 Handlers
-# =============================================================================
+def _edit_op_move_paragraph(editor, args: dict) -> Tuple[bool, str]:
+    from_index, to_index = args["from_index"], args["to_index"]
+    if not editor.move_paragraph(from_index, to_index):
+        return False, "단락 이동 실패"
+    return True, f"단락 {from_index} → {to_index} 이동됨"
 
-async def handle_copy_paragraph(args: dict) -> CallToolResult:
-    """단락 복사"""
-    hwpx_path = Path(args["hwpx_path"])
-    from_index = args["from_index"]
-    to_index = args["to_index"]
-    output_path = Path(args.get("output_path", str(hwpx_path)))
 
-    if error := _check_file_exists(hwpx_path):
-        return error
+def _edit_op_set_paragraph_style(editor, args: dict) -> Tuple[bool, str]:
+    index, para_style_id = args["index"], args["para_style_id"]
+    if not editor.set_paragraph_style(index, para_style_id):
+        return False, f"단락 {index}를 찾을 수 없습니다."
+    return True, f"단락 {index} 스타일 → {para_style_id}"
 
-    editor = _get_editor(hwpx_path)
-    success = editor.copy_paragraph(from_index, to_index)
 
-    if not success:
-        return CallToolResult(
-            content=[TextContent(type="text", text="단락 복사 실패")],
-            isError=True,
-        )
+def _edit_op_set_char_style(editor, args: dict) -> Tuple[bool, str]:
+    index, char_style_id = args["index"], args["char_style_id"]
+    if not editor.set_char_style(index, char_style_id):
+        return False, f"단락 {index}를 찾을 수 없습니다."
+    return True, f"단락 {index} 문자 스타일 → {char_style_id}"
 
-    _save_hwpx(hwpx_path, output_path, editor.to_bytes())
 
-    return CallToolResult(
-        content=[TextContent(type="text", text=f"단락 {from_index} → {to_index} 복사됨. 저장됨: {output_path}")]
-    )
+def _edit_op_set_page_break(editor, args: dict) -> Tuple[bool, str]:
+    index, enable = args["index"], args.get("enable", True)
+    if not editor.set_page_break(index, enable=enable):
+        return False, f"단락 {index}를 찾을 수 없습니다."
+    return True, f"단락 {index} 페이지 브레이크 {'활성화' if enable else '비활성화'}"
 
 
-async def handle_move_paragraph(args: dict) -> CallToolResult:
-    """단락 이동"""
-    hwpx_path = Path(args["hwpx_path"])
-    from_index = args["from_index"]
-    to_index = args["to_index"]
+def _edit_op_set_column_break(editor, args: dict) -> Tuple[bool, str]:
+    index, enable = args["index"], args.get("enable", True)
+    if not editor.set_column_break(index, enable=enable):
+        return False, f"단락 {index}를 찾을 수 없습니다."
+    return True, f"단락 {index} 열 브레이크 {'활성화' if enable else '비활성화'}"
+
+
+def _edit_op_insert_table(editor, args: dict) -> Tuple[bool, str]:
+    after_index, rows, cols = args["after_index"], args["rows"], args["cols"]
+    success = editor.insert_table_after(
+        after_index, rows, cols, data=args.get("data"), col_widths=args.get("col_widths")
+    )
+    if not success:
+        return False, "테이블 삽입 실패"
+    return True, f"{rows}x{cols} 테이블 삽입됨 (단락 {after_index} 뒤)"
+
+
+def _edit_op_insert_image(editor, args: dict) -> Tuple[bool, str]:
+    after_index, binary_item_id = args["after_index"], args["binary_item_id"]
+    if not editor.insert_image_after(after_index, binary_item_id, args["width"], args["height"]):
+        return False, "이미지 삽입 실패"
+    return True, f"이미지 삽입됨 (단락 {after_index} 뒤, {binary_item_id})"
+
+
+# 편집 작업 이름 → 적용 함수 (성공 여부, 메시지 반환)
+_EDIT_OPS = {
+    "replace_text": _edit_op_replace_text,
+    "set_paragraph_text": _edit_op_set_paragraph_text,
+    "insert_paragraph": _edit_op_insert_paragraph,
+    "delete_paragraph": _edit_op_delete_paragraph,
+    "copy_paragraph": _edit_op_copy_paragraph,
+    "move_paragraph": _edit_op_move_paragraph,
+    "set_paragraph_style": _edit_op_set_paragraph_style,
+    "set_char_style": _edit_op_set_char_style,
+    "set_page_break": _edit_op_set_page_break,
+    "set_column_break": _edit_op_set_column_break,
+    "insert_table": _edit_op_insert_table,
+    "insert_image": _edit_op_insert_image,
+}
+
+
+async def _run_edit(
+    op: str,
+    args: dict,
+    hwpx_path: Path,
+    st: os.stat_result,
+    note: Optional[str] = None,
+    precheck: Optional[Callable[[bytes, dict], Optional[str]]] = None,
+    failure_is_error: bool = True,
+) -> CallToolResult:
+    """편집 작업 하나를 적용하고 저장 (단일 편집 도구 공통 구현, _with_hwpx_file 핸들러에서 호출)
+
+    Args:
+        precheck: 원본 section0.xml 바이트로 먼저 확인하는 함수
+            (메시지를 반환하면 파싱/저장 없이 그 메시지로 종료)
+        failure_is_error: 편집 실패(precheck 포함)를 오류 결과로 반환할지 여부
+    """
     output_path = Path(args.get("output_path", str(hwpx_path)))
 
-    if error := _check_file_exists(hwpx_path):
-        return error
+    msg = None
+    if precheck is not None:
+        section_xml = await asyncio.to_thread(_load_section_xml, hwpx_path, st)
+        msg = precheck(section_xml, args)
 
-    editor = _get_editor(hwpx_path)
-    success = editor.move_paragraph(from_index, to_index)
+    if msg is None:
+        editor = await _get_editor(hwpx_path, st)
+        success, msg = _EDIT_OPS[op](editor, args)
+    else:
+        success = False
 
     if not success:
         return CallToolResult(
-            content=[TextContent(type="text", text="단락 이동 실패")],
-            isError=True,
+            content=[TextContent(type="text", text=msg)],
+            isError=failure_is_error,
         )
 
-    _save_hwpx(hwpx_path, output_path, editor.to_bytes())
+    await asyncio.to_thread(_save_hwpx, hwpx_path, output_path, editor.to_bytes())
 
+    text = f"{msg}. 저장됨: {output_path}"
+    if note:
+        text += f"\n{note}"
     return CallToolResult(
-        content=[TextContent(type="text", text=f"단락 {from_index} → {to_index} 이동됨. 저장됨: {output_path}")]
+        content=[TextContent(type="text", text=text)]
     )
 
 
 # =============================================================================
-# 스타일 변경 Handlers
+# 텍스트 편집 Handlers
 # =============================================================================
 
-async def handle_set_paragraph_style(args: dict) -> CallToolResult:
-    """단락 스타일 변경"""
-    hwpx_path = Path(args["hwpx_path"])
-    index = args["index"]
-    para_style_id = args["para_style_id"]
-    output_path = Path(args.get("output_path", str(hwpx_path)))
-
-    if error := _check_file_exists(hwpx_path):
-        return error
-
-    editor = _get_editor(hwpx_path)
-    success = editor.set_paragraph_style(index, para_style_id)
-
-    if not success:
-        return CallToolResult(
-            content=[TextContent(type="text", text=f"단락 {index}를 찾을 수 없습니다.")],
-            isError=True,
-        )
+def _precheck_replace_text(section_xml: bytes, args: dict) -> Optional[str]:
+    """replace_text는 XML 문자열 직접 치환이므로, 원본 바이트에 없으면 파싱 없이 실패 메시지 반환"""
+    if args["old_text"].encode("utf-8") not in section_xml:
+        return f"'{args['old_text']}'를 찾을 수 없습니다."
+    return None
 
-    _save_hwpx(hwpx_path, output_path, editor.to_bytes())
 
-    return CallToolResult(
-        content=[TextContent(type="text", text=f"단락 {index} 스타일 → {para_style_id}. 저장됨: {output_path}")]
+@_with_hwpx_file
+async def handle_replace_text(args: dict, hwpx_path: Path, st: os.stat_result) -> CallToolResult:
+    """텍스트 치환 (찾지 못한 경우는 오류가 아님)"""
+    return await _run_edit(
+        "replace_text", args, hwpx_path, st,
+        precheck=_precheck_replace_text, failure_is_error=False,
     )
 
 
-async def handle_set_char_style(args: dict) -> CallToolResult:
-    """문자 스타일 변경"""
-    hwpx_path = Path(args["hwpx_path"])
-    index = args["index"]
-    char_style_id = args["char_style_id"]
-    output_path = Path(args.get("output_path", str(hwpx_path)))
+@_with_hwpx_file
+async def handle_set_paragraph_text(
+    args: dict, hwpx_path: Path, st: os.stat_result
+) -> CallToolResult:
+    """단락 텍스트 교체"""
+    return await _run_edit("set_paragraph_text", args, hwpx_path, st)
 
-    if error := _check_file_exists(hwpx_path):
-        return error
 
-    editor = _get_editor(hwpx_path)
-    success = editor.set_char_style(index, char_style_id)
+# =============================================================================
+# 단락 삽입/삭제 Handlers
+# =============================================================================
 
-    if not success:
-        return CallToolResult(
-            content=[TextContent(type="text", text=f"단락 {index}를 찾을 수 없습니다.")],
-            isError=True,
-        )
+@_with_hwpx_file
+async def handle_insert_paragraph(
+    args: dict, hwpx_path: Path, st: os.stat_result
+) -> CallToolResult:
+    """단락 삽입"""
+    return await _run_edit("insert_paragraph", args, hwpx_path, st)
 
-    _save_hwpx(hwpx_path, output_path, editor.to_bytes())
 
-    return CallToolResult(
-        content=[TextContent(type="text", text=f"단락 {index} 문자 스타일 → {char_style_id}. 저장됨: {output_path}")]
-    )
+@_with_hwpx_file
+async def handle_delete_paragraph(
+    args: dict, hwpx_path: Path, st: os.stat_result
+) -> CallToolResult:
+    """단락 삭제"""
+    return await _run_edit("delete_paragraph", args, hwpx_path, st)
 
 
 # =============================================================================
-# 페이지/열 브레이크 Handlers
+# 단락 복사/이동 Handlers
 # =============================================================================
 
-async def handle_set_page_break(args: dict) -> CallToolResult:
-    """페이지 브레이크 설정"""
-    hwpx_path = Path(args["hwpx_path"])
-    index = args["index"]
-    enable = args.get("enable", True)
-    output_path = Path(args.get("output_path", str(hwpx_path)))
+@_with_hwpx_file
+async def handle_copy_paragraph(args: dict, hwpx_path: Path, st: os.stat_result) -> CallToolResult:
+    """단락 복사"""
+    return await _run_edit("copy_paragraph", args, hwpx_path, st)
 
-    if error := _check_file_exists(hwpx_path):
-        return error
 
-    editor = _get_editor(hwpx_path)
-    success = editor.set_page_break(index, enable=enable)
+@_with_hwpx_file
+async def handle_move_paragraph(args: dict, hwpx_path: Path, st: os.stat_result) -> CallToolResult:
+    """단락 이동"""
+    return await _run_edit("move_paragraph", args, hwpx_path, st)
 
-    if not success:
-        return CallToolResult(
-            content=[TextContent(type="text", text=f"단락 {index}를 찾을 수 없습니다.")],
-            isError=True,
-        )
 
-    _save_hwpx(hwpx_path, output_path, editor.to_bytes())
+# =============================================================================
+# 스타일 변경 Handlers
+# =============================================================================
 
-    status = "활성화" if enable else "비활성화"
-    return CallToolResult(
-        content=[TextContent(type="text", text=f"단락 {index} 페이지 브레이크 {status}. 저장됨: {output_path}")]
-    )
+@_with_hwpx_file
+async def handle_set_paragraph_style(
+    args: dict, hwpx_path: Path, st: os.stat_result
+) -> CallToolResult:
+    """단락 스타일 변경"""
+    return await _run_edit("set_paragraph_style", args, hwpx_path, st)
 
 
-async def handle_set_column_break(args: dict) -> CallToolResult:
-    """열 브레이크 설정"""
-    hwpx_path = Path(args["hwpx_path"])
-    index = args["index"]
-    enable = args.get("enable", True)
-    output_path = Path(args.get("output_path", str(hwpx_path)))
+@_with_hwpx_file
+async def handle_set_char_style(args: dict, hwpx_path: Path, st: os.stat_result) -> CallToolResult:
+    """문자 스타일 변경"""
+    return await _run_edit("set_char_style", args, hwpx_path, st)
 
-    if error := _check_file_exists(hwpx_path):
-        return error
 
-    editor = _get_editor(hwpx_path)
-    success = editor.set_column_break(index, enable=enable)
+# =============================================================================
+# 페이지/열 브레이크 Handlers
+# =============================================================================
 
-    if not success:
-        return CallToolResult(
-            content=[TextContent(type="text", text=f"단락 {index}를 찾을 수 없습니다.")],
-            isError=True,
-        )
+@_with_hwpx_file
+async def handle_set_page_break(args: dict, hwpx_path: Path, st: os.stat_result) -> CallToolResult:
+    """페이지 브레이크 설정"""
+    return await _run_edit("set_page_break", args, hwpx_path, st)
 
-    _save_hwpx(hwpx_path, output_path, editor.to_bytes())
 
-    status = "활성화" if enable else "비활성화"
-    return CallToolResult(
-        content=[TextContent(type="text", text=f"단락 {index} 열 브레이크 {status}. 저장됨: {output_path}")]
-    )
+@_with_hwpx_file
+async def handle_set_column_break(
+    args: dict, hwpx_path: Path, st: os.stat_result
+) -> CallToolResult:
+    """열 브레이크 설정"""
+    return await _run_edit("set_column_break", args, hwpx_path, st)
 
 
 # =============================================================================
 # 테이블/이미지 삽입 Handlers
 # =============================================================================
 
-async def handle_insert_table(args: dict) -> CallToolResult:
+@_with_hwpx_file
+async def handle_insert_table(args: dict, hwpx_path: Path, st: os.stat_result) -> CallToolResult:
     """테이블 삽입"""
-    hwpx_path = Path(args["hwpx_path"])
-    after_index = args["after_index"]
-    rows = args["rows"]
-    cols = args["cols"]
-    data = args.get("data")
-    col_widths = args.get("col_widths")
-    output_path = Path(args.get("output_path", str(hwpx_path)))
+    return await _run_edit("insert_table", args, hwpx_path, st)
 
-    if error := _check_file_exists(hwpx_path):
-        return error
 
-    editor = _get_editor(hwpx_path)
-    success = editor.insert_table_after(
-        after_index, rows, cols, data=data, col_widths=col_widths
+@_with_hwpx_file
+async def handle_insert_image(args: dict, hwpx_path: Path, st: os.stat_result) -> CallToolResult:
+    """이미지 삽입"""
+    return await _run_edit(
+        "insert_image", args, hwpx_path, st,
+        note="Note: 이미지 바이너리는 BinData/에 별도로 추가해야 합니다.",
     )
 
-    if not success:
-        return CallToolResult(
-            content=[TextContent(type="text", text="테이블 삽입 실패")],
-            isError=True,
-        )
-
-    _save_hwpx(hwpx_path, output_path, editor.to_bytes())
-
-    return CallToolResult(
-        content=[TextContent(type="text", text=f"{rows}x{cols} 테이블 삽입됨 (단락 {after_index} 뒤). 저장됨: {output_path}")]
-    )
 
+# =============================================================================
+# 일괄 편집 Handler
+# =============================================================================
 
-async def handle_insert_image(args: dict) -> CallToolResult:
-    """이미지 삽입"""
-    hwpx_path = Path(args["hwpx_path"])
-    after_index = args["after_index"]
-    binary_item_id = args["binary_item_id"]
-    width = args["width"]
-    height = args["height"]
+@_with_hwpx_file
+async def handle_batch_edit(args: dict, hwpx_path: Path, st: os.stat_result) -> CallToolResult:
+    """여러 편집 작업을 한 번의 로드/저장으로 적용"""
+    operations = args["operations"]
     output_path = Path(args.get("output_path", str(hwpx_path)))
 
-    if error := _check_file_exists(hwpx_path):
-        return error
+    editor = await _get_editor(hwpx_path, st)
+    messages = []
 
-    editor = _get_editor(hwpx_path)
-    success = editor.insert_image_after(after_index, binary_item_id, width, height)
+    for i, operation in enumerate(operations):
+        op = operation.get("op")
+        apply = _EDIT_OPS.get(op)
+        if apply is None:
+            return CallToolResult(
+                content=[TextContent(type="text", text=f"작업 {i+1}: 알 수 없는 op: {op}")],
+                isError=True,
+            )
 
-    if not success:
-        return CallToolResult(
-            content=[TextContent(type="text", text="이미지 삽입 실패")],
-            isError=True,
-        )
+        success, msg = apply(editor, operation.get("args", {}))
+        if not success:
+            return CallToolResult(
+                content=[
+                    TextContent(type="text", text=f"작업 {i+1} ({op}) 실패 (저장하지 않음): {msg}")
+                ],
+                isError=True,
+            )
+        messages.append(f"{i+1}. {msg}")
 
-    _save_hwpx(hwpx_path, output_path, editor.to_bytes())
+    await asyncio.to_thread(_save_hwpx, hwpx_path, output_path, editor.to_bytes())
 
     return CallToolResult(
         content=[TextContent(
             type="text",
-            text=f"이미지 삽입됨 (단락 {after_index} 뒤, {binary_item_id}). 저장됨: {output_path}\n"
-                 f"Note: 이미지 바이너리는 BinData/에 별도로 추가해야 합니다."
+            text=f"{len(operations)}개 작업 적용됨. 저장됨: {output_path}\n" + "\n".join(messages),
         )]
     )
 
 
+# =============================================================================
+# Tool Dispatch
+# =============================================================================
+
+# 도구 이름 → 핸들러 매핑 (모듈 로드 시 한 번만 생성)
+_TOOL_HANDLERS = {
+    "convert_pdf_to_hwpx": handle_convert_pdf_to_hwpx,
+    "convert_pdf_bytes_to_hwpx": handle_convert_pdf_bytes_to_hwpx,
+    "get_hwpx_info": handle_get_hwpx_info,
+    "get_hwpx_text": handle_get_hwpx_text,
+    "get_hwpx_paragraph": handle_get_hwpx_paragraph,
+    "get_hwpx_tables": handle_get_hwpx_tables,
+    "get_hwpx_images": handle_get_hwpx_images,
+    "find_page_breaks": handle_find_page_breaks,
+    "search_hwpx": handle_search_hwpx,
+    "search_hwpx_regex": handle_search_hwpx_regex,
+    "replace_text": handle_replace_text,
+    "set_paragraph_text": handle_set_paragraph_text,
+    "insert_paragraph": handle_insert_paragraph,
+    "delete_paragraph": handle_delete_paragraph,
+    "copy_paragraph": handle_copy_paragraph,
+    "move_paragraph": handle_move_paragraph,
+    "set_paragraph_style": handle_set_paragraph_style,
+    "set_char_style": handle_set_char_style,
+    "set_page_break": handle_set_page_break,
+    "set_column_break": handle_set_column_break,
+    "insert_table": handle_insert_table,
+    "insert_image": handle_insert_image,
+    "batch_edit": handle_batch_edit,
+}
+
+# 파일을 수정하는 도구 (call_tool에서 하나씩 순서대로 실행)
+_EDIT_TOOLS = frozenset(_EDIT_OPS) | {"batch_edit"}
+
+
 # =============================================================================
 # Main
 # =============================================================================
@@ -1,16 +1,32 @@
 """OCR 백엔드 모듈"""
 
+import importlib
+
 from pdf2hwpx.ocr.base import OCRBackend, OCRResult
-from pdf2hwpx.ocr.cloud import CloudOCR
-from pdf2hwpx.ocr.openai import OpenAIOCR
-from pdf2hwpx.ocr.vllm import VllmOCR
-from pdf2hwpx.ocr.pymupdf import PyMuPDFBackend
-from pdf2hwpx.ocr.mineru import MinerUBackend
-from pdf2hwpx.ocr.openrouter import OpenRouterOCR
-from pdf2hwpx.ocr.gemini import GeminiOCR
+
+# 백엔드 이름 → 정의된 모듈 (처음 접근할 때 import - 쓰지 않는 백엔드의 의존성은 로드하지 않음)
+_BACKEND_MODULES = {
+    "CloudOCR": "pdf2hwpx.ocr.cloud",
+    "OpenAIOCR": "pdf2hwpx.ocr.openai",
+    "VllmOCR": "pdf2hwpx.ocr.vllm",
+    "PyMuPDFBackend": "pdf2hwpx.ocr.pymupdf",
+    "MinerUBackend": "pdf2hwpx.ocr.mineru",
+    "OpenRouterOCR": "pdf2hwpx.ocr.openrouter",
+    "GeminiOCR": "pdf2hwpx.ocr.gemini",
+}
 
 __all__ = [
     "OCRBackend", "OCRResult",
     "CloudOCR", "OpenAIOCR", "VllmOCR",
     "PyMuPDFBackend", "MinerUBackend", "OpenRouterOCR", "GeminiOCR",
 ]
+
+
+def __getattr__(name: str):
+    """백엔드 클래스 지연 import (PEP 562)"""
+    module_name = _BACKEND_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    backend = getattr(importlib.import_module(module_name), name)
+    globals()[name] = backend
+    return backend
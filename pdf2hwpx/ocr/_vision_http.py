@@ -0,0 +1,109 @@
+"""OpenAI 호환 Vision API 백엔드(OpenRouter, vLLM) 공용 HTTP/인코딩 도구"""
+
+import json
+import random
+import re
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+import fitz  # PyMuPDF
+import httpx
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성 - 없으면 httpx 기본 JSON 직렬화/표준 json 사용
+    orjson = None
+
+from pdf2hwpx.ocr.base import OCRResult
+
+# 페이지 이미지 JPEG 품질 (OCR 정확도에 영향 없는 수준에서 전송 크기 축소)
+JPEG_QUALITY = 85
+
+# 이미지 형식별 MIME 타입
+IMAGE_MIME_TYPES = {"jpeg": "image/jpeg", "png": "image/png"}
+
+# JSON 파싱 함수 (orjson.JSONDecodeError는 json.JSONDecodeError의 하위 클래스라 예외 처리는 동일)
+loads = orjson.loads if orjson is not None else json.loads
+
+# 응답 텍스트에서 JSON 추출 (```json 코드블록 안 / 첫 여는 중괄호부터 마지막 닫는 중괄호까지)
+JSON_FENCE_RE = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+JSON_BRACE_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+# API 요청 최대 시도 횟수 (요청 한도 초과/서버 오류/연결 오류일 때 재시도)
+MAX_ATTEMPTS = 6
+
+# 재시도 대기 시간 (지수 백오프, 초)
+_RETRY_BASE_DELAY = 1.0
+_RETRY_MAX_DELAY = 30.0
+
+# 재시도해도 되는 HTTP 상태 코드 (요청 한도 초과, 서버 오류)
+RETRYABLE_STATUS = frozenset({408, 429, 500, 502, 503, 504})
+
+
+def retry_delay(attempt: int, response: Optional[httpx.Response]) -> float:
+    """재시도 전 대기 시간 - 서버가 Retry-After(초)를 주면 따르고, 아니면 지수 백오프 + 지터"""
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    if retry_after is not None:
+        try:
+            return min(_RETRY_MAX_DELAY, max(0.0, float(retry_after)))
+        except ValueError:
+            pass
+    # 동시 작업자들이 한꺼번에 재시도하지 않도록 지터 적용
+    delay = min(_RETRY_MAX_DELAY, _RETRY_BASE_DELAY * 2 ** attempt)
+    return delay * random.uniform(0.5, 1.0)
+
+
+def post_json(client: httpx.Client, url: str, payload: dict[str, Any]) -> httpx.Response:
+    """JSON 요청 전송
+
+    orjson이 있으면 bytes로 바로 직렬화합니다 (base64 이미지 크기의 str 중간 복사본 생략).
+    요청 한도 초과(429)/서버 오류/연결 오류는 지수 백오프로 재시도해,
+    페이지 하나의 일시적 실패로 문서 전체 변환이 중단되지 않도록 합니다.
+    마지막 시도의 응답은 상태 코드와 관계없이 그대로 반환합니다.
+    """
+    if orjson is not None:
+        request = {
+            "content": orjson.dumps(payload),
+            "headers": {"Content-Type": "application/json"},
+        }
+    else:
+        request = {"json": payload}
+
+    for attempt in range(MAX_ATTEMPTS):
+        last_attempt = attempt == MAX_ATTEMPTS - 1
+        try:
+            response = client.post(url, **request)
+        except httpx.TransportError:
+            if last_attempt:
+                raise
+            response = None
+        else:
+            if response.status_code not in RETRYABLE_STATUS or last_attempt:
+                return response
+        time.sleep(retry_delay(attempt, response))
+
+
+class VisionHttpMixin:
+    """httpx 클라이언트(_client)와 페이지 이미지 형식(image_format)을 가진 백엔드 공용 메서드"""
+
+    def close(self):
+        """HTTP 연결 풀 닫기"""
+        self._client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def process(self, pdf_path: Path) -> OCRResult:
+        """PDF 파일에서 OCR 수행"""
+        with open(pdf_path, "rb") as f:
+            return self.process_bytes(f.read())
+
+    def _encode_page(self, pix: fitz.Pixmap) -> bytes:
+        """렌더링한 페이지를 설정된 형식의 이미지 바이트로 인코딩"""
+        if self.image_format == "jpeg":
+            return pix.tobytes("jpg", jpg_quality=JPEG_QUALITY)
+        return pix.tobytes("png")
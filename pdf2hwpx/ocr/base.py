@@ -1,12 +1,16 @@
 """OCR 백엔드 추상 클래스"""
 
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
+# 결과 객체는 페이지/블록마다 대량 생성되므로 __dict__ 없이 슬롯으로 저장 (Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class TextBlock:
     """텍스트 블록"""
     text: str
@@ -19,7 +23,7 @@ class TextBlock:
     heading_level: int = 0  # 제목 레벨 (0=일반, 1=대, 2=중, 3=소)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TableCell:
     """테이블 셀"""
     text: str
@@ -29,7 +33,7 @@ class TableCell:
     colspan: int = 1
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Table:
     """테이블"""
     cells: list[TableCell]
@@ -41,7 +45,7 @@ class Table:
     height: float
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PageResult:
     """페이지별 OCR 결과"""
     page_num: int
@@ -53,7 +57,7 @@ class PageResult:
     column_count: int = 1  # 컬럼 수 (1=단일, 2=2단)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class OCRResult:
     """전체 OCR 결과"""
     pages: list[PageResult]
@@ -0,0 +1,52 @@
+"""페이지 OCR 결과 디스크 캐시"""
+
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Optional, Union
+
+
+class PageCache:
+    """페이지 이미지별 OCR 결과 캐시 (키마다 JSON 파일 하나)
+
+    키는 namespace(모델/프롬프트 버전/렌더링 설정 등)와 페이지 이미지 바이트의 해시라서,
+    같은 페이지를 같은 설정으로 다시 변환할 때만 적중합니다.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path], namespace: str):
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.namespace = namespace
+
+    def key(self, img_bytes: bytes) -> str:
+        """페이지 이미지 바이트의 캐시 키"""
+        digest = hashlib.sha256(f"{self.namespace}|".encode())
+        digest.update(img_bytes)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        """캐시된 결과 읽기 (없거나 손상되었으면 None)"""
+        try:
+            with open(self.cache_dir / f"{key}.json", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return data if isinstance(data, dict) else None
+
+    def put(self, key: str, data: dict[str, Any]):
+        """결과 저장 (임시 파일에 쓴 뒤 교체해 동시 작업자가 반쯤 쓴 파일을 읽지 않도록 함)"""
+        try:
+            fd, tmp_name = tempfile.mkstemp(suffix=".tmp", dir=self.cache_dir)
+        except OSError:
+            # 캐시 저장 실패는 OCR 결과에 영향 없음
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_name, self.cache_dir / f"{key}.json")
+        except (OSError, TypeError, ValueError):
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_name)
@@ -2,13 +2,20 @@
 
 import os
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional, Union
 
 import httpx
 
 from pdf2hwpx.ocr.base import OCRBackend, OCRResult, PageResult, TextBlock, Table
 
 
+# API 요청 타임아웃 (OCR 처리 대기로 응답 읽기는 길게, 연결은 짧게)
+_TIMEOUT = httpx.Timeout(300.0, connect=10.0)
+
+# 연결 풀 크기 (여러 스레드에서 같은 백엔드를 써도 keep-alive 연결을 재사용)
+_LIMITS = httpx.Limits(max_keepalive_connections=10, max_connections=20)
+
+
 class CloudOCR(OCRBackend):
     """pdf2hwpx Cloud API 백엔드"""
 
@@ -28,21 +35,37 @@ class CloudOCR(OCRBackend):
                 "Get your key at https://pdf2hwpx.com"
             )
 
+        # 요청마다 새로 연결하지 않도록 클라이언트를 재사용 (TCP/TLS 연결 유지)
+        self._client = httpx.Client(timeout=_TIMEOUT, limits=_LIMITS)
+
+    def close(self):
+        """HTTP 연결 풀 닫기"""
+        self._client.close()
+
+    def __enter__(self) -> "CloudOCR":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
     def process(self, pdf_path: Path) -> OCRResult:
-        """PDF 파일에서 OCR 수행"""
+        """PDF 파일에서 OCR 수행 (파일 전체를 메모리에 읽지 않고 업로드 중 나눠 읽음)"""
         with open(pdf_path, "rb") as f:
-            return self.process_bytes(f.read())
+            return self._post(f)
 
     def process_bytes(self, pdf_bytes: bytes) -> OCRResult:
         """PDF 바이트에서 OCR 수행"""
-        with httpx.Client(timeout=300.0) as client:
-            response = client.post(
-                f"{self.base_url}/v1/ocr",
-                headers={"Authorization": f"Bearer {self.api_key}"},
-                files={"file": ("document.pdf", pdf_bytes, "application/pdf")},
-            )
-            response.raise_for_status()
-            data = response.json()
+        return self._post(pdf_bytes)
+
+    def _post(self, pdf_content: Union[bytes, BinaryIO]) -> OCRResult:
+        """PDF를 multipart로 업로드하고 응답을 OCRResult로 변환"""
+        response = self._client.post(
+            f"{self.base_url}/v1/ocr",
+            headers={"Authorization": f"Bearer {self.api_key}"},
+            files={"file": ("document.pdf", pdf_content, "application/pdf")},
+        )
+        response.raise_for_status()
+        data = response.json()
 
         return self._parse_response(data)
 
@@ -1,16 +1,96 @@
 """Gemini OCR 백엔드 - Structured Output으로 IR 직접 반환"""
 
-import base64
-import io
+import copy
+import hashlib
 import os
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional, List, Literal
+from typing import Optional, List, Literal, Union
 
+import fitz  # PyMuPDF
 from google import genai
+from google.genai import types
 from pydantic import BaseModel, Field
-from pdf2image import convert_from_bytes
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성 - 없으면 pydantic 내장 JSON 파서 사용
+    orjson = None
 
 from pdf2hwpx.ocr.base import OCRBackend, OCRResult, PageResult, TextBlock, Table, TableCell
+from pdf2hwpx.ocr.cache import PageCache
+
+
+# 페이지 렌더링 해상도 (PDF 좌표 단위는 72 DPI)
+_RENDER_DPI = 200
+_RENDER_MATRIX = fitz.Matrix(_RENDER_DPI / 72, _RENDER_DPI / 72)
+
+# 페이지 이미지 JPEG 품질 (OCR 정확도에 영향 없는 수준에서 전송 크기 축소)
+_JPEG_QUALITY = 85
+
+# 이미지 형식별 MIME 타입
+_IMAGE_MIME_TYPES = {"jpeg": "image/jpeg", "png": "image/png"}
+
+# 컬럼 감지를 시도할 최소 블록 수
+# (2컬럼 판정에 좌/우 각 3개 이상이 필요하므로 그보다 적으면 항상 1컬럼)
+_MIN_BLOCKS_FOR_COLUMN_DETECTION = 6
+
+# 프롬프트/스키마 버전 - 변경 시 올려서 이전 응답 캐시를 무효화
+PROMPT_VERSION = 1
+
+# 스키마에 맞지 않는 응답일 때 페이지당 최대 요청 횟수 (검증 오류를 알려 다시 요청)
+_MAX_ATTEMPTS = 3
+
+# 일시적 API/전송 오류의 요청당 최대 시도 횟수 (SDK retry_options로 재시도)
+_HTTP_ATTEMPTS = 3
+
+# 일시적 API/전송 오류 재시도 대기 시간 (지수 백오프, 초)
+_RETRY_BASE_DELAY = 1.0
+_RETRY_MAX_DELAY = 10.0
+
+# 재시도해도 되는 API 오류 코드 (요청 한도 초과, 서버 오류)
+_RETRYABLE_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+# 응답 텍스트에서 JSON 객체 부분만 추출 (코드블록/앞뒤 설명 제거용)
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+# 스키마에 맞지 않는 응답을 받은 뒤 다시 요청할 때 덧붙이는 안내
+_REPAIR_PROMPT = """이전 응답이 스키마에 맞는 JSON이 아니었습니다.
+오류: {error}
+설명이나 코드블록 없이 스키마에 맞는 JSON만 반환하세요."""
+
+# 페이지 OCR 프롬프트 (structured output 스키마와 함께 전송)
+_PROMPT = """이 문서 이미지를 분석하여 모든 내용을 추출하세요.
+
+레이아웃 분석:
+- layout.column_count: 문서의 컬럼 수 (1=단일 컬럼, 2=2단 컬럼)
+
+블록 타입:
+- "paragraph": 본문 텍스트
+- "heading": 제목 (level: 1=대제목, 2=중제목, 3=소제목)
+- "table": 표 (rows에 2차원 배열)
+- "box": 테두리 있는 박스/안내문
+
+텍스트 포맷 (마크다운 사용):
+- 제목: # 대제목, ## 중제목, ### 소제목
+- 줄바꿈: 원본 문서의 줄바꿈을 \\n으로 보존
+- 굵은글씨: **텍스트**
+- 리스트: 원본 번호/기호 그대로 (①, ②, 가, 나, ○, ● 등)
+
+bbox 규칙:
+- 정규화된 좌표 (0-1 범위)
+- x1, y1: 좌상단, x2, y2: 우하단"""
+
+# 여러 페이지를 한 요청으로 보낼 때 페이지 프롬프트 앞에 덧붙이는 안내
+_BATCH_PROMPT = """여러 페이지 이미지가 "N페이지:" 표시와 함께 순서대로 주어집니다.
+각 페이지를 아래 지시대로 따로 분석하여 pages 배열에 페이지 순서대로 하나씩 담으세요
+(이미지 수와 pages 길이가 같아야 함).
+
+""" + _PROMPT
 
 
 # IR 스키마 정의 (Pydantic)
@@ -63,6 +143,57 @@ class DocumentIrSchema(BaseModel):
     )
 
 
+class BatchedDocumentIrSchema(BaseModel):
+    """여러 페이지 IR 스키마 (페이지 묶음 요청용)"""
+    pages: List[DocumentIrSchema] = Field(
+        description="페이지별 IR (이미지 순서대로)"
+    )
+
+
+def _parse_ir(data: Union[str, bytes], schema: type = DocumentIrSchema) -> BaseModel:
+    """JSON 응답을 IR 스키마로 검증 - orjson이 있으면 C 파서로 먼저 파싱 (오류는 모두 ValueError)"""
+    if orjson is not None:
+        return schema.model_validate(orjson.loads(data))
+    return schema.model_validate_json(data)
+
+
+def _resolve_batch(
+    page_futures: List[Future],
+    slots: threading.BoundedSemaphore,
+    failed: threading.Event,
+    batch_future: Future,
+) -> None:
+    """묶음 요청 결과를 페이지별 future로 나눠 전달하고 렌더링 슬롯 반환 (실패하면 failed 설정)"""
+    try:
+        if batch_future.cancelled():
+            for future in page_futures:
+                future.cancel()
+            return
+        error = batch_future.exception()
+        if error is not None:
+            # 대기 중인 렌더링 루프가 깨어나기 전에 실패를 먼저 기록
+            failed.set()
+            for future in page_futures:
+                future.set_exception(error)
+        else:
+            for future, page in zip(page_futures, batch_future.result()):
+                future.set_result(page)
+    finally:
+        slots.release(len(page_futures))
+
+
+def _is_normalized_bbox(bbox: BboxSchema) -> bool:
+    """bbox 좌표가 모두 0-1 범위인지 (정규화 좌표인지)"""
+    return 0 <= bbox.x1 <= 1 and 0 <= bbox.y1 <= 1 and 0 <= bbox.x2 <= 1 and 0 <= bbox.y2 <= 1
+
+
+def _pixmap_digest(pix: fitz.Pixmap) -> bytes:
+    """렌더링한 페이지의 픽셀 해시 (크기/채널 수 포함)"""
+    digest = hashlib.blake2b(f"{pix.width}x{pix.height}x{pix.n}|".encode("ascii"), digest_size=16)
+    digest.update(pix.samples_mv)
+    return digest.digest()
+
+
 class GeminiOCR(OCRBackend):
     """Google Gemini 기반 OCR 백엔드
 
@@ -79,11 +210,23 @@ class GeminiOCR(OCRBackend):
         self,
         api_key: Optional[str] = None,
         model: Optional[str] = None,
+        max_concurrency: int = 8,
+        image_format: Literal["jpeg", "png"] = "jpeg",
+        cache_dir: Optional[Union[str, Path]] = None,
+        timeout: float = 120.0,
+        batch_size: int = 1,
     ):
         """
         Args:
             api_key: Gemini API 키 (없으면 GEMINI_API_KEY 환경변수 사용)
             model: 모델명 (flash, flash-lite, pro 또는 전체 모델명)
+            max_concurrency: 동시에 보낼 페이지 API 요청 수 상한
+            image_format: 페이지 이미지 형식 (jpeg: 빠르고 작음, png: 무손실)
+            cache_dir: 페이지별 응답 캐시 디렉터리 (없으면 PDF2HWPX_GEMINI_CACHE 환경변수,
+                둘 다 없으면 캐시 사용 안 함)
+            timeout: 페이지 요청 하나의 타임아웃 (초, 동시 요청마다 각각 적용)
+            batch_size: 한 요청에 묶어 보낼 페이지 수 (단순한 페이지가 많은 문서에서 왕복 횟수 감소,
+                출력 토큰 한도는 묶인 페이지들이 나눠 씀)
         """
         self.api_key = api_key or os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
         if not self.api_key:
@@ -95,8 +238,49 @@ class GeminiOCR(OCRBackend):
         else:
             self.model = model or self.MODELS["flash-lite"]
 
-        # Gemini 클라이언트 초기화
-        self.client = genai.Client(api_key=self.api_key)
+        self.max_concurrency = max(1, max_concurrency)
+        self.batch_size = max(1, batch_size)
+
+        if image_format not in _IMAGE_MIME_TYPES:
+            raise ValueError(f"Unsupported image_format: {image_format}")
+        self.image_format = image_format
+
+        # 응답 캐시 - 같은 페이지 이미지/모델/프롬프트 버전이면 API 호출 생략
+        cache_dir = cache_dir or os.getenv("PDF2HWPX_GEMINI_CACHE")
+        self._cache = None
+        if cache_dir:
+            self._cache = PageCache(cache_dir, f"{self.model}|{PROMPT_VERSION}|{self.image_format}")
+
+        # Gemini 클라이언트 초기화 (SDK의 타임아웃 단위는 밀리초)
+        # 타임아웃/연결 오류와 일시적 API 오류는 SDK가 지수 백오프로 재시도
+        # (SDK는 httpx 타임아웃/연결 예외를 APIError로 감싸지 않고 그대로 올림)
+        self.client = genai.Client(
+            api_key=self.api_key,
+            http_options=types.HttpOptions(
+                timeout=int(timeout * 1000),
+                retry_options=types.HttpRetryOptions(
+                    attempts=_HTTP_ATTEMPTS,
+                    initial_delay=_RETRY_BASE_DELAY,
+                    max_delay=_RETRY_MAX_DELAY,
+                    http_status_codes=sorted(_RETRYABLE_CODES),
+                ),
+            ),
+        )
+
+        # 요청 설정은 한 번만 만들어 재사용 (페이지마다 스키마 변환 반복 방지)
+        self._gen_config = types.GenerateContentConfig(
+            response_mime_type="application/json",
+            response_schema=DocumentIrSchema,
+            max_output_tokens=65536,
+        )
+        self._prompt_part = types.Part(text=_PROMPT)
+        if self.batch_size > 1:
+            self._batch_config = types.GenerateContentConfig(
+                response_mime_type="application/json",
+                response_schema=BatchedDocumentIrSchema,
+                max_output_tokens=65536,
+            )
+            self._batch_prompt_part = types.Part(text=_BATCH_PROMPT)
 
     def process(self, pdf_path: Path) -> OCRResult:
         """PDF 파일에서 OCR 수행"""
@@ -104,104 +288,242 @@ class GeminiOCR(OCRBackend):
             return self.process_bytes(f.read())
 
     def process_bytes(self, pdf_bytes: bytes) -> OCRResult:
-        """PDF 바이트에서 OCR 수행"""
-        images = convert_from_bytes(pdf_bytes, dpi=200)
-
+        """PDF 바이트에서 OCR 수행
+
+        API 요청(batch_size 페이지씩)은 최대 max_concurrency개까지 동시에 보내고,
+        그동안 다음 페이지를 렌더링합니다. 렌더링이 앞서 나가도 메모리에 남은 페이지 이미지는
+        (요청 중인 것 포함) 요청 max_concurrency의 2배 분량을 넘지 않습니다.
+        렌더링 결과가 앞 페이지와 똑같은 페이지는 다시 요청하지 않고 그 결과를 복사해 쓰고,
+        응답 캐시에 있는 페이지는 이미지 인코딩과 API 호출을 모두 건너뜁니다.
+        끝내 실패한 묶음이 생기면 나머지 페이지는 렌더링/요청하지 않고 그 예외를 전달합니다.
+        """
+        slots = threading.BoundedSemaphore(self.max_concurrency * 2 * self.batch_size)
+        failed = threading.Event()
+        futures = []  # (페이지 번호, 그 페이지 결과를 만들 future)
+        submitted = {}  # 렌더링 픽셀 해시 → future (같은 이미지 페이지는 한 번만 처리)
+        pending = []  # 아직 보내지 않은 묶음: (페이지 future, _process_page 인자)
+
+        def submit_pending():
+            batch_future = pool.submit(self._process_batch, [page_args for _, page_args in pending])
+            page_futures = [future for future, _ in pending]
+            batch_future.add_done_callback(partial(_resolve_batch, page_futures, slots, failed))
+            pending.clear()
+
+        with fitz.open(stream=pdf_bytes, filetype="pdf") as doc, ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="gemini-ocr"
+        ) as pool:
+            for page_num, pdf_page in enumerate(doc, start=1):
+                slots.acquire()
+                if failed.is_set():
+                    # 결과가 어차피 버려지므로 보내지 않은 묶음과 시작하지 않은 요청은 취소
+                    for future, _ in pending:
+                        future.cancel()
+                    pending.clear()
+                    pool.shutdown(cancel_futures=True)
+                    break
+                # 페이지를 하나씩 렌더링 (전체 페이지 이미지를 한꺼번에 메모리에 올리지 않음)
+                pix = pdf_page.get_pixmap(matrix=_RENDER_MATRIX, alpha=False)
+                width, height = pix.width, pix.height
+
+                # 인코딩 전 픽셀로 해시 - 중복 페이지/캐시 적중이면 인코딩 자체를 생략
+                digest = _pixmap_digest(pix)
+                future = submitted.get(digest)
+                if future is not None:
+                    # 앞 페이지와 같은 이미지 (반복 양식/빈 페이지 등) - 그 결과를 재사용
+                    slots.release()
+                    futures.append((page_num, future))
+                    continue
+
+                cache_key = self._cache.key(digest) if self._cache is not None else None
+                ir_data = self._cached_ir(cache_key)
+                if ir_data is not None:
+                    # 캐시 적중 - 인코딩/API 호출 없이 바로 결과 생성
+                    future = Future()
+                    future.set_result(self._ir_to_page_result(
+                        self._normalized_ir(ir_data, width, height), page_num, width, height
+                    ))
+                    slots.release()
+                else:
+                    future = Future()
+                    page_args = (self._encode_page(pix), page_num, width, height, cache_key)
+                    pending.append((future, page_args))
+                    if len(pending) == self.batch_size:
+                        submit_pending()
+                submitted[digest] = future
+                futures.append((page_num, future))
+
+            if pending:
+                submit_pending()
+
+        # 페이지 순서대로 수집 (실패한 페이지가 있으면 그 예외를 그대로 전달)
         pages = []
-        for page_num, image in enumerate(images, start=1):
-            # 이미지를 base64로 인코딩
-            img_byte_arr = io.BytesIO()
-            image.save(img_byte_arr, format='PNG')
-            img_bytes = img_byte_arr.getvalue()
-
-            # Gemini Vision API 호출 (structured output)
-            ir_data = self._call_gemini_vision(img_bytes, image.width, image.height)
-
-            # IR을 PageResult로 변환
-            page = self._ir_to_page_result(ir_data, page_num, image.width, image.height)
+        for page_num, future in futures:
+            page = future.result()
+            if page.page_num != page_num:
+                # 재사용한 결과는 복사해 페이지 번호만 바꿈
+                page = copy.deepcopy(page)
+                page.page_num = page_num
             pages.append(page)
-
         return OCRResult(pages=pages, metadata={"model": self.model})
 
-    def _call_gemini_vision(self, img_bytes: bytes, img_width: int = 1000, img_height: int = 1000) -> DocumentIrSchema:
-        """Gemini Vision API 호출 (Structured Output)"""
+    def _encode_page(self, pix: fitz.Pixmap) -> bytes:
+        """렌더링한 페이지를 설정된 형식의 이미지 바이트로 인코딩"""
+        if self.image_format == "jpeg":
+            return pix.tobytes("jpg", jpg_quality=_JPEG_QUALITY)
+        return pix.tobytes("png")
 
-        prompt = """이 문서 이미지를 분석하여 모든 내용을 추출하세요.
+    def _process_page(
+        self,
+        img_bytes: bytes,
+        page_num: int,
+        width: int,
+        height: int,
+        cache_key: Optional[str] = None,
+    ) -> PageResult:
+        """페이지 이미지 하나를 OCR하여 PageResult로 변환 (작업 스레드에서 실행)"""
+        # Gemini Vision API 호출 (structured output)
+        ir_data = self._call_gemini_vision(img_bytes, width, height, cache_key)
+
+        # IR을 PageResult로 변환
+        return self._ir_to_page_result(ir_data, page_num, width, height)
+
+    def _process_batch(self, batch: List[tuple]) -> List[PageResult]:
+        """_process_page 인자 묶음을 한 번의 요청으로 OCR
+
+        묶음 응답이 페이지 수와 맞지 않으면 페이지별 요청으로 대체합니다.
+        """
+        if len(batch) > 1:
+            irs = self._request_batch_ir([img_bytes for img_bytes, *_ in batch])
+            if irs is not None:
+                pages = []
+                for ir_data, (_, page_num, width, height, cache_key) in zip(irs, batch):
+                    if cache_key is not None:
+                        self._cache.put(cache_key, ir_data.model_dump())
+                    pages.append(self._ir_to_page_result(
+                        self._normalized_ir(ir_data, width, height), page_num, width, height
+                    ))
+                return pages
+        return [self._process_page(*page_args) for page_args in batch]
+
+    def _call_gemini_vision(
+        self,
+        img_bytes: bytes,
+        img_width: int = 1000,
+        img_height: int = 1000,
+        cache_key: Optional[str] = None,
+    ) -> DocumentIrSchema:
+        """Gemini Vision API 호출 (Structured Output, cache_key가 있으면 검증된 응답을 저장)"""
+        ir_data = self._request_ir(img_bytes)
+        if ir_data is None:
+            # 재시도 후에도 파싱 실패시 빈 결과 반환 (캐시에 저장하지 않음)
+            return DocumentIrSchema(blocks=[])
 
-레이아웃 분석:
-- layout.column_count: 문서의 컬럼 수 (1=단일 컬럼, 2=2단 컬럼)
+        if cache_key is not None:
+            self._cache.put(cache_key, ir_data.model_dump())
+        return self._normalized_ir(ir_data, img_width, img_height)
 
-블록 타입:
-- "paragraph": 본문 텍스트
-- "heading": 제목 (level: 1=대제목, 2=중제목, 3=소제목)
-- "table": 표 (rows에 2차원 배열)
-- "box": 테두리 있는 박스/안내문
+    def _normalized_ir(
+        self, ir_data: DocumentIrSchema, width: int, height: int
+    ) -> DocumentIrSchema:
+        """bbox 정규화 (픽셀 → 0-1), 실패시 빈 결과"""
+        try:
+            return self._normalize_bbox(ir_data, width, height)
+        except Exception:
+            return DocumentIrSchema(blocks=[])
 
-텍스트 포맷 (마크다운 사용):
-- 제목: # 대제목, ## 중제목, ### 소제목
-- 줄바꿈: 원본 문서의 줄바꿈을 \\n으로 보존
-- 굵은글씨: **텍스트**
-- 리스트: 원본 번호/기호 그대로 (①, ②, 가, 나, ○, ● 등)
+    def _request_ir(self, img_bytes: bytes) -> Optional[DocumentIrSchema]:
+        """페이지 IR 요청 (끝내 스키마에 맞는 응답을 얻지 못하면 None)"""
+        return self._request_validated(
+            [self._prompt_part, self._image_part(img_bytes)], self._gen_config, DocumentIrSchema
+        )
 
-bbox 규칙:
-- 정규화된 좌표 (0-1 범위)
-- x1, y1: 좌상단, x2, y2: 우하단"""
+    def _request_batch_ir(self, images: List[bytes]) -> Optional[List[DocumentIrSchema]]:
+        """여러 페이지 IR을 한 번에 요청 (페이지 수만큼 받지 못하면 None)"""
+        parts = [self._batch_prompt_part]
+        for index, img_bytes in enumerate(images, start=1):
+            parts.append(types.Part(text=f"{index}페이지:"))
+            parts.append(self._image_part(img_bytes))
 
-        # 이미지 Part 생성
-        image_part = {
-            "inline_data": {
-                "mime_type": "image/png",
-                "data": base64.b64encode(img_bytes).decode("utf-8"),
-            }
-        }
-
-        response = self.client.models.generate_content(
-            model=self.model,
-            contents=[
-                {"role": "user", "parts": [{"text": prompt}, image_part]}
-            ],
-            config={
-                "response_mime_type": "application/json",
-                "response_schema": DocumentIrSchema,
-                "max_output_tokens": 65536,
-            },
-        )
+        result = self._request_validated(parts, self._batch_config, BatchedDocumentIrSchema)
+        if result is None or len(result.pages) != len(images):
+            return None
+        return result.pages
+
+    def _image_part(self, img_bytes: bytes) -> types.Part:
+        """이미지 Part 생성 (바이트 그대로 전달 - 인코딩은 SDK가 전송 시 한 번만 수행)"""
+        return types.Part.from_bytes(data=img_bytes, mime_type=_IMAGE_MIME_TYPES[self.image_format])
 
-        # Pydantic 모델로 파싱
+    def _request_validated(
+        self, request_parts: list, config: types.GenerateContentConfig, schema: type
+    ) -> Optional[BaseModel]:
+        """요청 후 응답을 스키마로 검증 - 스키마 불일치 응답은 검증 오류를 알려 재요청
+
+        Returns:
+            검증된 모델, 끝내 스키마에 맞는 응답을 얻지 못하면 None
+        """
+        parts = request_parts
+        response_text = None
+
+        for _ in range(_MAX_ATTEMPTS):
+            # 일시적 API/전송 오류는 클라이언트의 retry_options로 SDK가 재시도
+            response = self.client.models.generate_content(
+                model=self.model,
+                contents=[types.Content(role="user", parts=parts)],
+                config=config,
+            )
+
+            response_text = response.text
+            try:
+                return _parse_ir(response_text or "", schema)
+            except ValueError as e:
+                # 다음 요청에는 검증 오류를 알려 스키마에 맞는 JSON만 다시 받도록 함
+                parts = request_parts + [types.Part(text=_REPAIR_PROMPT.format(error=str(e)[:500]))]
+
+        # 마지막 응답에서 JSON 객체 부분만 잘라 한 번 더 검증
+        match = _JSON_OBJECT_RE.search(response_text or "")
+        if match:
+            try:
+                return _parse_ir(match.group(0), schema)
+            except ValueError:
+                pass
+        return None
+
+    def _cached_ir(self, cache_key: Optional[str]) -> Optional[DocumentIrSchema]:
+        """캐시된 IR (캐시를 쓰지 않거나 없거나 손상되었으면 None)"""
+        if cache_key is None:
+            return None
+        data = self._cache.get(cache_key)
+        if data is None:
+            return None
         try:
-            ir_data = DocumentIrSchema.model_validate_json(response.text)
-            # bbox 정규화 (픽셀 → 0-1)
-            return self._normalize_bbox(ir_data, img_width, img_height)
-        except Exception:
-            # JSON 파싱 실패시 빈 결과 반환
-            return DocumentIrSchema(blocks=[])
+            return DocumentIrSchema.model_validate(data)
+        except ValueError:
+            return None
 
     def _normalize_bbox(self, ir_data: DocumentIrSchema, width: int, height: int) -> DocumentIrSchema:
         """bbox를 0-1 범위로 정규화 (픽셀값인 경우)"""
+        # 보통 응답 전체가 정규화 좌표이므로, 그 경우 블록을 다시 만들지 않고 그대로 반환
+        if all(_is_normalized_bbox(block.bbox) for block in ir_data.blocks):
+            return ir_data
+
         normalized_blocks = []
 
         for block in ir_data.blocks:
             bbox = block.bbox
             # 이미 정규화된 경우 (모든 값이 0-1 사이)
-            if all(0 <= v <= 1 for v in [bbox.x1, bbox.y1, bbox.x2, bbox.y2]):
+            if _is_normalized_bbox(bbox):
                 normalized_blocks.append(block)
             else:
-                # 픽셀값을 0-1로 정규화
-                normalized_bbox = BboxSchema(
+                # 픽셀값을 0-1로 정규화 (검증된 좌표의 산술 결과이므로 재검증 없이 bbox만 교체)
+                normalized_bbox = BboxSchema.model_construct(
                     x1=bbox.x1 / width,
                     y1=bbox.y1 / height,
                     x2=bbox.x2 / width,
                     y2=bbox.y2 / height,
                 )
-                normalized_blocks.append(IrBlockSchema(
-                    type=block.type,
-                    bbox=normalized_bbox,
-                    text=block.text,
-                    level=block.level,
-                    rows=block.rows,
-                ))
+                normalized_blocks.append(block.model_copy(update={"bbox": normalized_bbox}))
 
-        return DocumentIrSchema(blocks=normalized_blocks)
+        return ir_data.model_copy(update={"blocks": normalized_blocks})
 
     def _analyze_layout(self, blocks: List[IrBlockSchema]) -> tuple[List[IrBlockSchema], int]:
         """레이아웃 분석 후 읽기 순서대로 정렬
@@ -217,46 +539,53 @@ bbox 규칙:
         if not blocks:
             return blocks, 1
 
-        # 콘텐츠 영역 계산 (모든 블록의 x 범위)
-        all_x1 = [b.bbox.x1 for b in blocks]
-        all_x2 = [b.bbox.x2 for b in blocks]
-        content_left = min(all_x1)
-        content_right = max(all_x2)
+        # 블록이 적은 페이지(표지/양식 등)는 컬럼 분석 없이 y 순서만 정렬
+        if len(blocks) < _MIN_BLOCKS_FOR_COLUMN_DETECTION:
+            return sorted(blocks, key=lambda b: b.bbox.y1), 1
+
+        # 블록 좌표를 한 번만 읽어 y 순서로 한 번만 정렬 (안정 정렬 - 같은 y는 원래 순서 유지)
+        entries = sorted(((b.bbox.y1, b.bbox.x1, b.bbox.x2, b) for b in blocks), key=itemgetter(0))
+
+        # 콘텐츠 영역(모든 블록의 x 범위)과 x 중심점을 한 번에 수집
+        content_left = content_right = entries[0][1]
+        x_centers = []
+        for _, x1, x2, _ in entries:
+            if x1 < content_left:
+                content_left = x1
+            if x2 > content_right:
+                content_right = x2
+            x_centers.append((x1 + x2) / 2)
         content_width = content_right - content_left
         content_mid = content_left + content_width / 2
 
-        # x 중심점 수집
-        x_centers = [(b.bbox.x1 + b.bbox.x2) / 2 for b in blocks]
-
         # 2컬럼 감지: x 중심점 분포 분석
-        # 갭이 큰 곳을 찾아서 컬럼 구분
+        # 인접한 중심점 사이에서 가장 큰 갭을 찾아 컬럼 구분 (같은 크기면 왼쪽 갭 우선)
         sorted_centers = sorted(set(x_centers))
-        gaps = []
-        for i in range(len(sorted_centers) - 1):
-            gap = sorted_centers[i + 1] - sorted_centers[i]
-            gaps.append((gap, (sorted_centers[i] + sorted_centers[i + 1]) / 2))
+        max_gap = 0.0
+        max_gap_mid = content_mid
+        for left, right in zip(sorted_centers, sorted_centers[1:]):
+            if right - left > max_gap:
+                max_gap = right - left
+                max_gap_mid = (left + right) / 2
 
         # 가장 큰 갭을 컬럼 구분선으로 사용 (갭이 콘텐츠 너비의 5% 이상일 때)
         column_separator = content_mid
         is_multi_column = False
-        if gaps:
-            max_gap = max(gaps, key=lambda x: x[0])
-            if max_gap[0] > content_width * 0.05:
-                column_separator = max_gap[1]
-                is_multi_column = True
+        if max_gap > content_width * 0.05:
+            column_separator = max_gap_mid
+            is_multi_column = True
 
-        # 블록 분류
+        # 블록 분류 - y 순서로 훑으므로 각 그룹은 따로 정렬할 필요 없음
+        top_full = []  # 상단 전체 너비 블록 (헤더 - y < 0.1)
         left_blocks = []
         right_blocks = []
-        full_width_blocks = []
-
-        for block in blocks:
-            block_width = block.bbox.x2 - block.bbox.x1
-            x_center = (block.bbox.x1 + block.bbox.x2) / 2
+        bottom_full = []  # 하단 전체 너비 블록 (푸터)
+        full_width_min = content_width * 0.6
 
+        for (y1, x1, x2, block), x_center in zip(entries, x_centers):
             # 전체 너비 블록 (콘텐츠 너비의 60% 이상)
-            if block_width > content_width * 0.6:
-                full_width_blocks.append(block)
+            if x2 - x1 > full_width_min:
+                (top_full if y1 < 0.1 else bottom_full).append(block)
             # 왼쪽 컬럼
             elif x_center < column_separator:
                 left_blocks.append(block)
@@ -264,25 +593,8 @@ bbox 규칙:
             else:
                 right_blocks.append(block)
 
-        # 각 그룹을 y 순서대로 정렬
-        full_width_blocks.sort(key=lambda b: b.bbox.y1)
-        left_blocks.sort(key=lambda b: b.bbox.y1)
-        right_blocks.sort(key=lambda b: b.bbox.y1)
-
-        # 병합
-        result = []
-
-        # 상단 전체 너비 블록 (헤더 - y < 0.1)
-        top_full = [b for b in full_width_blocks if b.bbox.y1 < 0.1]
-        result.extend(top_full)
-
-        # 왼쪽 → 오른쪽
-        result.extend(left_blocks)
-        result.extend(right_blocks)
-
-        # 하단 전체 너비 블록 (푸터)
-        bottom_full = [b for b in full_width_blocks if b.bbox.y1 >= 0.1]
-        result.extend(bottom_full)
+        # 병합: 상단 전체 너비 → 왼쪽 → 오른쪽 → 하단 전체 너비
+        result = top_full + left_blocks + right_blocks + bottom_full
 
         # 컬럼 수 판단: 왼쪽과 오른쪽 둘 다 3개 이상 블록이 있으면 2컬럼
         detected_col_count = 2 if (is_multi_column and len(left_blocks) >= 3 and len(right_blocks) >= 3) else 1
@@ -342,19 +654,18 @@ bbox 규칙:
 
     def _create_table(self, rows: List[List[str]], y_pos: float, page_width: int, height: float = None) -> Table:
         """테이블 생성"""
-        cells: List[TableCell] = []
-
-        for row_idx, row_data in enumerate(rows):
-            for col_idx, cell_text in enumerate(row_data):
-                cells.append(
-                    TableCell(
-                        text=str(cell_text) if cell_text else "",
-                        row=row_idx,
-                        col=col_idx,
-                        rowspan=1,
-                        colspan=1,
-                    )
-                )
+        # 빈 셀도 유지 (표 작성기는 있는 셀만 <hp:tc>로 출력하므로 격자가 빠짐없이 채워져야 함)
+        cells = [
+            TableCell(
+                text=str(cell_text) if cell_text else "",
+                row=row_idx,
+                col=col_idx,
+                rowspan=1,
+                colspan=1,
+            )
+            for row_idx, row_data in enumerate(rows)
+            for col_idx, cell_text in enumerate(row_data)
+        ]
 
         num_cols = len(rows[0]) if rows else 1
         table_height = height if height else len(rows) * 20.0
@@ -2,7 +2,6 @@
 
 import json
 import os
-import tempfile
 from pathlib import Path
 from typing import List, Optional
 
@@ -47,38 +46,24 @@ class MinerUBackend(OCRBackend):
 
     def process_bytes(self, pdf_bytes: bytes) -> OCRResult:
         """PDF 바이트에서 구조 추출"""
-        from magic_pdf.data.data_reader_writer import FileBasedDataReader, FileBasedDataWriter
         from magic_pdf.data.dataset import PymuDocDataset
         from magic_pdf.model.doc_analyze_by_custom_model import doc_analyze
 
-        # 임시 디렉토리에 저장
-        with tempfile.TemporaryDirectory() as temp_dir:
-            pdf_path = Path(temp_dir) / "input.pdf"
-            output_dir = Path(temp_dir) / "output"
-            output_dir.mkdir()
+        # PDF 분석 (데이터셋이 바이트를 직접 받으므로 임시 파일 불필요)
+        dataset = PymuDocDataset(pdf_bytes)
 
-            with open(pdf_path, "wb") as f:
-                f.write(pdf_bytes)
-
-            # MinerU 처리
-            reader = FileBasedDataReader("")
-            writer = FileBasedDataWriter(str(output_dir))
-
-            # PDF 분석
-            dataset = PymuDocDataset(pdf_bytes)
-
-            # 모델 분석 수행
-            infer_result = doc_analyze(
-                dataset,
-                ocr=True,
-                show_log=False,
-                lang="ko+en",
-            )
+        # 모델 분석 수행
+        infer_result = doc_analyze(
+            dataset,
+            ocr=True,
+            show_log=False,
+            lang="ko+en",
+        )
 
-            # 결과 추출
-            pages = self._parse_infer_result(infer_result, dataset)
+        # 결과 추출
+        pages = self._parse_infer_result(infer_result, dataset)
 
-            return OCRResult(pages=pages, metadata={})
+        return OCRResult(pages=pages, metadata={})
 
     def _parse_infer_result(self, infer_result, dataset) -> List[PageResult]:
         """MinerU 결과 파싱"""
@@ -1,17 +1,35 @@
 """OpenRouter OCR 백엔드 - Structured Output으로 IR 직접 반환"""
 
 import base64
-import io
 import json
 import os
-import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Literal, Union
 
+import fitz  # PyMuPDF
 import httpx
-from pdf2image import convert_from_bytes
 
+from pdf2hwpx.ocr._vision_http import (
+    IMAGE_MIME_TYPES,
+    JSON_BRACE_RE,
+    JSON_FENCE_RE,
+    RETRYABLE_STATUS,
+    VisionHttpMixin,
+    loads,
+    post_json,
+)
 from pdf2hwpx.ocr.base import OCRBackend, OCRResult, PageResult, TextBlock, Table, TableCell
+from pdf2hwpx.ocr.cache import PageCache
+
+
+# 프롬프트/스키마 버전 - 변경 시 올려서 이전 응답 캐시를 무효화
+PROMPT_VERSION = 1
+
+# API 요청 타임아웃 (페이지 OCR 응답 대기로 읽기는 길게, 연결은 짧게)
+_TIMEOUT = httpx.Timeout(180.0, connect=10.0)
 
 
 # IR 출력을 위한 JSON Schema
@@ -50,8 +68,82 @@ IR_SCHEMA = {
     "required": ["blocks"]
 }
 
+# Structured output 요청 형식 (모듈 로드 시 한 번 생성해 모든 요청이 공유 - 수정 금지)
+_STRUCTURED_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "document_ir",
+        "schema": IR_SCHEMA,
+        "strict": True,
+    },
+}
+
+# 페이지 하나당 응답 최대 토큰 수
+_PAGE_MAX_TOKENS = 8192
+
+# 모델별 출력 토큰 상한 - 묶음 요청의 max_tokens가 이를 넘으면 400 오류가 나므로 여기까지로 제한
+# (등록되지 않은 모델은 페이지당 값까지만 요청)
+_MODEL_MAX_OUTPUT_TOKENS = {
+    "google/gemini-2.0-flash-001": 8192,
+    "google/gemini-2.5-pro-preview": 65536,
+    "anthropic/claude-sonnet-4": 64000,
+    "openai/gpt-4o": 16384,
+    "openai/gpt-4o-mini": 16384,
+}
+
+# 여러 페이지 묶음 요청의 응답 형식 (페이지별 IR 배열)
+_BATCHED_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "batched_document_ir",
+        "schema": {
+            "type": "object",
+            "properties": {"pages": {"type": "array", "items": IR_SCHEMA}},
+            "required": ["pages"],
+        },
+        "strict": True,
+    },
+}
+
+# 페이지 OCR 프롬프트
+_PROMPT = """이 문서 이미지를 분석하여 모든 내용을 추출하세요.
+
+반드시 아래 JSON 형식으로만 응답하세요:
+{
+  "blocks": [
+    {"type": "heading", "text": "제목 텍스트", "level": 1},
+    {"type": "paragraph", "text": "본문 텍스트"},
+    {"type": "table", "rows": [["셀1", "셀2"], ["셀3", "셀4"]]}
+  ]
+}
+
+규칙:
+- type은 "paragraph", "table", "heading" 중 하나
+- heading은 level 포함 (1=큰제목, 2=중제목, 3=소제목)
+- table은 rows에 2차원 배열로 셀 내용
+- 문서 순서대로 추출
+- JSON만 반환, 다른 텍스트 없이"""
+
+# 여러 페이지 묶음 요청 프롬프트
+_BATCH_PROMPT = """여러 문서 페이지 이미지가 순서대로 주어집니다.
+각 페이지를 따로 분석하여 모든 내용을 추출하세요.
+
+반드시 아래 JSON 형식으로만 응답하세요 (pages에 이미지 순서대로 페이지마다 하나씩):
+{
+  "pages": [
+    {"blocks": [{"type": "heading", "text": "제목 텍스트", "level": 1}]},
+    {"blocks": [{"type": "paragraph", "text": "본문 텍스트"}]}
+  ]
+}
+
+규칙:
+- 각 페이지의 blocks 규칙은 단일 페이지와 같음 (paragraph/table/heading, heading은 level 포함,
+  table은 rows에 2차원 배열)
+- 페이지 내용을 다른 페이지와 합치거나 나누지 않음
+- JSON만 반환, 다른 텍스트 없이"""
+
 
-class OpenRouterOCR(OCRBackend):
+class OpenRouterOCR(VisionHttpMixin, OCRBackend):
     """OpenRouter API 기반 OCR 백엔드
 
     다양한 Vision LLM 모델을 지원하며 structured output으로 IR 형식을 직접 반환합니다.
@@ -71,12 +163,30 @@ class OpenRouterOCR(OCRBackend):
         api_key: Optional[str] = None,
         model: Optional[str] = None,
         base_url: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        image_format: Literal["jpeg", "png"] = "jpeg",
+        dpi: int = 150,
+        cache_dir: Optional[Union[str, Path]] = None,
+        force_refresh: bool = False,
+        structured_output: Optional[bool] = None,
+        batch_size: int = 1,
     ):
         """
         Args:
             api_key: OpenRouter API 키 (없으면 OPENROUTER_API_KEY 환경변수 사용)
             model: 모델명 (없으면 gemini-flash 사용)
             base_url: API URL (기본: https://openrouter.ai/api/v1)
+            max_concurrency: 동시에 보낼 페이지 API 요청 수 상한
+                (없으면 OPENROUTER_MAX_CONCURRENCY 환경변수, 기본 8)
+            image_format: 페이지 이미지 형식 (jpeg: 빠르고 작음, png: 무손실)
+            dpi: 페이지 렌더링 해상도 (작은 글씨 인식이 부족하면 높임)
+            cache_dir: 페이지별 결과 캐시 디렉터리 (없으면 PDF2HWPX_OPENROUTER_CACHE 환경변수,
+                둘 다 없으면 캐시 사용 안 함)
+            force_refresh: 캐시를 읽지 않고 항상 API를 호출 (결과는 캐시에 다시 저장)
+            structured_output: response_format(JSON Schema) 사용 여부
+                (없으면 _STRUCTURED_OUTPUT_MODELS에 등록된 모델만 사용)
+            batch_size: 한 요청에 여러 이미지로 묶어 보낼 페이지 수 (단순한 페이지가 많은 문서에서
+                왕복 횟수 감소, 응답이 페이지 수와 맞지 않으면 그 묶음은 페이지별로 다시 요청)
         """
         self.api_key = api_key or os.getenv("OPENROUTER_API_KEY")
         if not self.api_key:
@@ -88,119 +198,253 @@ class OpenRouterOCR(OCRBackend):
         else:
             self.model = model or self.MODELS["gemini-flash"]
 
-        self.base_url = base_url or "https://openrouter.ai/api/v1"
+        # Structured output 지원 모델은 response_format 사용
+        # (페이지마다 모델명 검사하지 않도록 미리 판단)
+        if structured_output is None:
+            structured_output = self.model in _STRUCTURED_OUTPUT_MODELS
+        self._supports_structured = structured_output
 
-    def process(self, pdf_path: Path) -> OCRResult:
-        """PDF 파일에서 OCR 수행"""
-        with open(pdf_path, "rb") as f:
-            return self.process_bytes(f.read())
+        self.base_url = base_url or "https://openrouter.ai/api/v1"
+        max_concurrency = max_concurrency or int(os.getenv("OPENROUTER_MAX_CONCURRENCY", "8"))
+        self.max_concurrency = max(1, max_concurrency)
+        self.batch_size = max(1, batch_size)
+
+        if image_format not in IMAGE_MIME_TYPES:
+            raise ValueError(f"Unsupported image_format: {image_format}")
+        self.image_format = image_format
+        self.dpi = dpi
+
+        # 결과 캐시 - 같은 페이지 이미지/모델/프롬프트 버전/렌더링 설정이면 API 호출 생략
+        cache_dir = cache_dir or os.getenv("PDF2HWPX_OPENROUTER_CACHE")
+        self._cache = None
+        if cache_dir:
+            namespace = f"{self.model}|{PROMPT_VERSION}|{self.dpi}|{self.image_format}"
+            self._cache = PageCache(cache_dir, namespace)
+        self.force_refresh = force_refresh
+
+        # 페이지마다 새로 연결하지 않도록 클라이언트를 재사용
+        # (동시 요청 수만큼 keep-alive 연결 유지)
+        self._client = httpx.Client(
+            timeout=_TIMEOUT,
+            limits=httpx.Limits(
+                max_keepalive_connections=self.max_concurrency,
+                max_connections=self.max_concurrency,
+            ),
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "HTTP-Referer": "https://github.com/room821/pdf2hwpx",
+            },
+        )
 
     def process_bytes(self, pdf_bytes: bytes) -> OCRResult:
-        """PDF 바이트에서 OCR 수행"""
-        images = convert_from_bytes(pdf_bytes, dpi=200)
+        """PDF 바이트에서 OCR 수행
 
-        pages = []
-        for page_num, image in enumerate(images, start=1):
-            # 이미지를 base64로 인코딩
-            img_byte_arr = io.BytesIO()
-            image.save(img_byte_arr, format='PNG')
-            img_base64 = base64.b64encode(img_byte_arr.getvalue()).decode('utf-8')
+        페이지를 PyMuPDF로 하나씩 렌더링하면서 API 요청(batch_size 페이지씩)은
+        최대 max_concurrency개까지 동시에 보냅니다.
+        렌더링이 앞서 나가도 메모리에 남은 페이지 이미지는 (요청 중인 것 포함)
+        요청 max_concurrency의 2배 분량을 넘지 않습니다.
+        끝내 실패한 묶음이 생기면 나머지 페이지는 렌더링/요청하지 않고 그 예외를 전달합니다.
+        """
+        matrix = fitz.Matrix(self.dpi / 72, self.dpi / 72)
+        slots = threading.BoundedSemaphore(self.max_concurrency * 2 * self.batch_size)
+        failed = threading.Event()
+        futures = []  # 묶음별 future (결과는 페이지 순서대로의 PageResult 목록)
+        batch = []  # 아직 보내지 않은 묶음: _process_page 인자
+
+        def on_done(future, count):
+            # 대기 중인 렌더링 루프가 깨어나기 전에 실패를 먼저 기록
+            if not future.cancelled() and future.exception() is not None:
+                failed.set()
+            slots.release(count)
+
+        def submit_batch():
+            future = pool.submit(self._process_batch, list(batch))
+            future.add_done_callback(partial(on_done, count=len(batch)))
+            futures.append(future)
+            batch.clear()
+
+        with fitz.open(stream=pdf_bytes, filetype="pdf") as doc, ThreadPoolExecutor(
+            max_workers=self.max_concurrency
+        ) as pool:
+            for page_num, pdf_page in enumerate(doc, start=1):
+                slots.acquire()
+                if failed.is_set():
+                    # 결과가 어차피 버려지므로 아직 시작하지 않은 요청은 보내지 않음
+                    pool.shutdown(cancel_futures=True)
+                    break
+                # 페이지를 하나씩 렌더링해 설정된 형식으로 인코딩
+                # (외부 명령 없이 프로세스 안에서 처리)
+                pix = pdf_page.get_pixmap(matrix=matrix, alpha=False)
+                batch.append((self._encode_page(pix), page_num, pix.width, pix.height))
+                if len(batch) == self.batch_size:
+                    submit_batch()
+
+            if batch and not failed.is_set():
+                submit_batch()
+
+        # 페이지 순서대로 수집 (실패한 페이지가 있으면 그 예외를 그대로 전달)
+        pages = [page for future in futures for page in future.result()]
+        return OCRResult(pages=pages, metadata={"model": self.model})
 
-            # Vision API 호출
-            ir_data = self._call_vision_api(img_base64, image.width, image.height)
+    def _process_page(self, img_bytes: bytes, page_num: int, width: int, height: int) -> PageResult:
+        """페이지 이미지 하나를 OCR하여 PageResult로 변환 (작업 스레드에서 실행)"""
+        cache_key = self._cache.key(img_bytes) if self._cache is not None else None
+        ir_data = self._cached_ir(cache_key)
 
-            # IR을 PageResult로 변환
-            page = self._ir_to_page_result(ir_data, page_num, image.width, image.height)
-            pages.append(page)
+        if ir_data is None:
+            # 이미지를 base64로 인코딩해 Vision API 호출
+            img_base64 = base64.b64encode(img_bytes).decode("ascii")
+            ir_data = self._call_vision_api(img_base64, width, height, cache_key)
 
-        return OCRResult(pages=pages, metadata={"model": self.model})
+        # IR을 PageResult로 변환
+        return self._ir_to_page_result(ir_data, page_num, width, height)
 
-    def _call_vision_api(self, img_base64: str, width: int, height: int) -> Dict[str, Any]:
-        """OpenRouter Vision API 호출"""
+    def _process_batch(self, batch: List[tuple]) -> List[PageResult]:
+        """_process_page 인자 묶음을 한 번의 요청으로 OCR (작업 스레드에서 실행)
 
-        prompt = """이 문서 이미지를 분석하여 모든 내용을 추출하세요.
+        캐시에 있는 페이지는 요청에서 빼고,
+        묶음 응답이 페이지 수와 맞지 않으면 페이지별 요청으로 대체합니다.
+        """
+        if len(batch) == 1:
+            return [self._process_page(*batch[0])]
+
+        cache_keys = [
+            self._cache.key(img_bytes) if self._cache is not None else None
+            for img_bytes, *_ in batch
+        ]
+        irs = [self._cached_ir(cache_key) for cache_key in cache_keys]
+        missing = [index for index, ir_data in enumerate(irs) if ir_data is None]
+
+        if len(missing) > 1:
+            batch_irs = self._call_vision_api_batch([batch[index][0] for index in missing])
+            if batch_irs is not None:
+                for index, ir_data in zip(missing, batch_irs):
+                    if cache_keys[index] is not None:
+                        self._cache.put(cache_keys[index], ir_data)
+                    irs[index] = ir_data
+
+        return [
+            self._ir_to_page_result(ir_data, page_num, width, height)
+            if ir_data is not None
+            else self._process_page(img_bytes, page_num, width, height)
+            for ir_data, (img_bytes, page_num, width, height) in zip(irs, batch)
+        ]
+
+    def _cached_ir(self, cache_key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """캐시된 IR (캐시를 쓰지 않거나 force_refresh면 None)"""
+        if cache_key is None or self.force_refresh:
+            return None
+        return self._cache.get(cache_key)
+
+    def _call_vision_api(
+        self, img_base64: str, width: int, height: int, cache_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """OpenRouter Vision API 호출 (cache_key가 있으면 JSON으로 파싱된 결과를 캐시에 저장)"""
+        content = self._request_content(
+            [{"type": "text", "text": _PROMPT}, self._image_content(img_base64)],
+            max_tokens=_PAGE_MAX_TOKENS,
+            response_format=_STRUCTURED_RESPONSE_FORMAT,
+        )
+        ir_data = self._parse_json_response(content)
+        if ir_data is None:
+            # JSON이 아니면 응답 전체를 문단 하나로 처리 (캐시에 저장하지 않음)
+            return {"blocks": [{"type": "paragraph", "text": content}]}
 
-반드시 아래 JSON 형식으로만 응답하세요:
-{
-  "blocks": [
-    {"type": "heading", "text": "제목 텍스트", "level": 1},
-    {"type": "paragraph", "text": "본문 텍스트"},
-    {"type": "table", "rows": [["셀1", "셀2"], ["셀3", "셀4"]]}
-  ]
-}
+        if cache_key is not None:
+            self._cache.put(cache_key, ir_data)
+        return ir_data
 
-규칙:
-- type은 "paragraph", "table", "heading" 중 하나
-- heading은 level 포함 (1=큰제목, 2=중제목, 3=소제목)
-- table은 rows에 2차원 배열로 셀 내용
-- 문서 순서대로 추출
-- JSON만 반환, 다른 텍스트 없이"""
+    def _call_vision_api_batch(self, images: List[bytes]) -> Optional[List[Dict[str, Any]]]:
+        """여러 페이지 이미지를 한 요청으로 OCR
 
+        페이지 수만큼의 IR을 받지 못하거나 요청이 거절(4xx)되면 None
+        """
+        message_content = [{"type": "text", "text": _BATCH_PROMPT}]
+        for index, img_bytes in enumerate(images, start=1):
+            message_content.append({"type": "text", "text": f"{index}페이지:"})
+            message_content.append(
+                self._image_content(base64.b64encode(img_bytes).decode("ascii"))
+            )
+
+        max_tokens = min(
+            _PAGE_MAX_TOKENS * len(images),
+            _MODEL_MAX_OUTPUT_TOKENS.get(self.model, _PAGE_MAX_TOKENS),
+        )
+        try:
+            content = self._request_content(
+                message_content,
+                max_tokens=max_tokens,
+                response_format=_BATCHED_RESPONSE_FORMAT,
+            )
+        except httpx.HTTPStatusError as e:
+            # 묶음 요청 자체가 거절(4xx)되면 페이지별 요청으로 대체
+            # (재시도 대상 오류는 post_json이 이미 재시도했으므로 그대로 전달)
+            if e.response.status_code in RETRYABLE_STATUS or e.response.status_code >= 500:
+                raise
+            return None
+        result = self._parse_json_response(content)
+        pages = result.get("pages") if isinstance(result, dict) else None
+        if (
+            not isinstance(pages, list)
+            or len(pages) != len(images)
+            or not all(isinstance(page, dict) for page in pages)
+        ):
+            return None
+        return pages
+
+    def _image_content(self, img_base64: str) -> Dict[str, Any]:
+        """base64 이미지를 메시지 content 항목으로 변환"""
+        image_url = f"data:{IMAGE_MIME_TYPES[self.image_format]};base64,{img_base64}"
+        return {"type": "image_url", "image_url": {"url": image_url}}
+
+    def _request_content(
+        self,
+        message_content: List[Dict[str, Any]],
+        max_tokens: int,
+        response_format: Dict[str, Any],
+    ) -> str:
+        """chat/completions 요청 후 응답 메시지 텍스트 반환
+
+        response_format은 structured output 지원 모델에만 사용합니다.
+        """
         payload = {
             "model": self.model,
-            "messages": [
-                {
-                    "role": "user",
-                    "content": [
-                        {"type": "text", "text": prompt},
-                        {
-                            "type": "image_url",
-                            "image_url": {
-                                "url": f"data:image/png;base64,{img_base64}"
-                            }
-                        }
-                    ]
-                }
-            ],
-            "max_tokens": 8192,
+            "messages": [{"role": "user", "content": message_content}],
+            "max_tokens": max_tokens,
             "temperature": 0.1,
         }
 
-        # Structured output 지원 모델은 response_format 사용
-        if "gemini" in self.model or "gpt-4" in self.model:
-            payload["response_format"] = {
-                "type": "json_schema",
-                "json_schema": {
-                    "name": "document_ir",
-                    "schema": IR_SCHEMA,
-                    "strict": True,
-                }
-            }
+        if self._supports_structured:
+            payload["response_format"] = response_format
 
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": "https://github.com/room821/pdf2hwpx",
-        }
-
-        with httpx.Client(timeout=180.0) as client:
-            response = client.post(
-                f"{self.base_url}/chat/completions",
-                json=payload,
-                headers=headers,
-            )
-            response.raise_for_status()
-            data = response.json()
+        response = post_json(self._client, f"{self.base_url}/chat/completions", payload)
+        response.raise_for_status()
+        data = loads(response.content)
+        return data["choices"][0]["message"]["content"]
 
-        content = data["choices"][0]["message"]["content"]
-        return self._parse_json_response(content)
+    def _parse_json_response(self, content: str) -> Optional[Dict[str, Any]]:
+        """JSON 응답 파싱 (코드블록 제거, JSON이 아니면 None)"""
+        # 대부분 JSON만 오므로 먼저 그대로 파싱
+        if content.lstrip().startswith("{"):
+            try:
+                return loads(content)
+            except json.JSONDecodeError:
+                pass
 
-    def _parse_json_response(self, content: str) -> Dict[str, Any]:
-        """JSON 응답 파싱 (코드블록 제거)"""
         # ```json ... ``` 제거
-        json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', content, re.DOTALL)
+        json_match = JSON_FENCE_RE.search(content)
         if json_match:
             content = json_match.group(1)
         else:
             # 중괄호 추출
-            json_match = re.search(r'\{.*\}', content, re.DOTALL)
+            json_match = JSON_BRACE_RE.search(content)
             if json_match:
                 content = json_match.group(0)
 
         try:
-            return json.loads(content)
+            return loads(content)
         except json.JSONDecodeError:
-            return {"blocks": [{"type": "paragraph", "text": content}]}
+            return None
 
     def _ir_to_page_result(self, ir_data: Dict, page_num: int, width: int, height: int) -> PageResult:
         """IR 데이터를 PageResult로 변환"""
@@ -251,19 +495,18 @@ class OpenRouterOCR(OCRBackend):
 
     def _create_table(self, rows: List[List[str]], y_pos: float, page_width: int) -> Table:
         """테이블 생성"""
-        cells: List[TableCell] = []
-
-        for row_idx, row_data in enumerate(rows):
-            for col_idx, cell_text in enumerate(row_data):
-                cells.append(
-                    TableCell(
-                        text=str(cell_text) if cell_text else "",
-                        row=row_idx,
-                        col=col_idx,
-                        rowspan=1,
-                        colspan=1,
-                    )
-                )
+        # 빈 셀도 유지 (표 작성기는 있는 셀만 <hp:tc>로 출력하므로 격자가 빠짐없이 채워져야 함)
+        cells = [
+            TableCell(
+                text=str(cell_text) if cell_text else "",
+                row=row_idx,
+                col=col_idx,
+                rowspan=1,
+                colspan=1,
+            )
+            for row_idx, row_data in enumerate(rows)
+            for col_idx, cell_text in enumerate(row_data)
+        ]
 
         num_cols = len(rows[0]) if rows else 1
 
@@ -276,3 +519,10 @@ class OpenRouterOCR(OCRBackend):
             height=len(rows) * 20.0,
             cells=cells,
         )
+
+
+# Structured output(response_format)을 지원하는 모델 ID
+_STRUCTURED_OUTPUT_MODELS = frozenset(
+    model_id for model_id in OpenRouterOCR.MODELS.values()
+    if model_id.startswith(("google/gemini", "openai/gpt-4"))
+)
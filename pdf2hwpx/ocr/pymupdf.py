@@ -1,14 +1,44 @@
 """PyMuPDF 기반 PDF 파싱 백엔드"""
 
 import io
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
 
 import fitz  # PyMuPDF
 
 from pdf2hwpx.ocr.base import OCRBackend, OCRResult, PageResult, TextBlock, Table, TableCell
 
 
+# 이 페이지 수를 넘는 문서만 프로세스 풀로 나눠 처리 (작은 문서는 프로세스 기동 비용이 더 큼)
+_PARALLEL_PAGE_THRESHOLD = 50
+
+# 결과에 옮겨 담을 PDF 메타데이터 키
+_METADATA_KEYS = (
+    "title", "author", "subject", "creator", "producer", "creationDate", "modDate",
+)
+
+
+def _open_document(source: Union[str, bytes]) -> fitz.Document:
+    """파일 경로 또는 PDF 바이트로 문서 열기"""
+    if isinstance(source, bytes):
+        return fitz.open(stream=source, filetype="pdf")
+    return fitz.open(source)
+
+
+def _process_page_range(
+    backend: "PyMuPDFBackend", source: Union[str, bytes], start: int, stop: int
+) -> List[PageResult]:
+    """프로세스 풀 작업자: 문서를 직접 열어 [start, stop) 페이지 처리"""
+    doc = _open_document(source)
+    image_cache: Dict[int, bytes] = {}
+    try:
+        return [backend._process_page(doc[i], i + 1, image_cache) for i in range(start, stop)]
+    finally:
+        doc.close()
+
+
 class PyMuPDFBackend(OCRBackend):
     """PyMuPDF 기반 PDF 직접 파싱 (OCR 없이 텍스트 추출)
 
@@ -16,48 +46,87 @@ class PyMuPDFBackend(OCRBackend):
     스캔된 이미지 PDF는 텍스트 추출 불가.
     """
 
-    def __init__(self, extract_images: bool = True):
+    def __init__(
+        self,
+        extract_images: bool = True,
+        detailed_spans: bool = False,
+        parallel: bool = False,
+        max_workers: Optional[int] = None,
+    ):
         """
         Args:
             extract_images: 이미지 추출 여부
+            detailed_spans: 라인/스팬 단위 사전(dict) 추출 경로 사용 여부 (느림)
+            parallel: 큰 문서를 페이지 구간별로 나눠 프로세스 풀에서 처리할지 여부
+                (이미 프로세스 풀에서 변환하는 MCP 서버 등에서는 작업자 수가 곱해지므로 기본 꺼짐)
+            max_workers: 프로세스 풀 작업자 수 (기본: CPU 수)
         """
         self.extract_images = extract_images
+        self.detailed_spans = detailed_spans
+        self.parallel = parallel
+        self.max_workers = max_workers
 
     def process(self, pdf_path: Path) -> OCRResult:
         """PDF 파일에서 텍스트/테이블/이미지 추출"""
         doc = fitz.open(pdf_path)
-        return self._process_document(doc)
+        return self._process_document(doc, str(pdf_path))
 
     def process_bytes(self, pdf_bytes: bytes) -> OCRResult:
         """PDF 바이트에서 텍스트/테이블/이미지 추출"""
         doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-        return self._process_document(doc)
+        return self._process_document(doc, pdf_bytes)
 
-    def _process_document(self, doc: fitz.Document) -> OCRResult:
+    def _process_document(
+        self, doc: fitz.Document, source: Optional[Union[str, bytes]] = None
+    ) -> OCRResult:
         """문서 처리"""
-        pages = []
-
-        for page_num in range(len(doc)):
-            page = doc[page_num]
-            page_result = self._process_page(page, page_num + 1)
-            pages.append(page_result)
+        page_count = len(doc)
+        workers = min(self.max_workers or os.cpu_count() or 1, page_count)
+
+        if (
+            self.parallel
+            and source is not None
+            and page_count > _PARALLEL_PAGE_THRESHOLD
+            and workers > 1
+        ):
+            pages = self._process_pages_parallel(source, page_count, workers)
+        else:
+            # 로고/머리글처럼 여러 페이지가 공유하는 이미지는 문서당 한 번만 추출
+            image_cache: Dict[int, bytes] = {}
+            pages = [self._process_page(doc[i], i + 1, image_cache) for i in range(page_count)]
 
         # 메타데이터 추출
-        metadata = {
-            "title": doc.metadata.get("title", ""),
-            "author": doc.metadata.get("author", ""),
-            "subject": doc.metadata.get("subject", ""),
-            "creator": doc.metadata.get("creator", ""),
-            "producer": doc.metadata.get("producer", ""),
-            "creationDate": doc.metadata.get("creationDate", ""),
-            "modDate": doc.metadata.get("modDate", ""),
-            "page_count": len(doc),
-        }
+        # doc.metadata는 접근할 때마다 새로 만들어지는 속성이라 한 번만 읽음
+        doc_metadata = doc.metadata or {}
+        metadata = {key: doc_metadata.get(key, "") for key in _METADATA_KEYS}
+        metadata["page_count"] = page_count
 
         doc.close()
         return OCRResult(pages=pages, metadata=metadata)
 
-    def _process_page(self, page: fitz.Page, page_num: int) -> PageResult:
+    def _process_pages_parallel(
+        self, source: Union[str, bytes], page_count: int, workers: int
+    ) -> List[PageResult]:
+        """연속 페이지 구간을 작업자마다 하나씩 나눠 처리한 뒤 순서대로 병합"""
+        chunk = -(-page_count // workers)
+        ranges = [(start, min(start + chunk, page_count)) for start in range(0, page_count, chunk)]
+
+        with ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+            futures = [
+                pool.submit(_process_page_range, self, source, start, stop)
+                for start, stop in ranges
+            ]
+            pages = []
+            for future in futures:
+                pages.extend(future.result())
+        return pages
+
+    def _process_page(
+        self,
+        page: fitz.Page,
+        page_num: int,
+        image_cache: Optional[Dict[int, bytes]] = None,
+    ) -> PageResult:
         """페이지 처리"""
         rect = page.rect
         width = rect.width
@@ -72,7 +141,7 @@ class PyMuPDFBackend(OCRBackend):
         # 이미지 추출
         images = []
         if self.extract_images:
-            images = self._extract_images(page)
+            images = self._extract_images(page, image_cache)
 
         return PageResult(
             page_num=page_num,
@@ -85,6 +154,26 @@ class PyMuPDFBackend(OCRBackend):
 
     def _extract_text_blocks(self, page: fitz.Page) -> List[TextBlock]:
         """텍스트 블록 추출"""
+        if self.detailed_spans:
+            return self._extract_text_blocks_detailed(page)
+
+        # 블록 튜플 목록 (x0, y0, x1, y1, text, block_no, block_type) - C 레벨에서 한 번에 순회
+        raw = page.get_text("blocks", flags=fitz.TEXT_PRESERVE_WHITESPACE)
+        return [
+            TextBlock(
+                text=text.rstrip("\n"),
+                x=x0,
+                y=y0,
+                width=x1 - x0,
+                height=y1 - y0,
+                confidence=1.0,
+            )
+            for (x0, y0, x1, y1, text, _, block_type) in raw
+            if block_type == 0 and text.strip()  # 0 = 텍스트 블록
+        ]
+
+    def _extract_text_blocks_detailed(self, page: fitz.Page) -> List[TextBlock]:
+        """텍스트 블록 추출 (라인/스팬 사전 순회)"""
         blocks = []
 
         # 텍스트 사전 추출 (blocks 형태)
@@ -130,18 +219,18 @@ class PyMuPDFBackend(OCRBackend):
             tab_finder = page.find_tables()
 
             for tab in tab_finder.tables:
-                cells = []
                 data = tab.extract()
-
-                for row_idx, row in enumerate(data):
-                    for col_idx, cell_text in enumerate(row):
-                        cells.append(TableCell(
-                            text=str(cell_text) if cell_text else "",
-                            row=row_idx,
-                            col=col_idx,
-                            rowspan=1,
-                            colspan=1,
-                        ))
+                cells = [
+                    TableCell(
+                        text=str(cell_text) if cell_text else "",
+                        row=row_idx,
+                        col=col_idx,
+                        rowspan=1,
+                        colspan=1,
+                    )
+                    for row_idx, row in enumerate(data)
+                    for col_idx, cell_text in enumerate(row)
+                ]
 
                 bbox = tab.bbox
                 tables.append(Table(
@@ -159,19 +248,27 @@ class PyMuPDFBackend(OCRBackend):
 
         return tables
 
-    def _extract_images(self, page: fitz.Page) -> List[bytes]:
-        """이미지 추출"""
+    def _extract_images(
+        self, page: fitz.Page, image_cache: Optional[Dict[int, bytes]] = None
+    ) -> List[bytes]:
+        """이미지 추출 (image_cache: 문서 내 xref별 추출 결과)"""
         images = []
+        if image_cache is None:
+            image_cache = {}
 
         image_list = page.get_images(full=True)
 
         for img_info in image_list:
             xref = img_info[0]
-            try:
-                base_image = page.parent.extract_image(xref)
-                if base_image:
-                    images.append(base_image["image"])
-            except Exception:
-                continue
+            image = image_cache.get(xref)
+            if image is None:
+                try:
+                    base_image = page.parent.extract_image(xref)
+                except Exception:
+                    continue
+                if not base_image:
+                    continue
+                image = image_cache[xref] = base_image["image"]
+            images.append(image)
 
         return images
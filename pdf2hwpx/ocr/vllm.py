@@ -1,18 +1,36 @@
 """vLLM 서버 OCR 백엔드 - BBOX + OCR"""
 
 import base64
-import io
+import json
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Literal, Union
 
+import fitz  # PyMuPDF
 import httpx
-from pdf2image import convert_from_bytes
 
+from pdf2hwpx.ocr._vision_http import (
+    IMAGE_MIME_TYPES,
+    JSON_BRACE_RE,
+    JSON_FENCE_RE,
+    VisionHttpMixin,
+    loads,
+    post_json,
+)
 from pdf2hwpx.ocr.base import OCRBackend, OCRResult, PageResult, TextBlock, Table, TableCell
+from pdf2hwpx.ocr.cache import PageCache
 
 
-class VllmOCR(OCRBackend):
+# 프롬프트 버전 - 변경 시 올려서 이전 결과 캐시를 무효화
+PROMPT_VERSION = 1
+
+# API 요청 타임아웃 (페이지 OCR 응답 대기로 읽기는 길게, 연결은 짧게)
+_TIMEOUT = httpx.Timeout(120.0, connect=10.0)
+
+
+class VllmOCR(VisionHttpMixin, OCRBackend):
     """vLLM 서버 백엔드 (OpenAI-compatible API with Vision)"""
 
     def __init__(
@@ -20,39 +38,106 @@ class VllmOCR(OCRBackend):
         base_url: Optional[str] = None,
         api_key: Optional[str] = None,
         model: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        image_format: Literal["jpeg", "png"] = "jpeg",
+        dpi: int = 150,
+        cache_dir: Optional[Union[str, Path]] = None,
+        force_refresh: bool = False,
     ):
         self.base_url = base_url or os.getenv("VLLM_BASE_URL", "http://localhost:8000/v1")
         self.api_key = api_key or os.getenv("VLLM_API_KEY", "dummy")
         self.model = model or os.getenv("VLLM_MODEL", "gemini-2.5-flash-lite")
-
-    def process(self, pdf_path: Path) -> OCRResult:
-        """PDF 파일에서 OCR 수행"""
-        with open(pdf_path, "rb") as f:
-            return self.process_bytes(f.read())
+        # 동시에 보낼 페이지 API 요청 수 상한
+        max_concurrency = max_concurrency or int(os.getenv("VLLM_MAX_CONCURRENCY", "8"))
+        self.max_concurrency = max(1, max_concurrency)
+
+        if image_format not in IMAGE_MIME_TYPES:
+            raise ValueError(f"Unsupported image_format: {image_format}")
+        self.image_format = image_format
+        # 페이지 렌더링 해상도 (작은 글씨 인식이 부족하면 높임)
+        self.dpi = dpi
+
+        # 결과 캐시 - 같은 페이지 이미지/모델/프롬프트 버전/렌더링 설정이면 API 호출 생략
+        # (cache_dir이 없으면 PDF2HWPX_VLLM_CACHE 환경변수,
+        # force_refresh면 읽지 않고 다시 저장만 함)
+        cache_dir = cache_dir or os.getenv("PDF2HWPX_VLLM_CACHE")
+        self._cache = None
+        if cache_dir:
+            namespace = f"{self.model}|{PROMPT_VERSION}|{self.dpi}|{self.image_format}"
+            self._cache = PageCache(cache_dir, namespace)
+        self.force_refresh = force_refresh
+
+        # 페이지마다 새로 연결하지 않도록 클라이언트를 재사용
+        # (동시 요청 수만큼 keep-alive 연결 유지)
+        self._client = httpx.Client(
+            timeout=_TIMEOUT,
+            limits=httpx.Limits(
+                max_keepalive_connections=self.max_concurrency,
+                max_connections=self.max_concurrency,
+            ),
+            headers={"Authorization": f"Bearer {self.api_key}"},
+        )
 
     def process_bytes(self, pdf_bytes: bytes) -> OCRResult:
-        """PDF 바이트에서 OCR 수행"""
-        # 1. PDF를 페이지별 이미지로 변환
-        images = convert_from_bytes(pdf_bytes, dpi=200)
-
-        pages = []
-        for page_num, image in enumerate(images, start=1):
-            # 2. 이미지를 base64로 인코딩
-            img_byte_arr = io.BytesIO()
-            image.save(img_byte_arr, format='PNG')
-            img_base64 = base64.b64encode(img_byte_arr.getvalue()).decode('utf-8')
+        """PDF 바이트에서 OCR 수행
+
+        페이지를 PyMuPDF로 하나씩 렌더링하면서
+        API 요청은 최대 max_concurrency개까지 동시에 보냅니다.
+        렌더링이 앞서 나가도 메모리에 남은 페이지 이미지는 (요청 중인 것 포함)
+        max_concurrency의 2배를 넘지 않습니다.
+        끝내 실패한 페이지가 생기면 나머지 페이지는 렌더링/요청하지 않고 그 예외를 전달합니다.
+        """
+        matrix = fitz.Matrix(self.dpi / 72, self.dpi / 72)
+        slots = threading.BoundedSemaphore(self.max_concurrency * 2)
+        failed = threading.Event()
+        futures = []
+
+        def on_done(future):
+            # 대기 중인 렌더링 루프가 깨어나기 전에 실패를 먼저 기록
+            if not future.cancelled() and future.exception() is not None:
+                failed.set()
+            slots.release()
+
+        with fitz.open(stream=pdf_bytes, filetype="pdf") as doc, ThreadPoolExecutor(
+            max_workers=self.max_concurrency
+        ) as pool:
+            for page_num, pdf_page in enumerate(doc, start=1):
+                slots.acquire()
+                if failed.is_set():
+                    # 결과가 어차피 버려지므로 아직 시작하지 않은 요청은 보내지 않음
+                    pool.shutdown(cancel_futures=True)
+                    break
+                # 1. 페이지를 하나씩 렌더링해 설정된 형식으로 인코딩
+                #    (외부 명령 없이 프로세스 안에서 처리)
+                pix = pdf_page.get_pixmap(matrix=matrix, alpha=False)
+                img_bytes = self._encode_page(pix)
+                future = pool.submit(self._process_page, img_bytes, page_num, pix.width, pix.height)
+                future.add_done_callback(on_done)
+                futures.append(future)
+
+        # 페이지 순서대로 수집 (실패한 페이지가 있으면 그 예외를 그대로 전달)
+        pages = [future.result() for future in futures]
+        return OCRResult(pages=pages, metadata={})
 
-            # 3. vLLM Vision API 호출
-            ocr_data = self._call_vision_api(img_base64, image.width, image.height)
+    def _process_page(self, img_bytes: bytes, page_num: int, width: int, height: int) -> PageResult:
+        """페이지 이미지 하나를 OCR하여 PageResult로 변환 (작업 스레드에서 실행)"""
+        cache_key = self._cache.key(img_bytes) if self._cache is not None else None
+        ocr_data = None
+        if cache_key is not None and not self.force_refresh:
+            ocr_data = self._cache.get(cache_key)
 
-            # 4. OCR 결과를 PageResult로 변환
-            page = self._parse_ocr_result(ocr_data, page_num, image.width, image.height)
-            pages.append(page)
+        if ocr_data is None:
+            # 2. 이미지를 base64로 인코딩해 vLLM Vision API 호출
+            img_base64 = base64.b64encode(img_bytes).decode("ascii")
+            ocr_data = self._call_vision_api(img_base64, width, height, cache_key)
 
-        return OCRResult(pages=pages, metadata={})
+        # 3. OCR 결과를 PageResult로 변환
+        return self._parse_ocr_result(ocr_data, page_num, width, height)
 
-    def _call_vision_api(self, img_base64: str, width: int, height: int) -> Dict[str, Any]:
-        """vLLM Vision API 호출 (BBOX + OCR)"""
+    def _call_vision_api(
+        self, img_base64: str, width: int, height: int, cache_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """vLLM Vision API 호출 (BBOX + OCR, cache_key가 있으면 파싱된 결과를 캐시에 저장)"""
 
         # Vision OCR을 위한 프롬프트
         prompt = """Analyze this document image and extract all text elements with their bounding boxes.
@@ -75,6 +160,7 @@ Rules:
 - For tables, extract cell content in row-major order
 - Return valid JSON only, no markdown"""
 
+        image_url = f"data:{IMAGE_MIME_TYPES[self.image_format]};base64,{img_base64}"
         payload = {
             "model": self.model,
             "messages": [
@@ -85,7 +171,7 @@ Rules:
                         {
                             "type": "image_url",
                             "image_url": {
-                                "url": f"data:image/png;base64,{img_base64}"
+                                "url": image_url
                             }
                         }
                     ]
@@ -95,38 +181,38 @@ Rules:
             "temperature": 0.1,
         }
 
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
-
-        with httpx.Client(timeout=120.0) as client:
-            response = client.post(
-                f"{self.base_url}/chat/completions",
-                json=payload,
-                headers=headers,
-            )
-            response.raise_for_status()
-            data = response.json()
+        response = post_json(self._client, f"{self.base_url}/chat/completions", payload)
+        response.raise_for_status()
+        data = loads(response.content)
 
         # 응답 파싱
         content = data["choices"][0]["message"]["content"]
+        ocr_data = self._parse_json_response(content)
+
+        if cache_key is not None:
+            self._cache.put(cache_key, ocr_data)
+        return ocr_data
 
-        # JSON 파싱 (markdown 코드블록 제거)
-        import json
-        import re
+    def _parse_json_response(self, content: str) -> Dict[str, Any]:
+        """JSON 응답 파싱 (markdown 코드블록 제거)"""
+        # 대부분 JSON만 오므로 먼저 그대로 파싱
+        if content.lstrip().startswith("{"):
+            try:
+                return loads(content)
+            except json.JSONDecodeError:
+                pass
 
         # ```json ... ``` 제거
-        json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', content, re.DOTALL)
+        json_match = JSON_FENCE_RE.search(content)
         if json_match:
             content = json_match.group(1)
         else:
             # 중괄호 추출
-            json_match = re.search(r'\{.*\}', content, re.DOTALL)
+            json_match = JSON_BRACE_RE.search(content)
             if json_match:
                 content = json_match.group(0)
 
-        return json.loads(content)
+        return loads(content)
 
     def _parse_ocr_result(self, ocr_data: Dict, page_num: int, width: int, height: int) -> PageResult:
         """OCR 결과를 PageResult로 변환"""
@@ -171,19 +257,12 @@ Rules:
 
     def _parse_table(self, rows: List[List[str]], bbox: List, page_width: int, page_height: int) -> Table:
         """테이블 데이터 파싱"""
-        cells: List[TableCell] = []
-
-        for row_idx, row_data in enumerate(rows):
-            for col_idx, cell_text in enumerate(row_data):
-                cells.append(
-                    TableCell(
-                        text=str(cell_text),
-                        row=row_idx,
-                        col=col_idx,
-                        rowspan=1,
-                        colspan=1,
-                    )
-                )
+        # 빈 셀도 유지 (표 작성기는 있는 셀만 <hp:tc>로 출력하므로 격자가 빠짐없이 채워져야 함)
+        cells = [
+            TableCell(text=str(cell_text), row=row_idx, col=col_idx, rowspan=1, colspan=1)
+            for row_idx, row_data in enumerate(rows)
+            for col_idx, cell_text in enumerate(row_data)
+        ]
 
         x1, y1, x2, y2 = bbox if len(bbox) >= 4 else [0, 0, page_width, page_height]
 